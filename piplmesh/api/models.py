@@ -78,6 +78,9 @@ class UploadedFile(base.AuthoredDocument):
     filename = mongoengine.StringField(required=True)
     content_type = mongoengine.StringField()
 
+    # Filenames of resized variants of images, by variant name
+    variants = mongoengine.DictField()
+
 class ImageAttachment(Attachment):
     """
     This class defines document type for image attachments.
@@ -1,7 +1,28 @@
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from StringIO import StringIO
+
+from django.core.files import storage, uploadedfile
+
 from celery import task
 
+from PIL import Image
+
 from . import models
 
+# Maximum width and height of image variants
+IMAGE_VARIANTS = {
+    'thumbnail': (100, 100),
+    'feed': (500, 2000),
+}
+
+# Format used for variants of images in formats which cannot be written
+FALLBACK_IMAGE_FORMAT = 'PNG'
+
+# Larger images are not decoded, as that could take too much memory
+MAX_IMAGE_PIXELS = 50 * 1000 * 1000
+
 @task.task
 def process_notifications_on_new_comment(comment_pk, post_pk):
     post = models.Post.objects.get(pk=post_pk)
@@ -10,3 +31,93 @@ def process_notifications_on_new_comment(comment_pk, post_pk):
     for subscriber in post.subscribers:
         if subscriber != comment.author:
             models.Notification.objects.create(created_time=comment.created_time, recipient=subscriber, post=post, comment=comment_pk)
+
+@task.task
+def process_uploaded_file(uploaded_file_pk):
+    """
+    Checks content type of the uploaded file and if it is an image, creates
+    its resized variants. The image is read and decoded only once for all
+    variants, and only if it has at most ``MAX_IMAGE_PIXELS`` pixels.
+    """
+
+    try:
+        uploaded_file = models.UploadedFile.objects.get(pk=uploaded_file_pk)
+    except models.UploadedFile.DoesNotExist:
+        # File has been deleted before it was processed
+        return
+
+    try:
+        # Only the header is read here
+        image = Image.open(storage.default_storage.open_gridout(uploaded_file.filename))
+    except IOError:
+        # Not an image (or not an image format we know)
+        return
+
+    content_type = Image.MIME.get(image.format)
+    if content_type and content_type != uploaded_file.content_type:
+        models.UploadedFile.objects(pk=uploaded_file_pk).update(set__content_type=content_type, safe_update=True)
+
+    if image.size[0] * image.size[1] > MAX_IMAGE_PIXELS:
+        return
+
+    try:
+        image.load()
+    except IOError:
+        # Broken image
+        return
+
+    variants = {}
+    for variant in IMAGE_VARIANTS:
+        filename = create_image_variant(uploaded_file, image, variant)
+        if filename is not None:
+            variants['set__variants__%s' % variant] = filename
+
+    if variants:
+        models.UploadedFile.objects(pk=uploaded_file_pk).update(safe_update=True, **variants)
+
+def save_image(image, image_format):
+    """
+    Returns a tuple of image encoded in given format and the format used.
+    If image cannot be written in given format, it is written as PNG.
+
+    Raises ``IOError`` if image cannot be written at all.
+    """
+
+    output = StringIO()
+    try:
+        image.save(output, image_format)
+        return output.getvalue(), image_format
+    except (KeyError, IOError):
+        # PIL can read some formats it cannot write
+        pass
+
+    if image.mode not in ('1', 'L', 'P', 'RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+
+    output = StringIO()
+    image.save(output, FALLBACK_IMAGE_FORMAT)
+    return output.getvalue(), FALLBACK_IMAGE_FORMAT
+
+def create_image_variant(uploaded_file, image, variant):
+    """
+    Stores a resized image variant into the storage and returns its filename.
+    If the image is already small enough, the original filename is returned.
+    Returns ``None`` if variant cannot be created.
+    """
+
+    size = IMAGE_VARIANTS[variant]
+
+    if image.size[0] <= size[0] and image.size[1] <= size[1]:
+        return uploaded_file.filename
+
+    image_format = image.format
+    image = image.copy()
+    image.thumbnail(size, Image.ANTIALIAS)
+
+    try:
+        data, image_format = save_image(image, image_format)
+    except (KeyError, IOError):
+        return None
+
+    # We let storage decide a name
+    return storage.default_storage.save('', uploadedfile.SimpleUploadedFile(variant, data, content_type=Image.MIME.get(image_format)))
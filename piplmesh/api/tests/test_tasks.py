@@ -0,0 +1,91 @@
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from StringIO import StringIO
+
+from django.core.files import storage, uploadedfile
+from django.test import utils
+
+from PIL import Image
+
+from tastypie_mongoengine import test_runner
+
+from piplmesh.account import models as account_models
+from piplmesh.api import models, tasks
+
+@utils.override_settings(CELERY_ALWAYS_EAGER=True, CELERY_EAGER_PROPAGATES_EXCEPTIONS=True)
+class ImageVariantsTest(test_runner.MongoEngineTestCase):
+    def setUp(self):
+        self.user = account_models.User.create_user(username='test_user', password='foobar')
+
+    def upload_image(self, size, image_format):
+        output = StringIO()
+        Image.new('RGB', size, (255, 0, 0)).save(output, image_format)
+
+        filename = storage.default_storage.save('', uploadedfile.SimpleUploadedFile('image', output.getvalue(), content_type='application/octet-stream'))
+        return models.UploadedFile.objects.create(author=self.user, filename=filename, content_type='application/octet-stream')
+
+    def test_variants(self):
+        uploaded_file = self.upload_image((800, 600), 'JPEG')
+
+        tasks.process_uploaded_file.delay(uploaded_file.pk)
+
+        uploaded_file.reload()
+        self.assertEqual(uploaded_file.content_type, 'image/jpeg')
+        self.assertEqual(sorted(uploaded_file.variants.keys()), sorted(tasks.IMAGE_VARIANTS.keys()))
+
+        for variant, (width, height) in tasks.IMAGE_VARIANTS.items():
+            self.assertNotEqual(uploaded_file.variants[variant], uploaded_file.filename)
+            image = Image.open(storage.default_storage.open_gridout(uploaded_file.variants[variant]))
+            self.assertEqual(image.format, 'JPEG')
+            self.assertLessEqual(image.size[0], width)
+            self.assertLessEqual(image.size[1], height)
+
+    def test_small_image(self):
+        uploaded_file = self.upload_image((50, 50), 'PNG')
+
+        tasks.process_uploaded_file.delay(uploaded_file.pk)
+
+        # Original is used for all variants
+        uploaded_file.reload()
+        self.assertEqual(uploaded_file.variants, dict((variant, uploaded_file.filename) for variant in tasks.IMAGE_VARIANTS))
+
+    def test_not_image(self):
+        filename = storage.default_storage.save('', uploadedfile.SimpleUploadedFile('text', 'not an image', content_type='text/plain'))
+        uploaded_file = models.UploadedFile.objects.create(author=self.user, filename=filename, content_type='text/plain')
+
+        tasks.process_uploaded_file.delay(uploaded_file.pk)
+
+        uploaded_file.reload()
+        self.assertEqual(uploaded_file.content_type, 'text/plain')
+        self.assertEqual(uploaded_file.variants, {})
+
+    def test_large_image(self):
+        uploaded_file = self.upload_image((800, 600), 'PNG')
+
+        max_image_pixels = tasks.MAX_IMAGE_PIXELS
+        tasks.MAX_IMAGE_PIXELS = 800 * 600 - 1
+        self.addCleanup(setattr, tasks, 'MAX_IMAGE_PIXELS', max_image_pixels)
+
+        tasks.process_uploaded_file.delay(uploaded_file.pk)
+
+        # Image is recognized, but not decoded
+        uploaded_file.reload()
+        self.assertEqual(uploaded_file.content_type, 'image/png')
+        self.assertEqual(uploaded_file.variants, {})
+
+    def test_deleted_file(self):
+        uploaded_file = self.upload_image((800, 600), 'PNG')
+        uploaded_file.delete()
+
+        tasks.process_uploaded_file.delay(uploaded_file.pk)
+
+        self.assertEqual(models.UploadedFile.objects.count(), 0)
+
+    def test_unwritable_format(self):
+        image = Image.new('RGB', (10, 10))
+
+        # PIL cannot write PSD images, so PNG is used instead
+        data, image_format = tasks.save_image(image, 'PSD')
+        self.assertEqual(image_format, 'PNG')
+        self.assertEqual(Image.open(StringIO(data)).format, 'PNG')
@@ -0,0 +1,114 @@
+from django.core import urlresolvers
+from django.core.files import storage, uploadedfile
+from django.test import client, utils
+from django.utils import simplejson as json
+
+from tastypie_mongoengine import test_runner
+
+from piplmesh.account import models as account_models
+from piplmesh.api import models
+from piplmesh.frontend import views
+from piplmesh.utils import storage as storage_utils
+
+@utils.override_settings(CELERY_ALWAYS_EAGER=True, CELERY_EAGER_PROPAGATES_EXCEPTIONS=True)
+class UploadTest(test_runner.MongoEngineTestCase):
+    user_username = 'test_user'
+    user_password = 'foobar'
+
+    def setUp(self):
+        self.user = account_models.User.create_user(username=self.user_username, password=self.user_password)
+
+        self.client = client.Client()
+        self.assertTrue(self.client.login(username=self.user_username, password=self.user_password))
+
+    def count_files(self):
+        db, collection_name = storage.default_storage._get_gridfs_database()
+        return db[collection_name].files.count()
+
+    def upload(self, files, client=None):
+        return (client or self.client).post(urlresolvers.reverse('upload'), {'file': files})
+
+    def test_upload(self):
+        response = self.upload([uploadedfile.SimpleUploadedFile('test.txt', 'content', 'text/plain')])
+        self.assertEqual(response.status_code, 202)
+
+        response = json.loads(response.content)
+        self.assertEqual(len(response), 1)
+
+        uploaded_file = models.UploadedFile.objects.get(filename=response[0]['filename'])
+        self.assertEqual(uploaded_file.author, self.user)
+        self.assertEqual(storage.default_storage.open_gridout(uploaded_file.filename).read(), 'content')
+
+    def test_upload_many(self):
+        contents = ['content %d' % i for i in range(6)]
+        response = self.upload([uploadedfile.SimpleUploadedFile('test%d.txt' % i, content, 'text/plain') for i, content in enumerate(contents)])
+        self.assertEqual(response.status_code, 202)
+
+        # Files are listed in the order they were uploaded
+        response = json.loads(response.content)
+        self.assertEqual(len(response), len(contents))
+        self.assertEqual(models.UploadedFile.objects.count(), len(contents))
+
+        for content, uploaded in zip(contents, response):
+            pk = urlresolvers.resolve(uploaded['resource_uri']).kwargs['pk']
+            uploaded_file = models.UploadedFile.objects.get(pk=pk)
+            self.assertEqual(uploaded_file.filename, uploaded['filename'])
+            self.assertEqual(uploaded_file.author, self.user)
+            self.assertEqual(uploaded_file.content_type, 'text/plain')
+            self.assertEqual(storage.default_storage.open_gridout(uploaded_file.filename).read(), content)
+
+    def test_store_files(self):
+        stored_name = storage.default_storage.save('', uploadedfile.SimpleUploadedFile('stored.txt', 'stored content', 'text/plain'))
+        files = [
+            uploadedfile.SimpleUploadedFile('test1.txt', 'content 1', 'text/plain'),
+            storage_utils.GridFSUploadedFile(storage.default_storage, stored_name, 'stored.txt', 'text/plain', 14, None),
+            uploadedfile.SimpleUploadedFile('test2.txt', 'content 2', 'text/plain'),
+            uploadedfile.SimpleUploadedFile('test3.txt', 'content 3', 'text/plain'),
+        ]
+
+        filenames = views.store_files(files)
+
+        # Already stored file is not stored again, others are stored concurrently, but names keep their order
+        self.assertEqual(len(filenames), 4)
+        self.assertEqual(filenames[1], stored_name)
+        self.assertEqual(len(set(filenames)), 4)
+        for filename, content in zip(filenames, ('content 1', 'stored content', 'content 2', 'content 3')):
+            self.assertEqual(storage.default_storage.open_gridout(filename).read(), content)
+
+        filenames = views.store_files([uploadedfile.SimpleUploadedFile('test4.txt', 'content 4', 'text/plain')])
+        self.assertEqual(storage.default_storage.open_gridout(filenames[0]).read(), 'content 4')
+
+        self.assertEqual(views.store_files([]), [])
+
+    @utils.override_settings(GRIDFS_UPLOAD_MAX_SIZE=10)
+    def test_size_exceeded(self):
+        files = self.count_files()
+
+        response = self.upload([
+            uploadedfile.SimpleUploadedFile('test1.txt', 'content', 'text/plain'),
+            uploadedfile.SimpleUploadedFile('test2.txt', 'too large content', 'text/plain'),
+        ])
+        self.assertEqual(response.status_code, 413)
+
+        # File stored before the limit was exceeded is removed, too
+        self.assertEqual(self.count_files(), files)
+        self.assertEqual(models.UploadedFile.objects.count(), 0)
+
+    def test_csrf_failure(self):
+        csrf_client = client.Client(enforce_csrf_checks=True)
+        self.assertTrue(csrf_client.login(username=self.user_username, password=self.user_password))
+
+        files = self.count_files()
+
+        response = self.upload([
+            uploadedfile.SimpleUploadedFile('test1.txt', 'content 1', 'text/plain'),
+            uploadedfile.SimpleUploadedFile('test2.txt', 'content 2', 'text/plain'),
+        ], csrf_client)
+        self.assertEqual(response.status_code, 403)
+
+        # Files have been stored while request was parsed, but they are not kept
+        self.assertEqual(self.count_files(), files)
+        self.assertEqual(models.UploadedFile.objects.count(), 0)
+
+    def test_get(self):
+        self.assertEqual(self.client.get(urlresolvers.reverse('upload')).status_code, 400)
@@ -1,13 +1,68 @@
+import datetime
+
 from django import http
 from django.conf import settings
 from django.core import urlresolvers
+from django.utils import timezone
 
 from piplmesh import nodes
+from piplmesh.nodes import models as nodes_models
+from piplmesh.utils import cache
+
+DEFAULT_NODES_CACHE_TIMEOUT = 60 # seconds
+DEFAULT_NODES_CACHE_MAX_ENTRIES = 10000
 
 class NodesMiddleware(object):
+    """
+    Sets ``request.node`` and redirects requests for which node could not be
+    determined to the outside page.
+
+    Resolved nodes are cached in the process for ``NODES_CACHE_TIMEOUT`` seconds,
+    keyed by the session and client address. A cached node is used as long as
+    nodes session state does not change, so that nodes backends are not queried
+    for every request. Nodes which :func:`piplmesh.nodes.get_node` has not stored
+    into the session are not cached.
+    """
+
+    def __init__(self):
+        self.nodes_cache = cache.LocalCache(
+            getattr(settings, 'NODES_CACHE_MAX_ENTRIES', DEFAULT_NODES_CACHE_MAX_ENTRIES),
+            getattr(settings, 'NODES_CACHE_TIMEOUT', DEFAULT_NODES_CACHE_TIMEOUT),
+        )
+
+    def get_node(self, request):
+        session_key = request.session.session_key
+        if not session_key or self.nodes_cache.timeout <= 0:
+            return nodes.get_node(request)
+
+        key = (session_key, request.META.get('REMOTE_ADDR'), request.META.get('HTTP_X_FORWARDED_FOR'))
+        cached = self.nodes_cache.get(key)
+        if cached is not None:
+            session_state, backend_name, node_id, node_data, outside_request = cached
+            if session_state == nodes.get_session_state(request):
+                try:
+                    node = nodes_models.Node(node_id, node_data, nodes.get_backend(backend_name))
+                    node._outside_request = outside_request
+                    return node
+                except KeyError:
+                    # Backend is not configured anymore
+                    pass
+
+        node = nodes.get_node(request)
+
+        if node is None or nodes.SESSION_KEY not in request.session:
+            # Node not stored into the session (because not all nodes backends
+            # answered) is not cached either, so that it is resolved again
+            self.nodes_cache.delete(key)
+        else:
+            # Session state is read after resolution, as it might have been updated
+            self.nodes_cache.set(key, (nodes.get_session_state(request), node.backend.get_full_name(), node.id, node.data, node.is_outside_request()), timezone.now() + datetime.timedelta(seconds=self.nodes_cache.timeout))
+
+        return node
+
     def process_request(self, request):
         outside_url = urlresolvers.reverse('outside')
-        request.node = nodes.get_node(request)
+        request.node = self.get_node(request)
 
         if request.path == outside_url:
             if request.node is None:
@@ -1,4 +1,5 @@
-import traceback
+import threading, traceback
+from multiprocessing import pool
 
 from django import dispatch, http, template
 from django.conf import settings
@@ -10,6 +11,7 @@ from django.test import client
 from django.utils import simplejson
 from django.utils.translation import ugettext_lazy as _
 from django.views import generic as generic_views
+from django.views.decorators import csrf
 
 from mongoengine import signals as mongoengine_signals
 
@@ -22,8 +24,12 @@ from pushserver.utils import updates
 from piplmesh import nodes
 from piplmesh.nodes import models as nodes_models
 from piplmesh.account import models as account_models
-from piplmesh.api import models as api_models, resources, signals
+from piplmesh.api import models as api_models, resources, signals, tasks as api_tasks
 from piplmesh.frontend import forms, tasks
+from piplmesh.utils import storage as storage_utils, uploadhandler
+
+# Maximum number of files stored into the storage concurrently
+UPLOAD_THREADS = 4
 
 class HomeView(generic_views.TemplateView):
     template_name = 'home.html'
@@ -95,32 +101,103 @@ class LocationView(generic_views.FormView):
             return super(LocationView, self).dispatch(request, *args, **kwargs)
         raise exceptions.PermissionDenied
 
+_upload_pool = None
+_upload_pool_lock = threading.Lock()
+
+def _get_upload_pool():
+    global _upload_pool
+
+    if _upload_pool is None:
+        with _upload_pool_lock:
+            if _upload_pool is None:
+                _upload_pool = pool.ThreadPool(UPLOAD_THREADS)
+
+    return _upload_pool
+
+def store_files(files):
+    """
+    Stores files into the default storage and returns their names.
+
+    Files which have been already stored while being uploaded are not stored
+    again, other files are stored concurrently.
+    """
+
+    filenames = [file.stored_name if isinstance(file, storage_utils.GridFSUploadedFile) else None for file in files]
+    pending = [i for i, filename in enumerate(filenames) if filename is None]
+
+    # We let storage decide names
+    if len(pending) == 1:
+        stored_names = [storage.default_storage.save('', files[pending[0]])]
+    elif pending:
+        stored_names = _get_upload_pool().map(lambda i: storage.default_storage.save('', files[i]), pending)
+    else:
+        stored_names = []
+
+    for i, stored_name in zip(pending, stored_names):
+        filenames[i] = stored_name
+
+    return filenames
+
+@csrf.csrf_exempt
 def upload_view(request):
+    """
+    Streams uploaded files directly into the storage while request is being
+    parsed. Upload handler has to be installed before CSRF protection reads
+    the request, so CSRF is checked by :func:`_upload_view` instead. Stored
+    files which are not persisted by it (for example, because request has
+    been rejected) are deleted.
+    """
+
     if request.method != 'POST':
         return http.HttpResponseBadRequest()
 
+    handler = uploadhandler.GridFSUploadHandler(request)
+    request.upload_handlers.insert(0, handler)
+    try:
+        return _upload_view(request, handler)
+    finally:
+        handler.delete_unpersisted()
+
+@csrf.csrf_protect
+def _upload_view(request, handler):
     resource = resources.UploadedFileResource()
 
     # TODO: Provide some user feedback while uploading
 
+    files = [file for field, field_files in request.FILES.iterlists() for file in field_files]
+
+    if handler.size_exceeded:
+        return http.HttpResponse(status=413)
+
+    if not files:
+        return resource.create_response(request, [], response_class=tastypie_http.HttpAccepted)
+
+    filenames = store_files(files)
+
+    documents = []
+    for file, filename in zip(files, filenames):
+        uploaded_file = api_models.UploadedFile()
+        uploaded_file.author = request.user
+        uploaded_file.filename = filename
+        uploaded_file.content_type = file.content_type
+        uploaded_file.validate()
+        documents.append(uploaded_file)
+
+    # All documents are inserted at once
+    for uploaded_file, pk in zip(documents, api_models.UploadedFile.objects.insert(documents, load_bulk=False, safe=True)):
+        uploaded_file.pk = pk
+    handler.mark_persisted(filenames)
+
     uploaded_files = []
-    for field, files in request.FILES.iterlists():
-        for file in files:
-            # We let storage decide a name
-            filename = storage.default_storage.save('', file)
-
-            uploaded_file = api_models.UploadedFile()
-            uploaded_file.author = request.user
-            uploaded_file.filename = filename
-            uploaded_file.content_type = file.content_type
-            uploaded_file.save()
-
-            uploaded_files.append({
-                'filename': filename,
-                'resource_uri': resource.get_resource_uri(uploaded_file)
-            })
-
-    # TODO: Create background task to process uploaded file (check content type (both in GridFS file and UploadedFile document), resize images)
+    for uploaded_file in documents:
+        # We process uploaded files asynchronously as it
+        # could take long and we want request to finish quick
+        api_tasks.process_uploaded_file.delay(uploaded_file.pk)
+
+        uploaded_files.append({
+            'filename': uploaded_file.filename,
+            'resource_uri': resource.get_resource_uri(uploaded_file)
+        })
 
     return resource.create_response(request, uploaded_files, response_class=tastypie_http.HttpAccepted)
 
@@ -1,4 +1,7 @@
-import math
+import collections, math, multiprocessing, threading, time
+from multiprocessing import pool
+
+import numpy
 
 from django.core import exceptions
 from django.utils import importlib
@@ -12,6 +15,15 @@ CLOSEST_LATITUDE_SESSION_KEY = '_nodes_latitude'
 CLOSEST_LONGITUDE_SESSION_KEY = '_nodes_longitude'
 MOCKING_SESSION_KEY = '_nodes_mocking'
 
+EARTH_RADIUS = 6371009 # meters
+DEFAULT_LOCATION_TOLERANCE = 50 # meters
+
+DEFAULT_BACKEND_TIMEOUT = 2 # seconds
+DEFAULT_BACKEND_THREADS = 4
+
+# Number of query locations processed at once in a batch nearest search
+NEAREST_CHUNK_SIZE = 1024
+
 def is_mocking(request):
     return request.session.get(MOCKING_SESSION_KEY, False)
 
@@ -22,6 +34,32 @@ def flush_session(request):
         except KeyError:
             pass
 
+def get_session_state(request):
+    """
+    Returns a tuple of all request state node resolution depends on, besides
+    client address.
+    """
+
+    session_state = tuple(request.session.get(key) for key in (SESSION_KEY, BACKEND_SESSION_KEY, CLOSEST_LATITUDE_SESSION_KEY, CLOSEST_LONGITUDE_SESSION_KEY, MOCKING_SESSION_KEY, LATITUDE_SESSION_KEY, LONGITUDE_SESSION_KEY))
+    # User is consulted only while mocking, as only then it matters
+    if request.session.get(MOCKING_SESSION_KEY):
+        user = getattr(request, 'user', None)
+        return session_state + (bool(user and user.is_authenticated() and user.is_staff),)
+    return session_state + (False,)
+
+def update_session(request, values):
+    """
+    Sets nodes session keys to given values and removes those which are not
+    given. Session is modified only if some value actually changes.
+    """
+
+    for key in (SESSION_KEY, BACKEND_SESSION_KEY, CLOSEST_LATITUDE_SESSION_KEY, CLOSEST_LONGITUDE_SESSION_KEY, MOCKING_SESSION_KEY):
+        if key in values:
+            if key not in request.session or request.session[key] != values[key]:
+                request.session[key] = values[key]
+        elif key in request.session:
+            del request.session[key]
+
 def load_backend(path):
     i = path.rfind('.')
     module, attr = path[:i], path[i+1:]
@@ -38,14 +76,120 @@ def load_backend(path):
 
     return cls()
 
+_backends = None
+_backends_lock = threading.Lock()
+
+def _get_registry():
+    global _backends
+
+    # Backends are instantiated only once per process and then reused
+    if _backends is None:
+        with _backends_lock:
+            if _backends is None:
+                from django.conf import settings
+                backends = collections.OrderedDict()
+                for backend_path in getattr(settings, 'NODES_BACKENDS', ()):
+                    backend = load_backend(backend_path)
+                    backends[backend.get_full_name()] = backend
+                if not backends:
+                    raise exceptions.ImproperlyConfigured('No nodes backends have been defined. Does NODES_BACKENDS contain anything?')
+                _backends = backends
+
+    return _backends
+
 def get_backends():
+    return _get_registry().values()
+
+def get_backend(full_name):
+    """
+    Returns configured backend instance with given full name.
+
+    Raises ``KeyError`` if there is no such backend.
+    """
+
+    return _get_registry()[full_name]
+
+def reload_backends():
+    """
+    Discards backend instances, so that they are recreated from ``NODES_BACKENDS``
+    on next use. Tests overriding the setting should call it before and after.
+    """
+
+    global _backends
+
+    with _backends_lock:
+        _backends = None
+
+_pools = {}
+_in_flight = collections.defaultdict(int)
+_pools_lock = threading.Lock()
+
+def _submit_closest_node(backend, request, latitude, longitude):
+    """
+    Submits closest node query to backend's own thread pool and returns its
+    async result. Returns ``None`` if all backend's threads are still busy
+    (for example, if backend hangs), so that one backend cannot take threads
+    or queue slots from the others.
+    """
+
+    from django.conf import settings
+
+    name = backend.get_full_name()
+    threads = getattr(settings, 'NODES_BACKEND_THREADS', DEFAULT_BACKEND_THREADS)
+
+    with _pools_lock:
+        if _in_flight[name] >= threads:
+            return None
+        if name not in _pools:
+            _pools[name] = pool.ThreadPool(threads)
+        _in_flight[name] += 1
+        backend_pool = _pools[name]
+
+    def get_closest_node():
+        try:
+            return backend.get_closest_node(request, latitude, longitude)
+        finally:
+            with _pools_lock:
+                _in_flight[name] -= 1
+
+    return backend_pool.apply_async(get_closest_node)
+
+def get_closest_nodes(request, latitude, longitude):
+    """
+    Returns a pair of a list of ``(backend full name, node)`` pairs with closest
+    node from each backend which found one, in order of backends, and a flag
+    whether all backends answered.
+
+    Backends are queried concurrently, each in its own thread pool of
+    ``NODES_BACKEND_THREADS`` threads. Those which do not answer in
+    ``NODES_BACKEND_TIMEOUT`` seconds are skipped (but are left to finish in
+    the background), as are those whose threads are all still busy.
+    """
+
     from django.conf import settings
-    backends = []
-    for backend_path in getattr(settings, 'NODES_BACKENDS', ()):
-        backends.append(load_backend(backend_path))
-    if not backends:
-        raise exceptions.ImproperlyConfigured('No nodes backends have been defined. Does NODES_BACKENDS contain anything?')
-    return backends
+
+    backends = get_backends()
+    complete = True
+
+    if len(backends) == 1:
+        results = [backends[0].get_closest_node(request, latitude, longitude)]
+    else:
+        deadline = time.time() + getattr(settings, 'NODES_BACKEND_TIMEOUT', DEFAULT_BACKEND_TIMEOUT)
+        async_results = [_submit_closest_node(backend, request, latitude, longitude) for backend in backends]
+
+        results = []
+        for async_result in async_results:
+            if async_result is None:
+                results.append(None)
+                complete = False
+                continue
+            try:
+                results.append(async_result.get(max(0, deadline - time.time())))
+            except multiprocessing.TimeoutError:
+                results.append(None)
+                complete = False
+
+    return [(backend.get_full_name(), node) for backend, node in zip(backends, results) if node is not None], complete
 
 def distance(latitude_a, longitude_a, latitude_b, longitude_b):
     latitude_a, longitude_a, latitude_b, longitude_b = map(math.radians, (latitude_a, longitude_a, latitude_b, longitude_b))
@@ -54,6 +198,69 @@ def distance(latitude_a, longitude_a, latitude_b, longitude_b):
     a = math.sin(dlatitude / 2)**2 + math.cos(latitude_a) * math.cos(latitude_b) * math.sin(dlongitude / 2)**2
     return 2 * math.asin(math.sqrt(a))
 
+def is_near(latitude_a, longitude_a, latitude_b, longitude_b):
+    """
+    Returns ``True`` if locations are the same or at most ``NODES_LOCATION_TOLERANCE``
+    meters apart, so that small changes in reported location (like GPS jitter)
+    do not cause the closest node to be searched for again.
+    """
+
+    if (latitude_a, longitude_a) == (latitude_b, longitude_b):
+        return True
+    if None in (latitude_a, longitude_a, latitude_b, longitude_b):
+        return False
+
+    from django.conf import settings
+    tolerance = getattr(settings, 'NODES_LOCATION_TOLERANCE', DEFAULT_LOCATION_TOLERANCE)
+    return distance(latitude_a, longitude_a, latitude_b, longitude_b) * EARTH_RADIUS <= tolerance
+
+def distances(latitude, longitude, latitudes, longitudes):
+    """
+    Vectorized version of :func:`distance`, computing central angles (in radians)
+    between a location and arrays of locations in one call.
+
+    Arguments are broadcast against each other, so passing column vectors for
+    ``latitude`` and ``longitude`` returns a matrix of distances between every
+    query location and every location in ``latitudes`` and ``longitudes``.
+    """
+
+    latitude, longitude, latitudes, longitudes = (numpy.radians(numpy.asarray(coordinate, dtype=float)) for coordinate in (latitude, longitude, latitudes, longitudes))
+    a = numpy.sin((latitudes - latitude) / 2)**2 + numpy.cos(latitude) * numpy.cos(latitudes) * numpy.sin((longitudes - longitude) / 2)**2
+    return 2 * numpy.arcsin(numpy.sqrt(numpy.minimum(a, 1.0)))
+
+def nearest(query_latitudes, query_longitudes, latitudes, longitudes, k=1, chunk_size=NEAREST_CHUNK_SIZE):
+    """
+    For every query location finds ``k`` nearest locations among ``latitudes``
+    and ``longitudes``.
+
+    Returns a pair of ``(len(query_latitudes), k)`` arrays: indices of nearest
+    locations and their distances (central angles in radians), both ordered by
+    increasing distance. Queries are processed in chunks of ``chunk_size`` to
+    bound memory used by the intermediate distance matrix.
+    """
+
+    query_latitudes = numpy.asarray(query_latitudes, dtype=float).ravel()
+    query_longitudes = numpy.asarray(query_longitudes, dtype=float).ravel()
+    latitudes = numpy.asarray(latitudes, dtype=float).ravel()
+    longitudes = numpy.asarray(longitudes, dtype=float).ravel()
+
+    k = min(k, len(latitudes))
+    indices = numpy.empty((len(query_latitudes), k), dtype=int)
+    result = numpy.empty((len(query_latitudes), k), dtype=float)
+
+    for start in range(0, len(query_latitudes), chunk_size):
+        end = start + chunk_size
+        matrix = distances(query_latitudes[start:end, numpy.newaxis], query_longitudes[start:end, numpy.newaxis], latitudes, longitudes)
+        if k == 1:
+            # Full sort is not needed for the closest location only
+            chunk_indices = numpy.argmin(matrix, axis=1)[:, numpy.newaxis]
+        else:
+            chunk_indices = numpy.argsort(matrix, axis=1)[:, :k]
+        indices[start:end] = chunk_indices
+        result[start:end] = matrix[numpy.arange(len(matrix))[:, numpy.newaxis], chunk_indices]
+
+    return indices, result
+
 def get_node(request, allow_mocking=True):
     """
     Returns wireless node from which request originated. Or the closest
@@ -68,8 +275,7 @@ def get_node(request, allow_mocking=True):
     node = None
     try:
         node_id = request.session[SESSION_KEY]
-        backend_path = request.session[BACKEND_SESSION_KEY]
-        backend = load_backend(backend_path)
+        backend = get_backend(request.session[BACKEND_SESSION_KEY])
         node = backend.get_node(node_id)
         mocking = is_mocking(request)
 
@@ -90,47 +296,54 @@ def get_node(request, allow_mocking=True):
             if LATITUDE_SESSION_KEY not in request.session and LONGITUDE_SESSION_KEY not in request.session:
                 return node
         elif node.is_outside_request():
-            if request.session.get(CLOSEST_LATITUDE_SESSION_KEY) == request.session.get(LATITUDE_SESSION_KEY) and request.session.get(CLOSEST_LONGITUDE_SESSION_KEY) == request.session.get(LONGITUDE_SESSION_KEY):
+            if is_near(request.session.get(CLOSEST_LATITUDE_SESSION_KEY), request.session.get(CLOSEST_LONGITUDE_SESSION_KEY), request.session.get(LATITUDE_SESSION_KEY), request.session.get(LONGITUDE_SESSION_KEY)):
                 return node
 
     node = None
-    flush_session(request)
 
     for backend in get_backends():
         node = backend.get_source_node(request)
         if node is None:
             continue
 
-        request.session[SESSION_KEY] = node.id
-        request.session[BACKEND_SESSION_KEY] = backend.get_full_name()
+        update_session(request, {
+            SESSION_KEY: node.id,
+            BACKEND_SESSION_KEY: backend.get_full_name(),
+        })
 
         return node
 
     if LATITUDE_SESSION_KEY not in request.session or LONGITUDE_SESSION_KEY not in request.session:
+        update_session(request, {})
         return None
 
     assert node is None
 
-    node_backend = None
-    for backend in get_backends():
-        new_node = backend.get_closest_node(request, request.session[LATITUDE_SESSION_KEY], request.session[LONGITUDE_SESSION_KEY])
-        if new_node is None:
-            continue
-
-        # Compare our current best match with the new one
-        if node is None or distance(request.session[LATITUDE_SESSION_KEY], request.session[LONGITUDE_SESSION_KEY], new_node.latitude, new_node.longitude) < distance(request.session[LATITUDE_SESSION_KEY], request.session[LONGITUDE_SESSION_KEY], node.latitude, node.longitude):
-            node_backend = backend.get_full_name()
-            node = new_node
+    latitude = request.session[LATITUDE_SESSION_KEY]
+    longitude = request.session[LONGITUDE_SESSION_KEY]
 
-    if node is None:
+    candidates, complete = get_closest_nodes(request, latitude, longitude)
+    if not candidates:
+        update_session(request, {})
         return None
 
+    # Compare all candidates at once, the first one wins on ties
+    node_backend, node = candidates[numpy.argmin(distances(latitude, longitude, [candidate.latitude for _, candidate in candidates], [candidate.longitude for _, candidate in candidates]))]
+
     node._outside_request = True
 
-    request.session[SESSION_KEY] = node.id
-    request.session[BACKEND_SESSION_KEY] = node_backend
-    request.session[CLOSEST_LATITUDE_SESSION_KEY] = request.session[LATITUDE_SESSION_KEY]
-    request.session[CLOSEST_LONGITUDE_SESSION_KEY] = request.session[LONGITUDE_SESSION_KEY]
+    if not complete:
+        # Some backend might know a closer node, so we do not store this one
+        # and search again on the next request
+        update_session(request, {})
+        return node
+
+    update_session(request, {
+        SESSION_KEY: node.id,
+        BACKEND_SESSION_KEY: node_backend,
+        CLOSEST_LATITUDE_SESSION_KEY: latitude,
+        CLOSEST_LONGITUDE_SESSION_KEY: longitude,
+    })
 
     return node
 
@@ -142,3 +355,21 @@ def get_all_nodes():
     for backend in get_backends():
         for node in backend.get_all_nodes():
             yield node
+
+def resolve_locations(latitudes, longitudes, all_nodes=None):
+    """
+    Returns a list with the closest node for every location given by
+    ``latitudes`` and ``longitudes``, using a vectorized search over
+    ``all_nodes`` (by default all nodes of all backends).
+
+    Useful for resolving many locations at once, without requests and sessions.
+    When resolving in batches, pass the same list of nodes to every call.
+    """
+
+    if all_nodes is None:
+        all_nodes = list(get_all_nodes())
+    if not all_nodes:
+        return [None] * len(latitudes)
+
+    indices, angles = nearest(latitudes, longitudes, [node.latitude for node in all_nodes], [node.longitude for node in all_nodes])
+    return [all_nodes[index] for index in indices[:, 0]]
@@ -1,47 +1,257 @@
-import copy, random
+import os, random, threading, time
 
-from . import data
+from django.conf import settings
+from django.core import exceptions
+
+from piplmesh import nodes
+
+from . import data, models, pointlocation, spatial, subnets
+
+DEFAULT_SUBNETS_RELOAD_INTERVAL = 10 # seconds
 
 class NodeBackend(object):
     def get_full_name(self):
         return '%s.%s' % (self.__module__, self.__class__.__name__)
 
-class RandomNodesBackend(NodeBackend):
+class StaticNodesBackend(NodeBackend):
+    """
+    Base class for backends serving nodes from hard-coded data.
+
+    Nodes returned by :meth:`get_all_nodes` are shared between calls and should
+    not be modified, other methods return new node instances.
+    """
+
+    def __init__(self):
+        self._nodes = tuple(models.Node(i, node_data, self) for i, node_data in enumerate(data.nodes))
+
+    def _get_node(self, node_id):
+        return models.Node(node_id, data.nodes[node_id], self)
+
+    def get_source_node(self, request):
+        return None
+
+    def get_closest_node(self, request, latitude, longitude):
+        return None
+
+    def get_node(self, node_id):
+        try:
+            return self._get_node(int(node_id))
+        except (IndexError, ValueError):
+            return None
+
+    def get_all_nodes(self):
+        return iter(self._nodes)
+
+class RandomNodesBackend(StaticNodesBackend):
     def get_source_node(self, request):
         """
         Returns a node at random.
         """
 
-        node_id = random.randrange(len(data.nodes))
-        node = copy.copy(data.nodes[node_id])
-        node.id = node_id
-        node.backend = self
-        return node
+        return self._get_node(random.randrange(len(data.nodes)))
 
     def get_closest_node(self, request, latitude, longitude):
         """
-        Because searching for real closest node is complex,
-        it just returns a random node.
+        Returns a node at random.
         """
 
-        node_id = random.randrange(len(data.nodes))
-        node = copy.copy(data.nodes[node_id])
-        node.id = node_id
-        node.backend = self
-        return node
+        return self._get_node(random.randrange(len(data.nodes)))
 
-    def get_node(self, node_id):
+class NearestNodesBackend(StaticNodesBackend):
+    """
+    Returns the great-circle closest node to given location, using a k-d tree
+    built over hard-coded nodes data.
+
+    It does not determine source nodes, so it should be combined with some
+    other backend for requests coming from inside the network.
+    """
+
+    _tree = None
+    _tree_lock = threading.Lock()
+
+    def __init__(self):
+        super(NearestNodesBackend, self).__init__()
+        self.tree = self.get_tree()
+
+    @classmethod
+    def get_tree(cls):
+        # Tree is built only once per process and shared between instances
+        if cls._tree is None:
+            with cls._tree_lock:
+                if cls._tree is None:
+                    cls._tree = spatial.KDTree(zip(data.latitudes, data.longitudes))
+        return cls._tree
+
+    def get_closest_node(self, request, latitude, longitude):
+        nearest = self.tree.nearest(latitude, longitude)
+        if not nearest:
+            return None
+        angle, node_id = nearest[0]
+        return self._get_node(node_id)
+
+class GridNodesBackend(NearestNodesBackend):
+    """
+    Returns the great-circle closest node to given location, using a
+    precomputed point-location grid over hard-coded nodes data.
+
+    The grid is loaded from ``NODES_GRID_FILE``, which can be built with the
+    ``buildnodesgrid`` management command whenever nodes change. If the file
+    is not set, missing or stale (built for different nodes or with different
+    ``NODES_GRID_CELL_SIZE``), the grid is built when the backend is loaded.
+    Locations outside the grid are resolved using the k-d tree.
+    """
+
+    _grid = None
+    _grid_lock = threading.Lock()
+
+    def __init__(self):
+        super(GridNodesBackend, self).__init__()
+        self.grid = self.get_grid()
+
+    @classmethod
+    def get_cell_size(cls):
+        return getattr(settings, 'NODES_GRID_CELL_SIZE', pointlocation.DEFAULT_CELL_SIZE)
+
+    @classmethod
+    def build_grid(cls):
+        return pointlocation.NodeGrid(data.latitudes, data.longitudes, cls.get_cell_size())
+
+    @classmethod
+    def get_grid(cls):
+        # Grid is loaded only once per process and shared between instances
+        if cls._grid is None:
+            with cls._grid_lock:
+                if cls._grid is None:
+                    grid = None
+                    path = getattr(settings, 'NODES_GRID_FILE', None)
+                    if path:
+                        try:
+                            grid = pointlocation.NodeGrid.load(path)
+                        except (EnvironmentError, ValueError):
+                            pass
+                    if grid is None or not grid.is_current(data.latitudes, data.longitudes, cls.get_cell_size()):
+                        grid = cls.build_grid()
+                    cls._grid = grid
+        return cls._grid
+
+    def get_closest_node(self, request, latitude, longitude):
+        candidates = self.grid.get_candidates(latitude, longitude)
+        if candidates is None:
+            return super(GridNodesBackend, self).get_closest_node(request, latitude, longitude)
+
+        node_id = min(candidates, key=lambda i: nodes.distance(latitude, longitude, data.latitudes[i], data.longitudes[i]))
+        return self._get_node(node_id)
+
+class SubnetNodesBackend(StaticNodesBackend):
+    """
+    Determines source node from client IP address, using longest-prefix match
+    over node subnets.
+
+    Subnets are read from a file given by ``NODES_SUBNETS_FILE`` setting, with
+    lines of the form ``<prefix> <node name>``, for example::
+
+        10.14.0.0/16 fri
+        2001:db8:14::/48 fri
+
+    The file is checked for changes at most every ``NODES_SUBNETS_RELOAD_INTERVAL``
+    seconds and reloaded if it has changed. If the changed file cannot be
+    parsed, previous subnets are kept.
+
+    ``X-Forwarded-For`` header is used only if ``NODES_SUBNETS_TRUSTED_PROXIES``
+    setting is set to the number of trusted reverse proxies in front of the
+    application, each appending the address it received the request from. The
+    client address is then taken that many entries from the right, as entries
+    further to the left are controlled by the client.
+    """
+
+    def __init__(self):
+        super(SubnetNodesBackend, self).__init__()
+        self.path = getattr(settings, 'NODES_SUBNETS_FILE', None)
+        if not self.path:
+            raise exceptions.ImproperlyConfigured('SubnetNodesBackend requires NODES_SUBNETS_FILE setting.')
+        self.reload_interval = getattr(settings, 'NODES_SUBNETS_RELOAD_INTERVAL', DEFAULT_SUBNETS_RELOAD_INTERVAL)
+        self.trusted_proxies = getattr(settings, 'NODES_SUBNETS_TRUSTED_PROXIES', 0)
+        self.node_ids = dict((node.name, i) for i, node in enumerate(data.nodes))
+
+        self._lock = threading.Lock()
+        self._checked = time.time()
         try:
-            node = copy.copy(data.nodes[int(node_id)])
-            node.id = node_id
-            node.backend = self
-            return node
-        except IndexError:
+            self._signature, self._table = self._load()
+        except (EnvironmentError, ValueError), e:
+            raise exceptions.ImproperlyConfigured('Error loading nodes subnets from %s: "%s"' % (self.path, e))
+
+    def _load(self):
+        stat = os.stat(self.path)
+        with open(self.path, 'r') as f:
+            table = subnets.PrefixTable.parse(f)
+        return (stat.st_mtime, stat.st_size), table
+
+    def get_table(self):
+        now = time.time()
+        if now - self._checked < self.reload_interval:
+            return self._table
+
+        with self._lock:
+            if now - self._checked < self.reload_interval:
+                return self._table
+            self._checked = now
+
+            try:
+                stat = os.stat(self.path)
+                if (stat.st_mtime, stat.st_size) != self._signature:
+                    self._signature, self._table = self._load()
+            except (EnvironmentError, ValueError):
+                # We keep using previous subnets
+                pass
+
+        return self._table
+
+    def get_client_address(self, request):
+        if self.trusted_proxies > 0 and request.META.get('HTTP_X_FORWARDED_FOR'):
+            addresses = [address.strip() for address in request.META['HTTP_X_FORWARDED_FOR'].split(',')]
+            # If there are less addresses, request has not passed through all proxies
+            if len(addresses) >= self.trusted_proxies:
+                return addresses[-self.trusted_proxies]
+        return request.META.get('REMOTE_ADDR')
+
+    def get_source_node(self, request):
+        address = self.get_client_address(request)
+        if not address:
+            return None
+
+        node_id = self.node_ids.get(self.get_table().lookup(address))
+        if node_id is None:
+            return None
+
+        return self._get_node(node_id)
+
+class MongoNodesBackend(NodeBackend):
+    """
+    Serves nodes stored in the database, using a geospatial index to find the
+    closest node. Nodes can be imported with ``importnodes`` management command.
+
+    It does not determine source nodes, so it should be combined with some
+    other backend for requests coming from inside the network.
+    """
+
+    def _get_node(self, stored_node):
+        return models.Node(stored_node.pk, stored_node.get_node_data(), self)
+
+    def get_source_node(self, request):
+        return None
+
+    def get_closest_node(self, request, latitude, longitude):
+        stored_node = models.StoredNode.objects(position__near_sphere=(longitude, latitude)).first()
+        if stored_node is None:
+            return None
+        return self._get_node(stored_node)
+
+    def get_node(self, node_id):
+        stored_node = models.StoredNode.objects(pk=node_id).first()
+        if stored_node is None:
             return None
+        return self._get_node(stored_node)
 
     def get_all_nodes(self):
-        for i, node in enumerate(data.nodes):
-            node = copy.copy(node)
-            node.id = i
-            node.backend = self
-            yield node
+        for stored_node in models.StoredNode.objects.order_by('pk'):
+            yield self._get_node(stored_node)
@@ -2,272 +2,278 @@
 
 # Temporary hard-coded data about active wlan slovenija wireless nodes
 
+import array
+
 from . import models
 
 nodes = [
-    models.Node(None, 'pekarna-1', 'Ob železnici 16', 46.5507723961, 15.6441316009, 'https://nodes.wlan-si.net/node/pekarna-1/'),
-    models.Node(None, 'tdk-13', 'Trg Dušana Kvedra 13', 46.5354454118, 15.6331425905, 'https://nodes.wlan-si.net/node/tdk-13/'),
-    models.Node(None, 'postaja-5', 'postaja-5', 45.8640653, 15.0928333, 'https://nodes.wlan-si.net/node/postaja-5/'),
-    models.Node(None, 'pestike-22c', 'pestike22c', 46.3486240538, 16.0341539397, 'https://nodes.wlan-si.net/node/pestike-22c/'),
-    models.Node(None, 'brilejeva-9', 'Brilejeva 9', 46.0856069557, 14.4722664356, 'https://nodes.wlan-si.net/node/brilejeva-9/'),
-    models.Node(None, 'urban-1', 'Urban nad Mariborom', 46.6037895779, 15.6035497785, 'https://nodes.wlan-si.net/node/urban-1/'),
-    models.Node(None, 'slatina-59', 'slatina-59', 46.3425, 15.9647, 'https://nodes.wlan-si.net/node/slatina-59/'),
-    models.Node(None, 'vareja-mde', 'vareja 2a', 46.3657127, 15.9309187, 'https://nodes.wlan-si.net/node/vareja-mde/'),
-    models.Node(None, 'slatina-77-vzhod', 'Slatina 77', 46.3415599652, 15.9706113342, 'https://nodes.wlan-si.net/node/slatina-77-vzhod/'),
-    models.Node(None, 'gruskovec-44', 'gruskovec 44', 46.3414515801, 16.0151528122, 'https://nodes.wlan-si.net/node/gruskovec-44/'),
-    models.Node(None, 'gruskovec-46', 'gruskovec 46', 46.3424833311, 16.0161323554, 'https://nodes.wlan-si.net/node/gruskovec-46/'),
-    models.Node(None, 'rozmanova-12-i', 'Rozmanova 12', 46.0537441268, 14.5170834661, 'https://nodes.wlan-si.net/node/rozmanova-12-i/'),
-    models.Node(None, 'fri', 'Tržaška 25', 46.0445688554, 14.4893038273, 'https://nodes.wlan-si.net/node/fri/'),
-    models.Node(None, 'bukovje-f', 'bukovje-f', 45.9682882378, 13.5914518833, 'https://nodes.wlan-si.net/node/bukovje-f/'),
-    models.Node(None, 'bezena-111', 'Bezena 111', 46.527557007, 15.6675767899, 'https://nodes.wlan-si.net/node/bezena-111/'),
-    models.Node(None, 'rozmanova-2-ii', 'Rozmanova 2', 46.0524842492, 14.5169761777, 'https://nodes.wlan-si.net/node/rozmanova-2-ii/'),
-    models.Node(None, 'slatina77-jug', 'slatina-77', 46.3414710848, 15.9701607231, 'https://nodes.wlan-si.net/node/slatina77-jug/'),
-    models.Node(None, 'hladilniska-26', 'hladilniška', 46.062824, 14.609134, 'https://nodes.wlan-si.net/node/hladilniska-26/'),
-    models.Node(None, 'krizisce-e', 'krizisce-e', 45.9653095871, 13.5774114133, 'https://nodes.wlan-si.net/node/krizisce-e/'),
-    models.Node(None, 'pekarna-2', 'Ob železnici 16', 46.5509310302, 15.6441396475, 'https://nodes.wlan-si.net/node/pekarna-2/'),
-    models.Node(None, 'levstikovtrg-7', 'Levstikov trg 7', 46.0462088801, 14.5065236092, 'https://nodes.wlan-si.net/node/levstikovtrg-7/'),
-    models.Node(None, 'trzaska-12', 'Tržaška 12', 46.04639728, 14.4907951355, 'https://nodes.wlan-si.net/node/trzaska-12/'),
-    models.Node(None, 'slatina-81', 'slatina-81', 46.3435114823, 15.96774745, 'https://nodes.wlan-si.net/node/slatina-81/'),
-    models.Node(None, 'podgorci-novi', 'podgorci', 46.425638455, 16.064441085, 'https://nodes.wlan-si.net/node/podgorci-novi/'),
-    models.Node(None, 'kumrovska-9', 'Kumrovška 9', 46.084484, 14.51119, 'https://nodes.wlan-si.net/node/kumrovska-9/'),
-    models.Node(None, 'grintovska-22', 'Grintovška 22', 46.0817374492, 14.5109680295, 'https://nodes.wlan-si.net/node/grintovska-22/'),
-    models.Node(None, 'infohit-test-1', 'Leskoškova 10, Ljubljana', 46.0661109314, 14.5570081472, 'https://nodes.wlan-si.net/node/infohit-test-1/'),
-    models.Node(None, 'slatina-link-urban', 'Slatina 77 ', 46.3419668405, 15.9701514244, 'https://nodes.wlan-si.net/node/slatina-link-urban/'),
-    models.Node(None, 'gruskovec-17', 'gruskovec-17', 46.3392443239, 16.0050033333, 'https://nodes.wlan-si.net/node/gruskovec-17/'),
-    models.Node(None, 'ilirska-6', 'Ilirska 6', 46.0526592873, 14.5144790411, 'https://nodes.wlan-si.net/node/ilirska-6/'),
-    models.Node(None, 'podgorci-streha', 'podgorci', 46.4256532457, 16.0642265083, 'https://nodes.wlan-si.net/node/podgorci-streha/'),
-    models.Node(None, 'vojkova-77-ii', 'Vojkova 77', 46.0778304592, 14.5192050934, 'https://nodes.wlan-si.net/node/vojkova-77-ii/'),
-    models.Node(None, 'kunaverjeva-8', 'Kunaverjeva 8', 46.0792753794, 14.4771829247, 'https://nodes.wlan-si.net/node/kunaverjeva-8/'),
-    models.Node(None, 'gradisca', 'gradisca', 46.3598394488, 15.9659825565, 'https://nodes.wlan-si.net/node/gradisca/'),
-    models.Node(None, 'korenjak17a-omni', 'korenjak 17a', 46.3375554907, 16.0327802898, 'https://nodes.wlan-si.net/node/korenjak17a-omni/'),
-    models.Node(None, 'maliokic-41-omni', 'maliokic-41', 46.3219434112, 15.9727141861, 'https://nodes.wlan-si.net/node/maliokic-41-omni/'),
-    models.Node(None, 'neubergerjeva-3', 'Neubergerjeva 3', 46.06061819, 14.5163968205, 'https://nodes.wlan-si.net/node/neubergerjeva-3/'),
-    models.Node(None, 'm5-korenjak17a', 'korenjak 17a', 46.3378369664, 16.0327427389, 'https://nodes.wlan-si.net/node/m5-korenjak17a/'),
-    models.Node(None, 'morjea-49', 'Morje 49/a', 46.4440677866, 15.6169024855, 'https://nodes.wlan-si.net/node/morjea-49/'),
-    models.Node(None, 'maliokic-41', 'mali okic 41', 46.3219469924, 15.9722321035, 'https://nodes.wlan-si.net/node/maliokic-41/'),
-    models.Node(None, 'privoz-17b', 'Privoz 17b', 46.0403525249, 14.5112013817, 'https://nodes.wlan-si.net/node/privoz-17b/'),
-    models.Node(None, 'jadranska-2', 'Jadranska 2', 46.044419, 14.487786, 'https://nodes.wlan-si.net/node/jadranska-2/'),
-    models.Node(None, 'brezovec-83a', 'brezovec 83a', 46.336132534, 16.0241575248, 'https://nodes.wlan-si.net/node/brezovec-83a/'),
-    models.Node(None, 'slatina-40', 'slatina-40', 46.3241311141, 15.9708352096, 'https://nodes.wlan-si.net/node/slatina-40/'),
-    models.Node(None, 'ascevi-luwa', 'Števerjan, Italija', 45.9683992252, 13.5797295556, 'https://nodes.wlan-si.net/node/ascevi-luwa/'),
-    models.Node(None, 'moravce1', 'Vegova 21', 46.1375899401, 14.7458195686, 'https://nodes.wlan-si.net/node/moravce1/'),
-    models.Node(None, 'slatina-4a', 'slatina 4a', 46.332011, 15.9741758, 'https://nodes.wlan-si.net/node/slatina-4a/'),
-    models.Node(None, 'slatina-13', 'slatina-13', 46.3287892614, 15.9754607681, 'https://nodes.wlan-si.net/node/slatina-13/'),
-    models.Node(None, 'm5-gradisca-slatina', 'gradisca', 46.3595210645, 15.965757251, 'https://nodes.wlan-si.net/node/m5-gradisca-slatina/'),
-    models.Node(None, 'sd-cirkulane', 'cirkulane', 46.3423922296, 15.9930889608, 'https://nodes.wlan-si.net/node/sd-cirkulane/'),
-    models.Node(None, 'rozmanova-3', 'Rozmanova 3', 46.0518141849, 14.5164906979, 'https://nodes.wlan-si.net/node/rozmanova-3/'),
-    models.Node(None, 'glinska-9', 'Glinška 9', 46.0464268183, 14.4898295403, 'https://nodes.wlan-si.net/node/glinska-9/'),
-    models.Node(None, 'sadez-3', 'sadež 3', 45.57784, 15.19215, 'https://nodes.wlan-si.net/node/sadez-3/'),
-    models.Node(None, 'maliokic-17', 'maliokic-17', 46.333222061, 15.9650062324, 'https://nodes.wlan-si.net/node/maliokic-17/'),
-    models.Node(None, 'zaloska-povodni-moz', 'zaloska-povodni-moz', 46.0531849569, 14.5252869129, 'https://nodes.wlan-si.net/node/zaloska-povodni-moz/'),
-    models.Node(None, 'slatina77-zahod', 'slatina-77', 46.3419922705, 15.9696732761, 'https://nodes.wlan-si.net/node/slatina77-zahod/'),
-    models.Node(None, 'trubarjeva-81-ii', 'Trubarjeva 81', 46.0524477337, 14.515726313, 'https://nodes.wlan-si.net/node/trubarjeva-81-ii/'),
-    models.Node(None, 'pristava-34', 'pristava-34', 46.3469377938, 15.9699954987, 'https://nodes.wlan-si.net/node/pristava-34/'),
-    models.Node(None, 'trubarjeva-81-i', 'Trubarjeva 81', 46.0523351003, 14.5158778578, 'https://nodes.wlan-si.net/node/trubarjeva-81-i/'),
-    models.Node(None, 'scopolijeva-17', 'Scopolijeva 17', 46.0697697673, 14.4870400429, 'https://nodes.wlan-si.net/node/scopolijeva-17/'),
-    models.Node(None, 'hrvatskitrg-2', 'Hrvatski trg 2', 46.0524448485, 14.5178934932, 'https://nodes.wlan-si.net/node/hrvatskitrg-2/'),
-    models.Node(None, 'ljudmila-1', 'Rimska 8', 46.0475884167, 14.5007756352, 'https://nodes.wlan-si.net/node/ljudmila-1/'),
-    models.Node(None, 'agrokombinatska-6', 'agrokombinatska cesta 6', 46.062457, 14.613511, 'https://nodes.wlan-si.net/node/agrokombinatska-6/'),
-    models.Node(None, 'adam-in-eva', 'V zavoju 40 B', 46.5751049, 15.6674145, 'https://nodes.wlan-si.net/node/adam-in-eva/'),
-    models.Node(None, 'scedno-marj', 'scedno-marj', 45.9711114413, 13.5973012445, 'https://nodes.wlan-si.net/node/scedno-marj/'),
-    models.Node(None, 'belacerkev-17', 'bela cerkev, slovenija', 45.867571, 15.276103, 'https://nodes.wlan-si.net/node/belacerkev-17/'),
-    models.Node(None, 'pongrce-35', 'pongrce 35', 46.400313651, 15.7034540176, 'https://nodes.wlan-si.net/node/pongrce-35/'),
-    models.Node(None, 'scedno-sta', 'Števerjan, Italija', 45.967146413, 13.5981831537, 'https://nodes.wlan-si.net/node/scedno-sta/'),
-    models.Node(None, 'eipprova-19', 'Eipprova 19', 46.042880376, 14.5035436749, 'https://nodes.wlan-si.net/node/eipprova-19/'),
-    models.Node(None, 'odrga-6', 'Odrga 6', 45.903516, 15.013327, 'https://nodes.wlan-si.net/node/odrga-6/'),
-    models.Node(None, 'najami-9', 'Na jami 9', 46.0654223602, 14.4924527407, 'https://nodes.wlan-si.net/node/najami-9/'),
-    models.Node(None, 'ribniska-14', 'Ribniška 14', 46.058069, 14.531145, 'https://nodes.wlan-si.net/node/ribniska-14/'),
-    models.Node(None, 'trebinjska-4-i', 'Trebinjska 4', 46.0793969971, 14.5186927915, 'https://nodes.wlan-si.net/node/trebinjska-4-i/'),
-    models.Node(None, 'vogljevogljanskacesta-50', 'voglje vogljanska cesta 50', 46.2148526006, 14.4300270081, 'https://nodes.wlan-si.net/node/vogljevogljanskacesta-50/'),
-    models.Node(None, 'ziherlova-41', 'Ziherlova 41', 46.0417904825, 14.5059603453, 'https://nodes.wlan-si.net/node/ziherlova-41/'),
-    models.Node(None, 'pristava-26c', 'Pristava-26c', 46.3394770285, 15.9789537193, 'https://nodes.wlan-si.net/node/pristava-26c/'),
-    models.Node(None, 'osojna-pot-3', 'Osojna pot 3', 46.0472893784, 14.5090556145, 'https://nodes.wlan-si.net/node/osojna-pot-3/'),
-    models.Node(None, 'maliokic-36', 'mali okic 36', 46.3212454418, 15.9696521773, 'https://nodes.wlan-si.net/node/maliokic-36/'),
-    models.Node(None, 'napodrtem-18', 'Na podrtem 18', 46.5334046852, 15.6854376197, 'https://nodes.wlan-si.net/node/napodrtem-18/'),
-    models.Node(None, 'zafara-3', 'Zafara 3, Zuzemberk', 45.8329856002, 14.9401187897, 'https://nodes.wlan-si.net/node/zafara-3/'),
-    models.Node(None, 'peruzzijeva-14', 'Peruzzijeva 14', 46.0289418711, 14.5313072205, 'https://nodes.wlan-si.net/node/peruzzijeva-14/'),
-    models.Node(None, 's56lsb', 'Sentjernejska cesta 17', 45.8016599, 15.1833667, 'https://nodes.wlan-si.net/node/s56lsb/'),
-    models.Node(None, 'tbilisijska-118-c', 'Tbilisijska 118', 46.0358354689, 14.4759839773, 'https://nodes.wlan-si.net/node/tbilisijska-118-c/'),
-    models.Node(None, 'stantetova-14', 'Stantetova 14', 46.5430264266, 15.626270771, 'https://nodes.wlan-si.net/node/stantetova-14/'),
-    models.Node(None, 'kolodvorska-2', 'kolodvorska 2', 45.7051678083, 13.8632333279, 'https://nodes.wlan-si.net/node/kolodvorska-2/'),
-    models.Node(None, 'cigaletova-15', 'Cigaletova 15', 46.0568985032, 14.506829381, 'https://nodes.wlan-si.net/node/cigaletova-15/'),
-    models.Node(None, 'brezovec-80', 'brezovec ', 46.3416661295, 16.0207843746, 'https://nodes.wlan-si.net/node/brezovec-80/'),
-    models.Node(None, 'metelkovamesto-1', 'Masarykova 24', 46.0564095992, 14.5172631741, 'https://nodes.wlan-si.net/node/metelkovamesto-1/'),
-    models.Node(None, 'lizikejancar-6-ii', 'ul lizike jancar 6', 46.5649152079, 15.6308841705, 'https://nodes.wlan-si.net/node/lizikejancar-6-ii/'),
-    models.Node(None, 'rozmanova-12-ii', 'Rozmanova 12', 46.0538252221, 14.5170432329, 'https://nodes.wlan-si.net/node/rozmanova-12-ii/'),
-    models.Node(None, 'trebinjska-4-ii', 'Trebinjska 4', 46.0793988577, 14.5186927915, 'https://nodes.wlan-si.net/node/trebinjska-4-ii/'),
-    models.Node(None, 'spodnjapolskava-113', 'Spodnja polskava 113', 46.4119268, 15.6373409, 'https://nodes.wlan-si.net/node/spodnjapolskava-113/'),
-    models.Node(None, 'volodjeva-19', 'Volodjeva 19, Maribor', 46.5303227846, 15.6675714254, 'https://nodes.wlan-si.net/node/volodjeva-19/'),
-    models.Node(None, 'mose-pijade-8', '8, moše pijade, črnomelj', 45.57894, 15.18578, 'https://nodes.wlan-si.net/node/mose-pijade-8/'),
-    models.Node(None, 'jama-36a', 'Jama 36a', 46.202466187, 14.3959679618, 'https://nodes.wlan-si.net/node/jama-36a/'),
-    models.Node(None, 'maliokic-4', 'maliokic-4', 46.3403266068, 15.9648935797, 'https://nodes.wlan-si.net/node/maliokic-4/'),
-    models.Node(None, 'rozmanova-2-i', 'Rozmanova 2', 46.0524284677, 14.5169091225, 'https://nodes.wlan-si.net/node/rozmanova-2-i/'),
-    models.Node(None, 'gerbiceva-49', 'Gerbičeva 49', 46.0397644225, 14.4891268015, 'https://nodes.wlan-si.net/node/gerbiceva-49/'),
-    models.Node(None, 'spodnjiporcic-92', 'Spodnji Porčič 92', 46.5944253, 15.8536714, 'https://nodes.wlan-si.net/node/spodnjiporcic-92/'),
-    models.Node(None, 'tbilisijska-118', 'tbilisijska-118', 46.0358205728, 14.4759786129, 'https://nodes.wlan-si.net/node/tbilisijska-118/'),
-    models.Node(None, 'bavarska-4', 'Bavarska 4, Maribor', 46.5597979426, 15.6458079815, 'https://nodes.wlan-si.net/node/bavarska-4/'),
-    models.Node(None, 'zabukovica-129', 'Zabukovica 129', 46.5343032786, 15.8127593994, 'https://nodes.wlan-si.net/node/zabukovica-129/'),
-    models.Node(None, 'veljkavlahovica-62', 'Veljka Vlahovića 62', 46.5511205, 15.6765677, 'https://nodes.wlan-si.net/node/veljkavlahovica-62/'),
-    models.Node(None, 'zaloska-78a-i', 'Zaloška 78a', 46.055387912, 14.5419528187, 'https://nodes.wlan-si.net/node/zaloska-78a-i/'),
-    models.Node(None, 'mozirje-krajnikovo', 'Mozirje Krajnikovo', 46.3428467475, 14.9543344975, 'https://nodes.wlan-si.net/node/mozirje-krajnikovo/'),
-    models.Node(None, 'neubergerjeva-16', 'Neubergerjeva 16', 46.0627878, 14.5163637, 'https://nodes.wlan-si.net/node/neubergerjeva-16/'),
-    models.Node(None, 'trebinjska-4-iii', 'Trebinjska 4', 46.0793988577, 14.5185345411, 'https://nodes.wlan-si.net/node/trebinjska-4-iii/'),
-    models.Node(None, 'marmeljad', 'Šentrupert', 45.9797865849, 15.1007080078, 'https://nodes.wlan-si.net/node/marmeljad/'),
-    models.Node(None, 'cigaletova-10', 'Cigaletova 10', 46.0570011, 14.5070264, 'https://nodes.wlan-si.net/node/cigaletova-10/'),
-    models.Node(None, 'dvorje', 'Dvorje, Cerklje na Gorenjskem', 46.260814, 14.4878189, 'https://nodes.wlan-si.net/node/dvorje/'),
-    models.Node(None, 'podgozdom-25', 'Ulica pod gozdom, Črnomelj', 45.5828735162, 15.1923828722, 'https://nodes.wlan-si.net/node/podgozdom-25/'),
-    models.Node(None, 'tovarnarog-3', 'Trubarjeva 72', 46.0518566265, 14.5155519247, 'https://nodes.wlan-si.net/node/tovarnarog-3/'),
-    models.Node(None, 'verje', 'Medvode', 46.1467779943, 14.4203710556, 'https://nodes.wlan-si.net/node/verje/'),
-    models.Node(None, 'slatina-28home', 'slatina 28', 46.325188629, 15.9763083461, 'https://nodes.wlan-si.net/node/slatina-28home/'),
-    models.Node(None, 'trubarjeva-51a', 'Trubarjeva 51a', 46.0527320078, 14.5121535659, 'https://nodes.wlan-si.net/node/trubarjeva-51a/'),
-    models.Node(None, 'uklanci-s', 'uklanci-s', 45.9722019827, 13.5781016348, 'https://nodes.wlan-si.net/node/uklanci-s/'),
-    models.Node(None, 'gubcevaptuj-23', 'GUBČEVA 23 PTUJ', 46.4154198527, 15.8476817608, 'https://nodes.wlan-si.net/node/gubcevaptuj-23/'),
-    models.Node(None, 'pristava-40', 'pristava 40b', 46.3470177, 15.9820304, 'https://nodes.wlan-si.net/node/pristava-40/'),
-    models.Node(None, 'velikacolnarska-9-ii', 'Velika čolnarska 9', 46.039579165, 14.5084601641, 'https://nodes.wlan-si.net/node/velikacolnarska-9-ii/'),
-    models.Node(None, 'kozarska-19', 'Kozarška 19', 46.041004296, 14.4502750039, 'https://nodes.wlan-si.net/node/kozarska-19/'),
-    models.Node(None, 'podkraj-19c', 'Podkraj pri Velenju', 46.3550291836, 15.0979399681, 'https://nodes.wlan-si.net/node/podkraj-19c/'),
-    models.Node(None, 'obrezna-1', 'obrežna ulica 1', 46.5575914022, 15.6280946732, 'https://nodes.wlan-si.net/node/obrezna-1/'),
-    models.Node(None, 'sketova-6', 'Sketova 6', 46.0577285137, 14.5254144073, 'https://nodes.wlan-si.net/node/sketova-6/'),
-    models.Node(None, 'zlatolicje-33', 'zlatolicje 33', 46.4544383953, 15.7805728912, 'https://nodes.wlan-si.net/node/zlatolicje-33/'),
-    models.Node(None, 'mire-miheliceve', 'mire-miheliceve', 46.0554417671, 14.5483703167, 'https://nodes.wlan-si.net/node/mire-miheliceve/'),
-    models.Node(None, 'naklo', 'naklo', 46.2734009, 14.317259, 'https://nodes.wlan-si.net/node/naklo/'),
-    models.Node(None, 'testna', 'cestavkresnice', 46.0718015498, 14.635848999, 'https://nodes.wlan-si.net/node/testna/'),
-    models.Node(None, 'hrastje-5a', 'hrastje 5a', 45.8145765, 15.299317, 'https://nodes.wlan-si.net/node/hrastje-5a/'),
-    models.Node(None, 's53w', 'kurirčkova 45', 46.5067925724, 15.6934440136, 'https://nodes.wlan-si.net/node/s53w/'),
-    models.Node(None, 'ptujskagora', 'Ptujska Gora', 46.5363539, 15.6594465, 'https://nodes.wlan-si.net/node/ptujskagora/'),
-    models.Node(None, 'koroska-cesta-1-do-spet-2011', 'Koroška cesta 1', 46.5574290988, 15.6441664696, 'https://nodes.wlan-si.net/node/koroska-cesta-1-do-spet-2011/'),
-    models.Node(None, 'mercnikova-1a', 'Merčnikova 1a', 46.0412700418, 14.476954937, 'https://nodes.wlan-si.net/node/mercnikova-1a/'),
-    models.Node(None, 'rospoh-25a', 'Rošpoh', 46.5866329442, 15.6347304583, 'https://nodes.wlan-si.net/node/rospoh-25a/'),
-    models.Node(None, 'cecovje-27', 'JN76LM', 46.5404967105, 14.9633038044, 'https://nodes.wlan-si.net/node/cecovje-27/'),
-    models.Node(None, 'polana1423', 'Murska Sobota - Polana', 46.6795944656, 16.1385726929, 'https://nodes.wlan-si.net/node/polana1423/'),
-    models.Node(None, 'podgozd-5', 'Novo mesto', 45.7943396305, 15.1940917969, 'https://nodes.wlan-si.net/node/podgozd-5/'),
-    models.Node(None, 'm5-test-nanobrige', 'haloze', 46.3616709851, 16.0131711967, 'https://nodes.wlan-si.net/node/m5-test-nanobrige/'),
-    models.Node(None, 'slatina-74', 'slatina-74', 46.3418145099, 15.9727739097, 'https://nodes.wlan-si.net/node/slatina-74/'),
-    models.Node(None, 'gradisca-123', 'gradisca', 46.357157, 15.9710645, 'https://nodes.wlan-si.net/node/gradisca-123/'),
-    models.Node(None, 'obgozdu-14', 'Ob gozdu 14', 46.4722857725, 15.651140213, 'https://nodes.wlan-si.net/node/obgozdu-14/'),
-    models.Node(None, 'velikacolnarska-9-i', 'Velika čolnarska 9', 46.039579165, 14.5084601641, 'https://nodes.wlan-si.net/node/velikacolnarska-9-i/'),
-    models.Node(None, 'bezjakova-101', 'bezjakova101', 46.5403125855, 15.5897176266, 'https://nodes.wlan-si.net/node/bezjakova-101/'),
-    models.Node(None, 'lili-novy-17-c', 'lili novy', 46.0349603164, 14.4516777992, 'https://nodes.wlan-si.net/node/lili-novy-17-c/'),
-    models.Node(None, 'obgozdu-20', 'Ob gozdu 20', 46.5468783353, 15.6598198414, 'https://nodes.wlan-si.net/node/obgozdu-20/'),
-    models.Node(None, 'lili-novy-17', 'lili-novy-17', 46.0350422461, 14.4516670704, 'https://nodes.wlan-si.net/node/lili-novy-17/'),
-    models.Node(None, 'strazaprioplotnici', 'Straža pri Oplotnici', 46.3804443303, 15.4776334763, 'https://nodes.wlan-si.net/node/strazaprioplotnici/'),
-    models.Node(None, 'test-novi-fw-v4', 'stojnci ', 46.3806636598, 15.9721301796, 'https://nodes.wlan-si.net/node/test-novi-fw-v4/'),
-    models.Node(None, 'staracesta-52', 'Stara cesta 52', 46.4965606332, 15.6380081177, 'https://nodes.wlan-si.net/node/staracesta-52/'),
-    models.Node(None, 'ljubljanskacesta-112', 'ljubljanska cesta 112', 45.8342017, 15.1561234, 'https://nodes.wlan-si.net/node/ljubljanskacesta-112/'),
-    models.Node(None, 'stefanova-15-ii', 'Štefanova 15', 46.0537786249, 14.5022857189, 'https://nodes.wlan-si.net/node/stefanova-15-ii/'),
-    models.Node(None, 'sernceva-12-2', 'sernčeva ulica 12', 46.5652080507, 15.6377452612, 'https://nodes.wlan-si.net/node/sernceva-12-2/'),
-    models.Node(None, 'roznadolina-ii-13', 'Rožna dolina cesta II/13, Ljubljana', 46.0462943304, 14.4837637246, 'https://nodes.wlan-si.net/node/roznadolina-ii-13/'),
-    models.Node(None, 'segova-28', 'Šegova 28', 45.7979958, 15.1577231, 'https://nodes.wlan-si.net/node/segova-28/'),
-    models.Node(None, 'tovarnarog-2', 'Trubarjeva 72', 46.052104574, 14.5151549578, 'https://nodes.wlan-si.net/node/tovarnarog-2/'),
-    models.Node(None, 'kiberpipa', 'Kersnikova 4', 46.0557268633, 14.5040345192, 'https://nodes.wlan-si.net/node/kiberpipa/'),
-    models.Node(None, 'gradenje-17', 'Gradenje 17', 45.8728451, 15.2600253, 'https://nodes.wlan-si.net/node/gradenje-17/'),
-    models.Node(None, 'luksy', 'Trniče 45b', 46.4500403171, 15.7422494888, 'https://nodes.wlan-si.net/node/luksy/'),
-    models.Node(None, 'kidriceva-11', 'Kidričeva 11', 45.7053491263, 13.8668167591, 'https://nodes.wlan-si.net/node/kidriceva-11/'),
-    models.Node(None, 'stefanova-15-i', 'Štefanova 15', 46.0537786249, 14.5022857189, 'https://nodes.wlan-si.net/node/stefanova-15-i/'),
-    models.Node(None, 'tic-vipava', 'Vipava', 45.8462639586, 13.9622336626, 'https://nodes.wlan-si.net/node/tic-vipava/'),
-    models.Node(None, 'bratovbabnik-24', 'Ulica bratov Babnik 24', 46.0758356159, 14.4641876221, 'https://nodes.wlan-si.net/node/bratovbabnik-24/'),
-    models.Node(None, 'trebinjska-4-iv', 'Trebinjska 4', 46.0793876944, 14.518455416, 'https://nodes.wlan-si.net/node/trebinjska-4-iv/'),
-    models.Node(None, 'osjakobaaljaza', 'Kranj', 46.2564481643, 14.3501129374, 'https://nodes.wlan-si.net/node/osjakobaaljaza/'),
-    models.Node(None, 'vojkova-77-i', 'Vojkova 77', 46.0777707961, 14.519162178, 'https://nodes.wlan-si.net/node/vojkova-77-i/'),
-    models.Node(None, 'ljubljanska-55a', 'Ljubljanska 55a', 46.4514499583, 15.668335855, 'https://nodes.wlan-si.net/node/ljubljanska-55a/'),
-    models.Node(None, 'dunajska-33', 'Dunajska 33', 46.0616778718, 14.5071029663, 'https://nodes.wlan-si.net/node/dunajska-33/'),
-    models.Node(None, 'scopolijeva-53', 'Scopolijeva-53', 46.0690108, 14.4858541, 'https://nodes.wlan-si.net/node/scopolijeva-53/'),
-    models.Node(None, 'tr3', 'Trg republike 3', 46.0469247457, 14.5066709525, 'https://nodes.wlan-si.net/node/tr3/'),
-    models.Node(None, 'nanoska-17', 'Nanoška 17', 46.0431824791, 14.4742298126, 'https://nodes.wlan-si.net/node/nanoska-17/'),
-    models.Node(None, 'staracesta-26', 'Stara Cesta 26', 46.2529387524, 14.4846582413, 'https://nodes.wlan-si.net/node/staracesta-26/'),
-    models.Node(None, 'solar', 'Trubarjeva 72', 46.0516205913, 14.5151442289, 'https://nodes.wlan-si.net/node/solar/'),
-    models.Node(None, 'slatina-54', 'slatina-54', 46.336, 15.96442, 'https://nodes.wlan-si.net/node/slatina-54/'),
-    models.Node(None, 'slatina-55', 'slatina-55', 46.3353925225, 15.9676884415, 'https://nodes.wlan-si.net/node/slatina-55/'),
-    models.Node(None, 'dravinjskivrh', 'Dravinjski Vrh', 46.4199885, 15.8699813, 'https://nodes.wlan-si.net/node/dravinjskivrh/'),
-    models.Node(None, 'kajuhova-ulica-2', 'Kajuhova ulica 2', 45.57661, 15.18575, 'https://nodes.wlan-si.net/node/kajuhova-ulica-2/'),
-    models.Node(None, 'stojnci-2222', 'stojnci', 46.3806044485, 15.9720979931, 'https://nodes.wlan-si.net/node/stojnci-2222/'),
-    models.Node(None, 'tovarnarog-1', 'Trubarjeva 72', 46.0521380803, 14.5148974657, 'https://nodes.wlan-si.net/node/tovarnarog-1/'),
-    models.Node(None, 'uklanci-d', 'Uklanci', 45.9723012797, 13.5747456551, 'https://nodes.wlan-si.net/node/uklanci-d/'),
-    models.Node(None, 'berta', 'K brodu 27', 46.5510693736, 15.7046985626, 'https://nodes.wlan-si.net/node/berta/'),
-    models.Node(None, 'm5-maliokic', 'mali okic', 46.3221915018, 15.9723715784, 'https://nodes.wlan-si.net/node/m5-maliokic/'),
-    models.Node(None, 'gregorciceva-21', 'Gregorčičeva 21b', 46.5611542, 15.6452967, 'https://nodes.wlan-si.net/node/gregorciceva-21/'),
-    models.Node(None, 'slatina-77', 'slatina-77', 46.3418414209, 15.9702680114, 'https://nodes.wlan-si.net/node/slatina-77/'),
-    models.Node(None, 'brezovec-28a', 'brezovec 28a', 46.3582209773, 16.015624881, 'https://nodes.wlan-si.net/node/brezovec-28a/'),
-    models.Node(None, 'maliokic-3', 'maliokic-3', 46.3397480009, 15.9649955036, 'https://nodes.wlan-si.net/node/maliokic-3/'),
-    models.Node(None, 'pristava-28', 'pristava-28', 46.3419478304, 15.9761642219, 'https://nodes.wlan-si.net/node/pristava-28/'),
-    models.Node(None, 'valerisce-r', 'valerisce-r', 45.967714656, 13.5766875744, 'https://nodes.wlan-si.net/node/valerisce-r/'),
-    models.Node(None, 'loke-pri-mozirju', 'Loke pri Mozirju 5a', 46.3330766199, 14.9720692635, 'https://nodes.wlan-si.net/node/loke-pri-mozirju/'),
-    models.Node(None, 'korenjak-17home', 'slatina 4a ', 46.3382549801, 16.033939363, 'https://nodes.wlan-si.net/node/korenjak-17home/'),
-    models.Node(None, 'devina-11a', 'Devina 11a ', 46.4036911, 15.571223, 'https://nodes.wlan-si.net/node/devina-11a/'),
-    models.Node(None, 'rusjanovtrg-2', 'Rusjanov trg 2', 46.0537441268, 14.5638021827, 'https://nodes.wlan-si.net/node/rusjanovtrg-2/'),
-    models.Node(None, 'devinska-1', 'Devinska ulica 1', 46.3972715, 15.581594, 'https://nodes.wlan-si.net/node/devinska-1/'),
-    models.Node(None, 'urban-uplink', 'Lizike Jančar 6', 46.5650568347, 15.6304764748, 'https://nodes.wlan-si.net/node/urban-uplink/'),
-    models.Node(None, 'urban-2', 'Sveti Urban nad Mariborom', 46.6037895779, 15.6035497785, 'https://nodes.wlan-si.net/node/urban-2/'),
-    models.Node(None, 'urban-jost', 'Jošt na Urbanu', 46.6038428343, 15.6051027775, 'https://nodes.wlan-si.net/node/urban-jost/'),
-    models.Node(None, 'druga', 'Trg Miloša Zidanška 1', 46.5492759, 15.6448708, 'https://nodes.wlan-si.net/node/druga/'),
-    models.Node(None, 'bukovje-mart', 'bukovje-mart', 45.969009308, 13.5898425132, 'https://nodes.wlan-si.net/node/bukovje-mart/'),
-    models.Node(None, 'm5-slatina77-omni', 'slatina77', 46.3423544548, 15.9704489715, 'https://nodes.wlan-si.net/node/m5-slatina77-omni/'),
-    models.Node(None, 'crnekova-12', 'crnekova 12 ', 46.5347395, 15.6349319, 'https://nodes.wlan-si.net/node/crnekova-12/'),
-    models.Node(None, 'ljudmila-2', 'Rimska 8', 46.0474878894, 14.5007327199, 'https://nodes.wlan-si.net/node/ljudmila-2/'),
-    models.Node(None, 'smarnagora-4-i', 'Gostilna Ledinek, Šmarna gora', 46.1297127136, 14.4637584686, 'https://nodes.wlan-si.net/node/smarnagora-4-i/'),
-    models.Node(None, 'vareja-nanostationm5', 'vareja ', 46.3661497346, 15.9321684844, 'https://nodes.wlan-si.net/node/vareja-nanostationm5/'),
-    models.Node(None, 'druga-link', 'Trg Miloša Zidanška 1  ', 46.5488639538, 15.6439197063, 'https://nodes.wlan-si.net/node/druga-link/'),
-    models.Node(None, 'cestaktamu-12-link', 'Cesta k Tamu 12 ', 46.5276175354, 15.6671905518, 'https://nodes.wlan-si.net/node/cestaktamu-12-link/'),
-    models.Node(None, 'laporje-50', 'laporje 50 slovenija', 46.3473719693, 15.5947065353, 'https://nodes.wlan-si.net/node/laporje-50/'),
-    models.Node(None, 'slatina-58', 'slatina-58', 46.3414820715, 15.9649150373, 'https://nodes.wlan-si.net/node/slatina-58/'),
-    models.Node(None, 'trg-svobode-3', 'trg-svobode-3', 45.570850287, 15.1927612424, 'https://nodes.wlan-si.net/node/trg-svobode-3/'),
-    models.Node(None, 'repisce-51', 'repisce-51', 46.344606765, 15.9610043766, 'https://nodes.wlan-si.net/node/repisce-51/'),
-    models.Node(None, 'valerisce', 'Števerjan, Italija', 45.9679766527, 13.5790586472, 'https://nodes.wlan-si.net/node/valerisce/'),
-    models.Node(None, 'brezovec-85', 'brezovec 85', 46.3365957459, 16.0338964476, 'https://nodes.wlan-si.net/node/brezovec-85/'),
-    models.Node(None, 'grm-7', 'Grm pri Podzemlju 7', 45.6163528121, 15.277366162, 'https://nodes.wlan-si.net/node/grm-7/'),
-    models.Node(None, 'krizisce-mu', 'Krizisce-mu', 45.9748395746, 13.5850775242, 'https://nodes.wlan-si.net/node/krizisce-mu/'),
-    models.Node(None, 'slatina77-sever', 'slatina77b', 46.3423302603, 15.9704825882, 'https://nodes.wlan-si.net/node/slatina77-sever/'),
-    models.Node(None, 'driver', 'Celovška 108', 46.0699320348, 14.4898447395, 'https://nodes.wlan-si.net/node/driver/'),
-    models.Node(None, 'bukovje-g', 'bukovje-g', 45.9707883139, 13.5879825353, 'https://nodes.wlan-si.net/node/bukovje-g/'),
-    models.Node(None, 'm5-podgorci', 'podgorci 6a', 46.4254544343, 16.0643713476, 'https://nodes.wlan-si.net/node/m5-podgorci/'),
-    models.Node(None, 'm5-gradisca-panel', 'gradisca', 46.3598690656, 15.9656070473, 'https://nodes.wlan-si.net/node/m5-gradisca-panel/'),
-    models.Node(None, 'scedno-zv', 'Scedno', 45.9807485972, 13.5944994094, 'https://nodes.wlan-si.net/node/scedno-zv/'),
-    models.Node(None, 'krizisce-m', 'krizisce-m', 45.9739000774, 13.5844445229, 'https://nodes.wlan-si.net/node/krizisce-m/'),
-    models.Node(None, 'urban-s59abc', 'urban', 46.6038221953, 15.6034451723, 'https://nodes.wlan-si.net/node/urban-s59abc/'),
-    models.Node(None, 'lomanose-44b', 'Lomanoše 44b', 46.6682870739, 15.9466552734, 'https://nodes.wlan-si.net/node/lomanose-44b/'),
-    models.Node(None, 'stojnci-20', 'stojnci', 46.3805304337, 15.9718297722, 'https://nodes.wlan-si.net/node/stojnci-20/'),
-    models.Node(None, 'smartno-sg', 'Šmartno pri Slovenj gradcu 17', 46.4942488567, 15.1069951057, 'https://nodes.wlan-si.net/node/smartno-sg/'),
-    models.Node(None, 'bukovje-st', 'bukovje-st', 45.9702347673, 13.5884406567, 'https://nodes.wlan-si.net/node/bukovje-st/'),
-    models.Node(None, 'mariborska-39', 'Ptuj', 46.4157615803, 15.8564016223, 'https://nodes.wlan-si.net/node/mariborska-39/'),
-    models.Node(None, 'beblerjevtrg-1', 'Beblerjev trg 1', 46.0707594922, 14.547239542, 'https://nodes.wlan-si.net/node/beblerjevtrg-1/'),
-    models.Node(None, 'tesna-tocka', 'Slovenska Bistrica', 46.3422191607, 15.5921516474, 'https://nodes.wlan-si.net/node/tesna-tocka/'),
-    models.Node(None, 'uklanci-m', 'uklanci-m', 45.9722935437, 13.5821539164, 'https://nodes.wlan-si.net/node/uklanci-m/'),
-    models.Node(None, 'brezovec-39', 'brezovec 39', 46.3471172048, 16.0176944698, 'https://nodes.wlan-si.net/node/brezovec-39/'),
-    models.Node(None, 'slatina-28', 'slatina 28', 46.325188629, 15.9763083461, 'https://nodes.wlan-si.net/node/slatina-28/'),
-    models.Node(None, 'zaloska-78a-ii', 'Zaloška 78a', 46.0554028028, 14.5419622064, 'https://nodes.wlan-si.net/node/zaloska-78a-ii/'),
-    models.Node(None, 'pestike-26b', 'pestike 26', 46.3508566038, 16.0394997604, 'https://nodes.wlan-si.net/node/pestike-26b/'),
-    models.Node(None, 'kolodvorska-34', 'Kolodvorska 34, Črnomelj', 45.575225217, 15.1905723811, 'https://nodes.wlan-si.net/node/kolodvorska-34/'),
-    models.Node(None, 'drecji', 'Drecji vrh', 45.9213222, 15.1701489, 'https://nodes.wlan-si.net/node/drecji/'),
-    models.Node(None, 'regenta-15', 'regenta-15', 46.6537665633, 16.1639356613, 'https://nodes.wlan-si.net/node/regenta-15/'),
-    models.Node(None, 'zubina-7', 'zubina 7', 45.9474377, 14.9148863, 'https://nodes.wlan-si.net/node/zubina-7/'),
-    models.Node(None, 'maliokic-36home', 'mali okič 36', 46.3212454418, 15.9696521773, 'https://nodes.wlan-si.net/node/maliokic-36home/'),
-    models.Node(None, 'zaloska-povodni-moz-ii', 'zaloska-povodni-moz-ii', 46.0531874388, 14.5251166821, 'https://nodes.wlan-si.net/node/zaloska-povodni-moz-ii/'),
-    models.Node(None, 'scedno-mit', 'scedno-mit', 45.9804975959, 13.595414579, 'https://nodes.wlan-si.net/node/scedno-mit/'),
-    models.Node(None, 'nm-stranska-vas', 'Stranska vas 36a, 8000 Novo mesto', 45.7623960984, 15.1724785566, 'https://nodes.wlan-si.net/node/nm-stranska-vas/'),
-    models.Node(None, 'serncevaulica-12', 'sernčeva ulica 12', 46.5652080507, 15.6377452612, 'https://nodes.wlan-si.net/node/serncevaulica-12/'),
-    models.Node(None, 'zitna-12', 'Zitna 12', 46.548767294, 15.6430077553, 'https://nodes.wlan-si.net/node/zitna-12/'),
-    models.Node(None, 'beograjska-31', 'Beograjska 31, Maribor', 46.5436894614, 15.6401136518, 'https://nodes.wlan-si.net/node/beograjska-31/'),
-    models.Node(None, 'martinakrpana-5', 'Martina Krpana 5', 46.0726500679, 14.4833278656, 'https://nodes.wlan-si.net/node/martinakrpana-5/'),
-    models.Node(None, 'lotmerk-hotel-1', 'Glavni trg 15, Ljutomer', 46.5179852193, 16.1968973279, 'https://nodes.wlan-si.net/node/lotmerk-hotel-1/'),
-    models.Node(None, 'blejskadobrava16f', 'Blejska Dobrava', 46.4111443788, 14.0959525108, 'https://nodes.wlan-si.net/node/blejskadobrava16f/'),
-    models.Node(None, 's50rm', 'Aškerčeva 24', 46.5644644, 15.6542585, 'https://nodes.wlan-si.net/node/s50rm/'),
-    models.Node(None, 'oplotnica', 'partizanska cesta', 46.3906983456, 15.4513878829, 'https://nodes.wlan-si.net/node/oplotnica/'),
-    models.Node(None, 'metelkovamesto-2', 'Masarykova 24', 46.0564529058, 14.5171035826, 'https://nodes.wlan-si.net/node/metelkovamesto-2/'),
-    models.Node(None, 'lavriceva-16', 'Lavričeva 16', 46.5583682, 15.6357111, 'https://nodes.wlan-si.net/node/lavriceva-16/'),
-    models.Node(None, 'bukovje-t', 'Bukovje', 45.9697429836, 13.5894870758, 'https://nodes.wlan-si.net/node/bukovje-t/'),
-    models.Node(None, 'partizanskamaribor-57', 'partizanska 57 maribor', 46.5631379, 15.6577792, 'https://nodes.wlan-si.net/node/partizanskamaribor-57/'),
-    models.Node(None, 'tocka1-crnomelj', 'Ulica pod gozdom 25, Črnomelj', 45.58183, 15.1925, 'https://nodes.wlan-si.net/node/tocka1-crnomelj/'),
-    models.Node(None, 'kozarcan', 'kozarcan', 46.3418071032, 15.9740291836, 'https://nodes.wlan-si.net/node/kozarcan/'),
-    models.Node(None, 'tehnoloskipark-21', 'tehnološki park 21', 46.049445099, 14.4601750374, 'https://nodes.wlan-si.net/node/tehnoloskipark-21/'),
-    models.Node(None, 'smarnagora-4-ii', 'Gostilna Ledinek, Šmarna gora', 46.129584639, 14.4638335705, 'https://nodes.wlan-si.net/node/smarnagora-4-ii/'),
-    models.Node(None, 'scedno-nem', 'scedno-nem', 45.9697523669, 13.5981220008, 'https://nodes.wlan-si.net/node/scedno-nem/'),
-    models.Node(None, 'pohorje-s55umx', 'rače', 46.5164851056, 15.5919599533, 'https://nodes.wlan-si.net/node/pohorje-s55umx/'),
-    models.Node(None, 'slatina-78', 'Slatina 78', 46.3424783932, 15.9705684189, 'https://nodes.wlan-si.net/node/slatina-78/'),
-    models.Node(None, 'uklanci-j', 'uklanci-j', 45.97183611, 13.5785059333, 'https://nodes.wlan-si.net/node/uklanci-j/'),
-    models.Node(None, 'seljakovo-naselje', 'Seljakovo naselje 50', 46.2285319, 14.3416032, 'https://nodes.wlan-si.net/node/seljakovo-naselje/'),
-    models.Node(None, 'pohorje-s55umx-link', 'Pohorje nad Lukejom', 46.5164555735, 15.5926465988, 'https://nodes.wlan-si.net/node/pohorje-s55umx-link/'),
-    models.Node(None, 'korenjak-17', 'korenjak 17', 46.3384786767, 16.0336861614, 'https://nodes.wlan-si.net/node/korenjak-17/'),
-    models.Node(None, 'urban-link-slatina', 'Sveti Urban nad Mariborom', 46.6037195521, 15.603646338, 'https://nodes.wlan-si.net/node/urban-link-slatina/'),
-    models.Node(None, 'lizikejancar-6', 'Lizike Jančar 6', 46.5650568347, 15.6304764748, 'https://nodes.wlan-si.net/node/lizikejancar-6/'),
-    models.Node(None, 'sobetinci-25', 'Sobetinci 25', 46.4038612471, 15.9714657068, 'https://nodes.wlan-si.net/node/sobetinci-25/'),
-]
\ No newline at end of file
+    models.NodeData('pekarna-1', 'Ob železnici 16', 46.5507723961, 15.6441316009, 'https://nodes.wlan-si.net/node/pekarna-1/'),
+    models.NodeData('tdk-13', 'Trg Dušana Kvedra 13', 46.5354454118, 15.6331425905, 'https://nodes.wlan-si.net/node/tdk-13/'),
+    models.NodeData('postaja-5', 'postaja-5', 45.8640653, 15.0928333, 'https://nodes.wlan-si.net/node/postaja-5/'),
+    models.NodeData('pestike-22c', 'pestike22c', 46.3486240538, 16.0341539397, 'https://nodes.wlan-si.net/node/pestike-22c/'),
+    models.NodeData('brilejeva-9', 'Brilejeva 9', 46.0856069557, 14.4722664356, 'https://nodes.wlan-si.net/node/brilejeva-9/'),
+    models.NodeData('urban-1', 'Urban nad Mariborom', 46.6037895779, 15.6035497785, 'https://nodes.wlan-si.net/node/urban-1/'),
+    models.NodeData('slatina-59', 'slatina-59', 46.3425, 15.9647, 'https://nodes.wlan-si.net/node/slatina-59/'),
+    models.NodeData('vareja-mde', 'vareja 2a', 46.3657127, 15.9309187, 'https://nodes.wlan-si.net/node/vareja-mde/'),
+    models.NodeData('slatina-77-vzhod', 'Slatina 77', 46.3415599652, 15.9706113342, 'https://nodes.wlan-si.net/node/slatina-77-vzhod/'),
+    models.NodeData('gruskovec-44', 'gruskovec 44', 46.3414515801, 16.0151528122, 'https://nodes.wlan-si.net/node/gruskovec-44/'),
+    models.NodeData('gruskovec-46', 'gruskovec 46', 46.3424833311, 16.0161323554, 'https://nodes.wlan-si.net/node/gruskovec-46/'),
+    models.NodeData('rozmanova-12-i', 'Rozmanova 12', 46.0537441268, 14.5170834661, 'https://nodes.wlan-si.net/node/rozmanova-12-i/'),
+    models.NodeData('fri', 'Tržaška 25', 46.0445688554, 14.4893038273, 'https://nodes.wlan-si.net/node/fri/'),
+    models.NodeData('bukovje-f', 'bukovje-f', 45.9682882378, 13.5914518833, 'https://nodes.wlan-si.net/node/bukovje-f/'),
+    models.NodeData('bezena-111', 'Bezena 111', 46.527557007, 15.6675767899, 'https://nodes.wlan-si.net/node/bezena-111/'),
+    models.NodeData('rozmanova-2-ii', 'Rozmanova 2', 46.0524842492, 14.5169761777, 'https://nodes.wlan-si.net/node/rozmanova-2-ii/'),
+    models.NodeData('slatina77-jug', 'slatina-77', 46.3414710848, 15.9701607231, 'https://nodes.wlan-si.net/node/slatina77-jug/'),
+    models.NodeData('hladilniska-26', 'hladilniška', 46.062824, 14.609134, 'https://nodes.wlan-si.net/node/hladilniska-26/'),
+    models.NodeData('krizisce-e', 'krizisce-e', 45.9653095871, 13.5774114133, 'https://nodes.wlan-si.net/node/krizisce-e/'),
+    models.NodeData('pekarna-2', 'Ob železnici 16', 46.5509310302, 15.6441396475, 'https://nodes.wlan-si.net/node/pekarna-2/'),
+    models.NodeData('levstikovtrg-7', 'Levstikov trg 7', 46.0462088801, 14.5065236092, 'https://nodes.wlan-si.net/node/levstikovtrg-7/'),
+    models.NodeData('trzaska-12', 'Tržaška 12', 46.04639728, 14.4907951355, 'https://nodes.wlan-si.net/node/trzaska-12/'),
+    models.NodeData('slatina-81', 'slatina-81', 46.3435114823, 15.96774745, 'https://nodes.wlan-si.net/node/slatina-81/'),
+    models.NodeData('podgorci-novi', 'podgorci', 46.425638455, 16.064441085, 'https://nodes.wlan-si.net/node/podgorci-novi/'),
+    models.NodeData('kumrovska-9', 'Kumrovška 9', 46.084484, 14.51119, 'https://nodes.wlan-si.net/node/kumrovska-9/'),
+    models.NodeData('grintovska-22', 'Grintovška 22', 46.0817374492, 14.5109680295, 'https://nodes.wlan-si.net/node/grintovska-22/'),
+    models.NodeData('infohit-test-1', 'Leskoškova 10, Ljubljana', 46.0661109314, 14.5570081472, 'https://nodes.wlan-si.net/node/infohit-test-1/'),
+    models.NodeData('slatina-link-urban', 'Slatina 77 ', 46.3419668405, 15.9701514244, 'https://nodes.wlan-si.net/node/slatina-link-urban/'),
+    models.NodeData('gruskovec-17', 'gruskovec-17', 46.3392443239, 16.0050033333, 'https://nodes.wlan-si.net/node/gruskovec-17/'),
+    models.NodeData('ilirska-6', 'Ilirska 6', 46.0526592873, 14.5144790411, 'https://nodes.wlan-si.net/node/ilirska-6/'),
+    models.NodeData('podgorci-streha', 'podgorci', 46.4256532457, 16.0642265083, 'https://nodes.wlan-si.net/node/podgorci-streha/'),
+    models.NodeData('vojkova-77-ii', 'Vojkova 77', 46.0778304592, 14.5192050934, 'https://nodes.wlan-si.net/node/vojkova-77-ii/'),
+    models.NodeData('kunaverjeva-8', 'Kunaverjeva 8', 46.0792753794, 14.4771829247, 'https://nodes.wlan-si.net/node/kunaverjeva-8/'),
+    models.NodeData('gradisca', 'gradisca', 46.3598394488, 15.9659825565, 'https://nodes.wlan-si.net/node/gradisca/'),
+    models.NodeData('korenjak17a-omni', 'korenjak 17a', 46.3375554907, 16.0327802898, 'https://nodes.wlan-si.net/node/korenjak17a-omni/'),
+    models.NodeData('maliokic-41-omni', 'maliokic-41', 46.3219434112, 15.9727141861, 'https://nodes.wlan-si.net/node/maliokic-41-omni/'),
+    models.NodeData('neubergerjeva-3', 'Neubergerjeva 3', 46.06061819, 14.5163968205, 'https://nodes.wlan-si.net/node/neubergerjeva-3/'),
+    models.NodeData('m5-korenjak17a', 'korenjak 17a', 46.3378369664, 16.0327427389, 'https://nodes.wlan-si.net/node/m5-korenjak17a/'),
+    models.NodeData('morjea-49', 'Morje 49/a', 46.4440677866, 15.6169024855, 'https://nodes.wlan-si.net/node/morjea-49/'),
+    models.NodeData('maliokic-41', 'mali okic 41', 46.3219469924, 15.9722321035, 'https://nodes.wlan-si.net/node/maliokic-41/'),
+    models.NodeData('privoz-17b', 'Privoz 17b', 46.0403525249, 14.5112013817, 'https://nodes.wlan-si.net/node/privoz-17b/'),
+    models.NodeData('jadranska-2', 'Jadranska 2', 46.044419, 14.487786, 'https://nodes.wlan-si.net/node/jadranska-2/'),
+    models.NodeData('brezovec-83a', 'brezovec 83a', 46.336132534, 16.0241575248, 'https://nodes.wlan-si.net/node/brezovec-83a/'),
+    models.NodeData('slatina-40', 'slatina-40', 46.3241311141, 15.9708352096, 'https://nodes.wlan-si.net/node/slatina-40/'),
+    models.NodeData('ascevi-luwa', 'Števerjan, Italija', 45.9683992252, 13.5797295556, 'https://nodes.wlan-si.net/node/ascevi-luwa/'),
+    models.NodeData('moravce1', 'Vegova 21', 46.1375899401, 14.7458195686, 'https://nodes.wlan-si.net/node/moravce1/'),
+    models.NodeData('slatina-4a', 'slatina 4a', 46.332011, 15.9741758, 'https://nodes.wlan-si.net/node/slatina-4a/'),
+    models.NodeData('slatina-13', 'slatina-13', 46.3287892614, 15.9754607681, 'https://nodes.wlan-si.net/node/slatina-13/'),
+    models.NodeData('m5-gradisca-slatina', 'gradisca', 46.3595210645, 15.965757251, 'https://nodes.wlan-si.net/node/m5-gradisca-slatina/'),
+    models.NodeData('sd-cirkulane', 'cirkulane', 46.3423922296, 15.9930889608, 'https://nodes.wlan-si.net/node/sd-cirkulane/'),
+    models.NodeData('rozmanova-3', 'Rozmanova 3', 46.0518141849, 14.5164906979, 'https://nodes.wlan-si.net/node/rozmanova-3/'),
+    models.NodeData('glinska-9', 'Glinška 9', 46.0464268183, 14.4898295403, 'https://nodes.wlan-si.net/node/glinska-9/'),
+    models.NodeData('sadez-3', 'sadež 3', 45.57784, 15.19215, 'https://nodes.wlan-si.net/node/sadez-3/'),
+    models.NodeData('maliokic-17', 'maliokic-17', 46.333222061, 15.9650062324, 'https://nodes.wlan-si.net/node/maliokic-17/'),
+    models.NodeData('zaloska-povodni-moz', 'zaloska-povodni-moz', 46.0531849569, 14.5252869129, 'https://nodes.wlan-si.net/node/zaloska-povodni-moz/'),
+    models.NodeData('slatina77-zahod', 'slatina-77', 46.3419922705, 15.9696732761, 'https://nodes.wlan-si.net/node/slatina77-zahod/'),
+    models.NodeData('trubarjeva-81-ii', 'Trubarjeva 81', 46.0524477337, 14.515726313, 'https://nodes.wlan-si.net/node/trubarjeva-81-ii/'),
+    models.NodeData('pristava-34', 'pristava-34', 46.3469377938, 15.9699954987, 'https://nodes.wlan-si.net/node/pristava-34/'),
+    models.NodeData('trubarjeva-81-i', 'Trubarjeva 81', 46.0523351003, 14.5158778578, 'https://nodes.wlan-si.net/node/trubarjeva-81-i/'),
+    models.NodeData('scopolijeva-17', 'Scopolijeva 17', 46.0697697673, 14.4870400429, 'https://nodes.wlan-si.net/node/scopolijeva-17/'),
+    models.NodeData('hrvatskitrg-2', 'Hrvatski trg 2', 46.0524448485, 14.5178934932, 'https://nodes.wlan-si.net/node/hrvatskitrg-2/'),
+    models.NodeData('ljudmila-1', 'Rimska 8', 46.0475884167, 14.5007756352, 'https://nodes.wlan-si.net/node/ljudmila-1/'),
+    models.NodeData('agrokombinatska-6', 'agrokombinatska cesta 6', 46.062457, 14.613511, 'https://nodes.wlan-si.net/node/agrokombinatska-6/'),
+    models.NodeData('adam-in-eva', 'V zavoju 40 B', 46.5751049, 15.6674145, 'https://nodes.wlan-si.net/node/adam-in-eva/'),
+    models.NodeData('scedno-marj', 'scedno-marj', 45.9711114413, 13.5973012445, 'https://nodes.wlan-si.net/node/scedno-marj/'),
+    models.NodeData('belacerkev-17', 'bela cerkev, slovenija', 45.867571, 15.276103, 'https://nodes.wlan-si.net/node/belacerkev-17/'),
+    models.NodeData('pongrce-35', 'pongrce 35', 46.400313651, 15.7034540176, 'https://nodes.wlan-si.net/node/pongrce-35/'),
+    models.NodeData('scedno-sta', 'Števerjan, Italija', 45.967146413, 13.5981831537, 'https://nodes.wlan-si.net/node/scedno-sta/'),
+    models.NodeData('eipprova-19', 'Eipprova 19', 46.042880376, 14.5035436749, 'https://nodes.wlan-si.net/node/eipprova-19/'),
+    models.NodeData('odrga-6', 'Odrga 6', 45.903516, 15.013327, 'https://nodes.wlan-si.net/node/odrga-6/'),
+    models.NodeData('najami-9', 'Na jami 9', 46.0654223602, 14.4924527407, 'https://nodes.wlan-si.net/node/najami-9/'),
+    models.NodeData('ribniska-14', 'Ribniška 14', 46.058069, 14.531145, 'https://nodes.wlan-si.net/node/ribniska-14/'),
+    models.NodeData('trebinjska-4-i', 'Trebinjska 4', 46.0793969971, 14.5186927915, 'https://nodes.wlan-si.net/node/trebinjska-4-i/'),
+    models.NodeData('vogljevogljanskacesta-50', 'voglje vogljanska cesta 50', 46.2148526006, 14.4300270081, 'https://nodes.wlan-si.net/node/vogljevogljanskacesta-50/'),
+    models.NodeData('ziherlova-41', 'Ziherlova 41', 46.0417904825, 14.5059603453, 'https://nodes.wlan-si.net/node/ziherlova-41/'),
+    models.NodeData('pristava-26c', 'Pristava-26c', 46.3394770285, 15.9789537193, 'https://nodes.wlan-si.net/node/pristava-26c/'),
+    models.NodeData('osojna-pot-3', 'Osojna pot 3', 46.0472893784, 14.5090556145, 'https://nodes.wlan-si.net/node/osojna-pot-3/'),
+    models.NodeData('maliokic-36', 'mali okic 36', 46.3212454418, 15.9696521773, 'https://nodes.wlan-si.net/node/maliokic-36/'),
+    models.NodeData('napodrtem-18', 'Na podrtem 18', 46.5334046852, 15.6854376197, 'https://nodes.wlan-si.net/node/napodrtem-18/'),
+    models.NodeData('zafara-3', 'Zafara 3, Zuzemberk', 45.8329856002, 14.9401187897, 'https://nodes.wlan-si.net/node/zafara-3/'),
+    models.NodeData('peruzzijeva-14', 'Peruzzijeva 14', 46.0289418711, 14.5313072205, 'https://nodes.wlan-si.net/node/peruzzijeva-14/'),
+    models.NodeData('s56lsb', 'Sentjernejska cesta 17', 45.8016599, 15.1833667, 'https://nodes.wlan-si.net/node/s56lsb/'),
+    models.NodeData('tbilisijska-118-c', 'Tbilisijska 118', 46.0358354689, 14.4759839773, 'https://nodes.wlan-si.net/node/tbilisijska-118-c/'),
+    models.NodeData('stantetova-14', 'Stantetova 14', 46.5430264266, 15.626270771, 'https://nodes.wlan-si.net/node/stantetova-14/'),
+    models.NodeData('kolodvorska-2', 'kolodvorska 2', 45.7051678083, 13.8632333279, 'https://nodes.wlan-si.net/node/kolodvorska-2/'),
+    models.NodeData('cigaletova-15', 'Cigaletova 15', 46.0568985032, 14.506829381, 'https://nodes.wlan-si.net/node/cigaletova-15/'),
+    models.NodeData('brezovec-80', 'brezovec ', 46.3416661295, 16.0207843746, 'https://nodes.wlan-si.net/node/brezovec-80/'),
+    models.NodeData('metelkovamesto-1', 'Masarykova 24', 46.0564095992, 14.5172631741, 'https://nodes.wlan-si.net/node/metelkovamesto-1/'),
+    models.NodeData('lizikejancar-6-ii', 'ul lizike jancar 6', 46.5649152079, 15.6308841705, 'https://nodes.wlan-si.net/node/lizikejancar-6-ii/'),
+    models.NodeData('rozmanova-12-ii', 'Rozmanova 12', 46.0538252221, 14.5170432329, 'https://nodes.wlan-si.net/node/rozmanova-12-ii/'),
+    models.NodeData('trebinjska-4-ii', 'Trebinjska 4', 46.0793988577, 14.5186927915, 'https://nodes.wlan-si.net/node/trebinjska-4-ii/'),
+    models.NodeData('spodnjapolskava-113', 'Spodnja polskava 113', 46.4119268, 15.6373409, 'https://nodes.wlan-si.net/node/spodnjapolskava-113/'),
+    models.NodeData('volodjeva-19', 'Volodjeva 19, Maribor', 46.5303227846, 15.6675714254, 'https://nodes.wlan-si.net/node/volodjeva-19/'),
+    models.NodeData('mose-pijade-8', '8, moše pijade, črnomelj', 45.57894, 15.18578, 'https://nodes.wlan-si.net/node/mose-pijade-8/'),
+    models.NodeData('jama-36a', 'Jama 36a', 46.202466187, 14.3959679618, 'https://nodes.wlan-si.net/node/jama-36a/'),
+    models.NodeData('maliokic-4', 'maliokic-4', 46.3403266068, 15.9648935797, 'https://nodes.wlan-si.net/node/maliokic-4/'),
+    models.NodeData('rozmanova-2-i', 'Rozmanova 2', 46.0524284677, 14.5169091225, 'https://nodes.wlan-si.net/node/rozmanova-2-i/'),
+    models.NodeData('gerbiceva-49', 'Gerbičeva 49', 46.0397644225, 14.4891268015, 'https://nodes.wlan-si.net/node/gerbiceva-49/'),
+    models.NodeData('spodnjiporcic-92', 'Spodnji Porčič 92', 46.5944253, 15.8536714, 'https://nodes.wlan-si.net/node/spodnjiporcic-92/'),
+    models.NodeData('tbilisijska-118', 'tbilisijska-118', 46.0358205728, 14.4759786129, 'https://nodes.wlan-si.net/node/tbilisijska-118/'),
+    models.NodeData('bavarska-4', 'Bavarska 4, Maribor', 46.5597979426, 15.6458079815, 'https://nodes.wlan-si.net/node/bavarska-4/'),
+    models.NodeData('zabukovica-129', 'Zabukovica 129', 46.5343032786, 15.8127593994, 'https://nodes.wlan-si.net/node/zabukovica-129/'),
+    models.NodeData('veljkavlahovica-62', 'Veljka Vlahovića 62', 46.5511205, 15.6765677, 'https://nodes.wlan-si.net/node/veljkavlahovica-62/'),
+    models.NodeData('zaloska-78a-i', 'Zaloška 78a', 46.055387912, 14.5419528187, 'https://nodes.wlan-si.net/node/zaloska-78a-i/'),
+    models.NodeData('mozirje-krajnikovo', 'Mozirje Krajnikovo', 46.3428467475, 14.9543344975, 'https://nodes.wlan-si.net/node/mozirje-krajnikovo/'),
+    models.NodeData('neubergerjeva-16', 'Neubergerjeva 16', 46.0627878, 14.5163637, 'https://nodes.wlan-si.net/node/neubergerjeva-16/'),
+    models.NodeData('trebinjska-4-iii', 'Trebinjska 4', 46.0793988577, 14.5185345411, 'https://nodes.wlan-si.net/node/trebinjska-4-iii/'),
+    models.NodeData('marmeljad', 'Šentrupert', 45.9797865849, 15.1007080078, 'https://nodes.wlan-si.net/node/marmeljad/'),
+    models.NodeData('cigaletova-10', 'Cigaletova 10', 46.0570011, 14.5070264, 'https://nodes.wlan-si.net/node/cigaletova-10/'),
+    models.NodeData('dvorje', 'Dvorje, Cerklje na Gorenjskem', 46.260814, 14.4878189, 'https://nodes.wlan-si.net/node/dvorje/'),
+    models.NodeData('podgozdom-25', 'Ulica pod gozdom, Črnomelj', 45.5828735162, 15.1923828722, 'https://nodes.wlan-si.net/node/podgozdom-25/'),
+    models.NodeData('tovarnarog-3', 'Trubarjeva 72', 46.0518566265, 14.5155519247, 'https://nodes.wlan-si.net/node/tovarnarog-3/'),
+    models.NodeData('verje', 'Medvode', 46.1467779943, 14.4203710556, 'https://nodes.wlan-si.net/node/verje/'),
+    models.NodeData('slatina-28home', 'slatina 28', 46.325188629, 15.9763083461, 'https://nodes.wlan-si.net/node/slatina-28home/'),
+    models.NodeData('trubarjeva-51a', 'Trubarjeva 51a', 46.0527320078, 14.5121535659, 'https://nodes.wlan-si.net/node/trubarjeva-51a/'),
+    models.NodeData('uklanci-s', 'uklanci-s', 45.9722019827, 13.5781016348, 'https://nodes.wlan-si.net/node/uklanci-s/'),
+    models.NodeData('gubcevaptuj-23', 'GUBČEVA 23 PTUJ', 46.4154198527, 15.8476817608, 'https://nodes.wlan-si.net/node/gubcevaptuj-23/'),
+    models.NodeData('pristava-40', 'pristava 40b', 46.3470177, 15.9820304, 'https://nodes.wlan-si.net/node/pristava-40/'),
+    models.NodeData('velikacolnarska-9-ii', 'Velika čolnarska 9', 46.039579165, 14.5084601641, 'https://nodes.wlan-si.net/node/velikacolnarska-9-ii/'),
+    models.NodeData('kozarska-19', 'Kozarška 19', 46.041004296, 14.4502750039, 'https://nodes.wlan-si.net/node/kozarska-19/'),
+    models.NodeData('podkraj-19c', 'Podkraj pri Velenju', 46.3550291836, 15.0979399681, 'https://nodes.wlan-si.net/node/podkraj-19c/'),
+    models.NodeData('obrezna-1', 'obrežna ulica 1', 46.5575914022, 15.6280946732, 'https://nodes.wlan-si.net/node/obrezna-1/'),
+    models.NodeData('sketova-6', 'Sketova 6', 46.0577285137, 14.5254144073, 'https://nodes.wlan-si.net/node/sketova-6/'),
+    models.NodeData('zlatolicje-33', 'zlatolicje 33', 46.4544383953, 15.7805728912, 'https://nodes.wlan-si.net/node/zlatolicje-33/'),
+    models.NodeData('mire-miheliceve', 'mire-miheliceve', 46.0554417671, 14.5483703167, 'https://nodes.wlan-si.net/node/mire-miheliceve/'),
+    models.NodeData('naklo', 'naklo', 46.2734009, 14.317259, 'https://nodes.wlan-si.net/node/naklo/'),
+    models.NodeData('testna', 'cestavkresnice', 46.0718015498, 14.635848999, 'https://nodes.wlan-si.net/node/testna/'),
+    models.NodeData('hrastje-5a', 'hrastje 5a', 45.8145765, 15.299317, 'https://nodes.wlan-si.net/node/hrastje-5a/'),
+    models.NodeData('s53w', 'kurirčkova 45', 46.5067925724, 15.6934440136, 'https://nodes.wlan-si.net/node/s53w/'),
+    models.NodeData('ptujskagora', 'Ptujska Gora', 46.5363539, 15.6594465, 'https://nodes.wlan-si.net/node/ptujskagora/'),
+    models.NodeData('koroska-cesta-1-do-spet-2011', 'Koroška cesta 1', 46.5574290988, 15.6441664696, 'https://nodes.wlan-si.net/node/koroska-cesta-1-do-spet-2011/'),
+    models.NodeData('mercnikova-1a', 'Merčnikova 1a', 46.0412700418, 14.476954937, 'https://nodes.wlan-si.net/node/mercnikova-1a/'),
+    models.NodeData('rospoh-25a', 'Rošpoh', 46.5866329442, 15.6347304583, 'https://nodes.wlan-si.net/node/rospoh-25a/'),
+    models.NodeData('cecovje-27', 'JN76LM', 46.5404967105, 14.9633038044, 'https://nodes.wlan-si.net/node/cecovje-27/'),
+    models.NodeData('polana1423', 'Murska Sobota - Polana', 46.6795944656, 16.1385726929, 'https://nodes.wlan-si.net/node/polana1423/'),
+    models.NodeData('podgozd-5', 'Novo mesto', 45.7943396305, 15.1940917969, 'https://nodes.wlan-si.net/node/podgozd-5/'),
+    models.NodeData('m5-test-nanobrige', 'haloze', 46.3616709851, 16.0131711967, 'https://nodes.wlan-si.net/node/m5-test-nanobrige/'),
+    models.NodeData('slatina-74', 'slatina-74', 46.3418145099, 15.9727739097, 'https://nodes.wlan-si.net/node/slatina-74/'),
+    models.NodeData('gradisca-123', 'gradisca', 46.357157, 15.9710645, 'https://nodes.wlan-si.net/node/gradisca-123/'),
+    models.NodeData('obgozdu-14', 'Ob gozdu 14', 46.4722857725, 15.651140213, 'https://nodes.wlan-si.net/node/obgozdu-14/'),
+    models.NodeData('velikacolnarska-9-i', 'Velika čolnarska 9', 46.039579165, 14.5084601641, 'https://nodes.wlan-si.net/node/velikacolnarska-9-i/'),
+    models.NodeData('bezjakova-101', 'bezjakova101', 46.5403125855, 15.5897176266, 'https://nodes.wlan-si.net/node/bezjakova-101/'),
+    models.NodeData('lili-novy-17-c', 'lili novy', 46.0349603164, 14.4516777992, 'https://nodes.wlan-si.net/node/lili-novy-17-c/'),
+    models.NodeData('obgozdu-20', 'Ob gozdu 20', 46.5468783353, 15.6598198414, 'https://nodes.wlan-si.net/node/obgozdu-20/'),
+    models.NodeData('lili-novy-17', 'lili-novy-17', 46.0350422461, 14.4516670704, 'https://nodes.wlan-si.net/node/lili-novy-17/'),
+    models.NodeData('strazaprioplotnici', 'Straža pri Oplotnici', 46.3804443303, 15.4776334763, 'https://nodes.wlan-si.net/node/strazaprioplotnici/'),
+    models.NodeData('test-novi-fw-v4', 'stojnci ', 46.3806636598, 15.9721301796, 'https://nodes.wlan-si.net/node/test-novi-fw-v4/'),
+    models.NodeData('staracesta-52', 'Stara cesta 52', 46.4965606332, 15.6380081177, 'https://nodes.wlan-si.net/node/staracesta-52/'),
+    models.NodeData('ljubljanskacesta-112', 'ljubljanska cesta 112', 45.8342017, 15.1561234, 'https://nodes.wlan-si.net/node/ljubljanskacesta-112/'),
+    models.NodeData('stefanova-15-ii', 'Štefanova 15', 46.0537786249, 14.5022857189, 'https://nodes.wlan-si.net/node/stefanova-15-ii/'),
+    models.NodeData('sernceva-12-2', 'sernčeva ulica 12', 46.5652080507, 15.6377452612, 'https://nodes.wlan-si.net/node/sernceva-12-2/'),
+    models.NodeData('roznadolina-ii-13', 'Rožna dolina cesta II/13, Ljubljana', 46.0462943304, 14.4837637246, 'https://nodes.wlan-si.net/node/roznadolina-ii-13/'),
+    models.NodeData('segova-28', 'Šegova 28', 45.7979958, 15.1577231, 'https://nodes.wlan-si.net/node/segova-28/'),
+    models.NodeData('tovarnarog-2', 'Trubarjeva 72', 46.052104574, 14.5151549578, 'https://nodes.wlan-si.net/node/tovarnarog-2/'),
+    models.NodeData('kiberpipa', 'Kersnikova 4', 46.0557268633, 14.5040345192, 'https://nodes.wlan-si.net/node/kiberpipa/'),
+    models.NodeData('gradenje-17', 'Gradenje 17', 45.8728451, 15.2600253, 'https://nodes.wlan-si.net/node/gradenje-17/'),
+    models.NodeData('luksy', 'Trniče 45b', 46.4500403171, 15.7422494888, 'https://nodes.wlan-si.net/node/luksy/'),
+    models.NodeData('kidriceva-11', 'Kidričeva 11', 45.7053491263, 13.8668167591, 'https://nodes.wlan-si.net/node/kidriceva-11/'),
+    models.NodeData('stefanova-15-i', 'Štefanova 15', 46.0537786249, 14.5022857189, 'https://nodes.wlan-si.net/node/stefanova-15-i/'),
+    models.NodeData('tic-vipava', 'Vipava', 45.8462639586, 13.9622336626, 'https://nodes.wlan-si.net/node/tic-vipava/'),
+    models.NodeData('bratovbabnik-24', 'Ulica bratov Babnik 24', 46.0758356159, 14.4641876221, 'https://nodes.wlan-si.net/node/bratovbabnik-24/'),
+    models.NodeData('trebinjska-4-iv', 'Trebinjska 4', 46.0793876944, 14.518455416, 'https://nodes.wlan-si.net/node/trebinjska-4-iv/'),
+    models.NodeData('osjakobaaljaza', 'Kranj', 46.2564481643, 14.3501129374, 'https://nodes.wlan-si.net/node/osjakobaaljaza/'),
+    models.NodeData('vojkova-77-i', 'Vojkova 77', 46.0777707961, 14.519162178, 'https://nodes.wlan-si.net/node/vojkova-77-i/'),
+    models.NodeData('ljubljanska-55a', 'Ljubljanska 55a', 46.4514499583, 15.668335855, 'https://nodes.wlan-si.net/node/ljubljanska-55a/'),
+    models.NodeData('dunajska-33', 'Dunajska 33', 46.0616778718, 14.5071029663, 'https://nodes.wlan-si.net/node/dunajska-33/'),
+    models.NodeData('scopolijeva-53', 'Scopolijeva-53', 46.0690108, 14.4858541, 'https://nodes.wlan-si.net/node/scopolijeva-53/'),
+    models.NodeData('tr3', 'Trg republike 3', 46.0469247457, 14.5066709525, 'https://nodes.wlan-si.net/node/tr3/'),
+    models.NodeData('nanoska-17', 'Nanoška 17', 46.0431824791, 14.4742298126, 'https://nodes.wlan-si.net/node/nanoska-17/'),
+    models.NodeData('staracesta-26', 'Stara Cesta 26', 46.2529387524, 14.4846582413, 'https://nodes.wlan-si.net/node/staracesta-26/'),
+    models.NodeData('solar', 'Trubarjeva 72', 46.0516205913, 14.5151442289, 'https://nodes.wlan-si.net/node/solar/'),
+    models.NodeData('slatina-54', 'slatina-54', 46.336, 15.96442, 'https://nodes.wlan-si.net/node/slatina-54/'),
+    models.NodeData('slatina-55', 'slatina-55', 46.3353925225, 15.9676884415, 'https://nodes.wlan-si.net/node/slatina-55/'),
+    models.NodeData('dravinjskivrh', 'Dravinjski Vrh', 46.4199885, 15.8699813, 'https://nodes.wlan-si.net/node/dravinjskivrh/'),
+    models.NodeData('kajuhova-ulica-2', 'Kajuhova ulica 2', 45.57661, 15.18575, 'https://nodes.wlan-si.net/node/kajuhova-ulica-2/'),
+    models.NodeData('stojnci-2222', 'stojnci', 46.3806044485, 15.9720979931, 'https://nodes.wlan-si.net/node/stojnci-2222/'),
+    models.NodeData('tovarnarog-1', 'Trubarjeva 72', 46.0521380803, 14.5148974657, 'https://nodes.wlan-si.net/node/tovarnarog-1/'),
+    models.NodeData('uklanci-d', 'Uklanci', 45.9723012797, 13.5747456551, 'https://nodes.wlan-si.net/node/uklanci-d/'),
+    models.NodeData('berta', 'K brodu 27', 46.5510693736, 15.7046985626, 'https://nodes.wlan-si.net/node/berta/'),
+    models.NodeData('m5-maliokic', 'mali okic', 46.3221915018, 15.9723715784, 'https://nodes.wlan-si.net/node/m5-maliokic/'),
+    models.NodeData('gregorciceva-21', 'Gregorčičeva 21b', 46.5611542, 15.6452967, 'https://nodes.wlan-si.net/node/gregorciceva-21/'),
+    models.NodeData('slatina-77', 'slatina-77', 46.3418414209, 15.9702680114, 'https://nodes.wlan-si.net/node/slatina-77/'),
+    models.NodeData('brezovec-28a', 'brezovec 28a', 46.3582209773, 16.015624881, 'https://nodes.wlan-si.net/node/brezovec-28a/'),
+    models.NodeData('maliokic-3', 'maliokic-3', 46.3397480009, 15.9649955036, 'https://nodes.wlan-si.net/node/maliokic-3/'),
+    models.NodeData('pristava-28', 'pristava-28', 46.3419478304, 15.9761642219, 'https://nodes.wlan-si.net/node/pristava-28/'),
+    models.NodeData('valerisce-r', 'valerisce-r', 45.967714656, 13.5766875744, 'https://nodes.wlan-si.net/node/valerisce-r/'),
+    models.NodeData('loke-pri-mozirju', 'Loke pri Mozirju 5a', 46.3330766199, 14.9720692635, 'https://nodes.wlan-si.net/node/loke-pri-mozirju/'),
+    models.NodeData('korenjak-17home', 'slatina 4a ', 46.3382549801, 16.033939363, 'https://nodes.wlan-si.net/node/korenjak-17home/'),
+    models.NodeData('devina-11a', 'Devina 11a ', 46.4036911, 15.571223, 'https://nodes.wlan-si.net/node/devina-11a/'),
+    models.NodeData('rusjanovtrg-2', 'Rusjanov trg 2', 46.0537441268, 14.5638021827, 'https://nodes.wlan-si.net/node/rusjanovtrg-2/'),
+    models.NodeData('devinska-1', 'Devinska ulica 1', 46.3972715, 15.581594, 'https://nodes.wlan-si.net/node/devinska-1/'),
+    models.NodeData('urban-uplink', 'Lizike Jančar 6', 46.5650568347, 15.6304764748, 'https://nodes.wlan-si.net/node/urban-uplink/'),
+    models.NodeData('urban-2', 'Sveti Urban nad Mariborom', 46.6037895779, 15.6035497785, 'https://nodes.wlan-si.net/node/urban-2/'),
+    models.NodeData('urban-jost', 'Jošt na Urbanu', 46.6038428343, 15.6051027775, 'https://nodes.wlan-si.net/node/urban-jost/'),
+    models.NodeData('druga', 'Trg Miloša Zidanška 1', 46.5492759, 15.6448708, 'https://nodes.wlan-si.net/node/druga/'),
+    models.NodeData('bukovje-mart', 'bukovje-mart', 45.969009308, 13.5898425132, 'https://nodes.wlan-si.net/node/bukovje-mart/'),
+    models.NodeData('m5-slatina77-omni', 'slatina77', 46.3423544548, 15.9704489715, 'https://nodes.wlan-si.net/node/m5-slatina77-omni/'),
+    models.NodeData('crnekova-12', 'crnekova 12 ', 46.5347395, 15.6349319, 'https://nodes.wlan-si.net/node/crnekova-12/'),
+    models.NodeData('ljudmila-2', 'Rimska 8', 46.0474878894, 14.5007327199, 'https://nodes.wlan-si.net/node/ljudmila-2/'),
+    models.NodeData('smarnagora-4-i', 'Gostilna Ledinek, Šmarna gora', 46.1297127136, 14.4637584686, 'https://nodes.wlan-si.net/node/smarnagora-4-i/'),
+    models.NodeData('vareja-nanostationm5', 'vareja ', 46.3661497346, 15.9321684844, 'https://nodes.wlan-si.net/node/vareja-nanostationm5/'),
+    models.NodeData('druga-link', 'Trg Miloša Zidanška 1  ', 46.5488639538, 15.6439197063, 'https://nodes.wlan-si.net/node/druga-link/'),
+    models.NodeData('cestaktamu-12-link', 'Cesta k Tamu 12 ', 46.5276175354, 15.6671905518, 'https://nodes.wlan-si.net/node/cestaktamu-12-link/'),
+    models.NodeData('laporje-50', 'laporje 50 slovenija', 46.3473719693, 15.5947065353, 'https://nodes.wlan-si.net/node/laporje-50/'),
+    models.NodeData('slatina-58', 'slatina-58', 46.3414820715, 15.9649150373, 'https://nodes.wlan-si.net/node/slatina-58/'),
+    models.NodeData('trg-svobode-3', 'trg-svobode-3', 45.570850287, 15.1927612424, 'https://nodes.wlan-si.net/node/trg-svobode-3/'),
+    models.NodeData('repisce-51', 'repisce-51', 46.344606765, 15.9610043766, 'https://nodes.wlan-si.net/node/repisce-51/'),
+    models.NodeData('valerisce', 'Števerjan, Italija', 45.9679766527, 13.5790586472, 'https://nodes.wlan-si.net/node/valerisce/'),
+    models.NodeData('brezovec-85', 'brezovec 85', 46.3365957459, 16.0338964476, 'https://nodes.wlan-si.net/node/brezovec-85/'),
+    models.NodeData('grm-7', 'Grm pri Podzemlju 7', 45.6163528121, 15.277366162, 'https://nodes.wlan-si.net/node/grm-7/'),
+    models.NodeData('krizisce-mu', 'Krizisce-mu', 45.9748395746, 13.5850775242, 'https://nodes.wlan-si.net/node/krizisce-mu/'),
+    models.NodeData('slatina77-sever', 'slatina77b', 46.3423302603, 15.9704825882, 'https://nodes.wlan-si.net/node/slatina77-sever/'),
+    models.NodeData('driver', 'Celovška 108', 46.0699320348, 14.4898447395, 'https://nodes.wlan-si.net/node/driver/'),
+    models.NodeData('bukovje-g', 'bukovje-g', 45.9707883139, 13.5879825353, 'https://nodes.wlan-si.net/node/bukovje-g/'),
+    models.NodeData('m5-podgorci', 'podgorci 6a', 46.4254544343, 16.0643713476, 'https://nodes.wlan-si.net/node/m5-podgorci/'),
+    models.NodeData('m5-gradisca-panel', 'gradisca', 46.3598690656, 15.9656070473, 'https://nodes.wlan-si.net/node/m5-gradisca-panel/'),
+    models.NodeData('scedno-zv', 'Scedno', 45.9807485972, 13.5944994094, 'https://nodes.wlan-si.net/node/scedno-zv/'),
+    models.NodeData('krizisce-m', 'krizisce-m', 45.9739000774, 13.5844445229, 'https://nodes.wlan-si.net/node/krizisce-m/'),
+    models.NodeData('urban-s59abc', 'urban', 46.6038221953, 15.6034451723, 'https://nodes.wlan-si.net/node/urban-s59abc/'),
+    models.NodeData('lomanose-44b', 'Lomanoše 44b', 46.6682870739, 15.9466552734, 'https://nodes.wlan-si.net/node/lomanose-44b/'),
+    models.NodeData('stojnci-20', 'stojnci', 46.3805304337, 15.9718297722, 'https://nodes.wlan-si.net/node/stojnci-20/'),
+    models.NodeData('smartno-sg', 'Šmartno pri Slovenj gradcu 17', 46.4942488567, 15.1069951057, 'https://nodes.wlan-si.net/node/smartno-sg/'),
+    models.NodeData('bukovje-st', 'bukovje-st', 45.9702347673, 13.5884406567, 'https://nodes.wlan-si.net/node/bukovje-st/'),
+    models.NodeData('mariborska-39', 'Ptuj', 46.4157615803, 15.8564016223, 'https://nodes.wlan-si.net/node/mariborska-39/'),
+    models.NodeData('beblerjevtrg-1', 'Beblerjev trg 1', 46.0707594922, 14.547239542, 'https://nodes.wlan-si.net/node/beblerjevtrg-1/'),
+    models.NodeData('tesna-tocka', 'Slovenska Bistrica', 46.3422191607, 15.5921516474, 'https://nodes.wlan-si.net/node/tesna-tocka/'),
+    models.NodeData('uklanci-m', 'uklanci-m', 45.9722935437, 13.5821539164, 'https://nodes.wlan-si.net/node/uklanci-m/'),
+    models.NodeData('brezovec-39', 'brezovec 39', 46.3471172048, 16.0176944698, 'https://nodes.wlan-si.net/node/brezovec-39/'),
+    models.NodeData('slatina-28', 'slatina 28', 46.325188629, 15.9763083461, 'https://nodes.wlan-si.net/node/slatina-28/'),
+    models.NodeData('zaloska-78a-ii', 'Zaloška 78a', 46.0554028028, 14.5419622064, 'https://nodes.wlan-si.net/node/zaloska-78a-ii/'),
+    models.NodeData('pestike-26b', 'pestike 26', 46.3508566038, 16.0394997604, 'https://nodes.wlan-si.net/node/pestike-26b/'),
+    models.NodeData('kolodvorska-34', 'Kolodvorska 34, Črnomelj', 45.575225217, 15.1905723811, 'https://nodes.wlan-si.net/node/kolodvorska-34/'),
+    models.NodeData('drecji', 'Drecji vrh', 45.9213222, 15.1701489, 'https://nodes.wlan-si.net/node/drecji/'),
+    models.NodeData('regenta-15', 'regenta-15', 46.6537665633, 16.1639356613, 'https://nodes.wlan-si.net/node/regenta-15/'),
+    models.NodeData('zubina-7', 'zubina 7', 45.9474377, 14.9148863, 'https://nodes.wlan-si.net/node/zubina-7/'),
+    models.NodeData('maliokic-36home', 'mali okič 36', 46.3212454418, 15.9696521773, 'https://nodes.wlan-si.net/node/maliokic-36home/'),
+    models.NodeData('zaloska-povodni-moz-ii', 'zaloska-povodni-moz-ii', 46.0531874388, 14.5251166821, 'https://nodes.wlan-si.net/node/zaloska-povodni-moz-ii/'),
+    models.NodeData('scedno-mit', 'scedno-mit', 45.9804975959, 13.595414579, 'https://nodes.wlan-si.net/node/scedno-mit/'),
+    models.NodeData('nm-stranska-vas', 'Stranska vas 36a, 8000 Novo mesto', 45.7623960984, 15.1724785566, 'https://nodes.wlan-si.net/node/nm-stranska-vas/'),
+    models.NodeData('serncevaulica-12', 'sernčeva ulica 12', 46.5652080507, 15.6377452612, 'https://nodes.wlan-si.net/node/serncevaulica-12/'),
+    models.NodeData('zitna-12', 'Zitna 12', 46.548767294, 15.6430077553, 'https://nodes.wlan-si.net/node/zitna-12/'),
+    models.NodeData('beograjska-31', 'Beograjska 31, Maribor', 46.5436894614, 15.6401136518, 'https://nodes.wlan-si.net/node/beograjska-31/'),
+    models.NodeData('martinakrpana-5', 'Martina Krpana 5', 46.0726500679, 14.4833278656, 'https://nodes.wlan-si.net/node/martinakrpana-5/'),
+    models.NodeData('lotmerk-hotel-1', 'Glavni trg 15, Ljutomer', 46.5179852193, 16.1968973279, 'https://nodes.wlan-si.net/node/lotmerk-hotel-1/'),
+    models.NodeData('blejskadobrava16f', 'Blejska Dobrava', 46.4111443788, 14.0959525108, 'https://nodes.wlan-si.net/node/blejskadobrava16f/'),
+    models.NodeData('s50rm', 'Aškerčeva 24', 46.5644644, 15.6542585, 'https://nodes.wlan-si.net/node/s50rm/'),
+    models.NodeData('oplotnica', 'partizanska cesta', 46.3906983456, 15.4513878829, 'https://nodes.wlan-si.net/node/oplotnica/'),
+    models.NodeData('metelkovamesto-2', 'Masarykova 24', 46.0564529058, 14.5171035826, 'https://nodes.wlan-si.net/node/metelkovamesto-2/'),
+    models.NodeData('lavriceva-16', 'Lavričeva 16', 46.5583682, 15.6357111, 'https://nodes.wlan-si.net/node/lavriceva-16/'),
+    models.NodeData('bukovje-t', 'Bukovje', 45.9697429836, 13.5894870758, 'https://nodes.wlan-si.net/node/bukovje-t/'),
+    models.NodeData('partizanskamaribor-57', 'partizanska 57 maribor', 46.5631379, 15.6577792, 'https://nodes.wlan-si.net/node/partizanskamaribor-57/'),
+    models.NodeData('tocka1-crnomelj', 'Ulica pod gozdom 25, Črnomelj', 45.58183, 15.1925, 'https://nodes.wlan-si.net/node/tocka1-crnomelj/'),
+    models.NodeData('kozarcan', 'kozarcan', 46.3418071032, 15.9740291836, 'https://nodes.wlan-si.net/node/kozarcan/'),
+    models.NodeData('tehnoloskipark-21', 'tehnološki park 21', 46.049445099, 14.4601750374, 'https://nodes.wlan-si.net/node/tehnoloskipark-21/'),
+    models.NodeData('smarnagora-4-ii', 'Gostilna Ledinek, Šmarna gora', 46.129584639, 14.4638335705, 'https://nodes.wlan-si.net/node/smarnagora-4-ii/'),
+    models.NodeData('scedno-nem', 'scedno-nem', 45.9697523669, 13.5981220008, 'https://nodes.wlan-si.net/node/scedno-nem/'),
+    models.NodeData('pohorje-s55umx', 'rače', 46.5164851056, 15.5919599533, 'https://nodes.wlan-si.net/node/pohorje-s55umx/'),
+    models.NodeData('slatina-78', 'Slatina 78', 46.3424783932, 15.9705684189, 'https://nodes.wlan-si.net/node/slatina-78/'),
+    models.NodeData('uklanci-j', 'uklanci-j', 45.97183611, 13.5785059333, 'https://nodes.wlan-si.net/node/uklanci-j/'),
+    models.NodeData('seljakovo-naselje', 'Seljakovo naselje 50', 46.2285319, 14.3416032, 'https://nodes.wlan-si.net/node/seljakovo-naselje/'),
+    models.NodeData('pohorje-s55umx-link', 'Pohorje nad Lukejom', 46.5164555735, 15.5926465988, 'https://nodes.wlan-si.net/node/pohorje-s55umx-link/'),
+    models.NodeData('korenjak-17', 'korenjak 17', 46.3384786767, 16.0336861614, 'https://nodes.wlan-si.net/node/korenjak-17/'),
+    models.NodeData('urban-link-slatina', 'Sveti Urban nad Mariborom', 46.6037195521, 15.603646338, 'https://nodes.wlan-si.net/node/urban-link-slatina/'),
+    models.NodeData('lizikejancar-6', 'Lizike Jančar 6', 46.5650568347, 15.6304764748, 'https://nodes.wlan-si.net/node/lizikejancar-6/'),
+    models.NodeData('sobetinci-25', 'Sobetinci 25', 46.4038612471, 15.9714657068, 'https://nodes.wlan-si.net/node/sobetinci-25/'),
+]
+
+# Coordinates of nodes in parallel arrays, for spatial searches
+latitudes = array.array('d', (node.latitude for node in nodes))
+longitudes = array.array('d', (node.longitude for node in nodes))
@@ -0,0 +1,29 @@
+from optparse import make_option
+
+from django.conf import settings
+from django.core.management import base
+
+from piplmesh.nodes import backends
+
+class Command(base.NoArgsCommand):
+    option_list = base.NoArgsCommand.option_list + (
+        make_option('--output', action='store', dest='output', default=None,
+            help='File to write the grid to. Defaults to NODES_GRID_FILE setting.'),
+    )
+    help = 'Builds point-location grid of nodes used by GridNodesBackend. Should be run whenever nodes or NODES_GRID_CELL_SIZE change.'
+
+    def handle_noargs(self, **options):
+        verbosity = int(options.get('verbosity'))
+        path = options.get('output') or getattr(settings, 'NODES_GRID_FILE', None)
+
+        if not path:
+            raise base.CommandError("No output file specified and NODES_GRID_FILE is not set.")
+
+        grid = backends.GridNodesBackend.build_grid()
+        try:
+            grid.save(path)
+        except EnvironmentError, e:
+            raise base.CommandError("Nodes grid couldn't be written to '%s': %s" % (path, e))
+
+        if verbosity > 0:
+            self.stdout.write("Nodes grid with %d cells and %d distinct candidate sets written to '%s'.\n" % (len(grid.cells), len(grid.candidates), path))
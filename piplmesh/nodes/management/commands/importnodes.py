@@ -0,0 +1,92 @@
+import collections, json
+from optparse import make_option
+
+from django.core.management import base
+
+import pymongo
+
+from piplmesh.nodes import models
+
+# Number of nodes queried or inserted at once
+IMPORT_BATCH_SIZE = 1000
+
+class Command(base.BaseCommand):
+    option_list = base.BaseCommand.option_list + (
+        make_option('--delete', action='store_true', dest='delete', default=False,
+            help='Deletes stored nodes which are not present in imported files.'),
+    )
+    args = '<nodes file ...>'
+    help = 'Imports nodes from JSON files into the database, used by MongoNodesBackend. ' \
+        'Every file should contain a list of objects with name, location, latitude, longitude and url fields.'
+
+    def handle(self, *args, **options):
+        """
+        Upserts nodes by their name, so that the same files can be imported repeatedly.
+
+        New nodes are inserted in batches and only nodes which have changed are
+        updated, one by one.
+        """
+
+        verbosity = int(options.get('verbosity'))
+
+        if not args:
+            raise base.CommandError("No nodes files specified.")
+
+        collection = models.StoredNode._get_collection()
+        collection.ensure_index([('position', pymongo.GEO2D)])
+
+        # Later files override nodes with the same name from earlier files
+        documents = collections.OrderedDict()
+
+        for path in args:
+            try:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+            except (IOError, ValueError), e:
+                raise base.CommandError("Nodes file '%s' couldn't be read: %s" % (path, e))
+
+            for node in data:
+                try:
+                    name = node['name']
+                    position = [float(node['longitude']), float(node['latitude'])]
+                except (KeyError, TypeError, ValueError):
+                    raise base.CommandError("Invalid node in '%s': %r" % (path, node))
+
+                documents[name] = {
+                    '_id': name,
+                    'location': node.get('location'),
+                    'position': position,
+                    'url': node.get('url'),
+                }
+
+            if verbosity > 1:
+                self.stdout.write("Read %d nodes from '%s'.\n" % (len(data), path))
+
+        names = documents.keys()
+        existing = {}
+        for start in range(0, len(names), IMPORT_BATCH_SIZE):
+            for document in collection.find({'_id': {'$in': names[start:start + IMPORT_BATCH_SIZE]}}):
+                existing[document['_id']] = document
+
+        new = [document for name, document in documents.iteritems() if name not in existing]
+        changed = [document for name, document in documents.iteritems() if name in existing and existing[name] != document]
+
+        for start in range(0, len(new), IMPORT_BATCH_SIZE):
+            try:
+                collection.insert(new[start:start + IMPORT_BATCH_SIZE], safe=True)
+            except pymongo.errors.DuplicateKeyError:
+                # Some nodes were concurrently inserted by somebody else, so we upsert them one by one
+                changed.extend(new[start:start + IMPORT_BATCH_SIZE])
+
+        for document in changed:
+            collection.update({'_id': document['_id']}, {'$set': {
+                'location': document['location'],
+                'position': document['position'],
+                'url': document['url'],
+            }}, upsert=True, safe=True)
+
+        if options.get('delete'):
+            collection.remove({'_id': {'$nin': names}}, safe=True)
+
+        if verbosity > 0:
+            self.stdout.write("Imported %d nodes (%d new, %d changed).\n" % (len(documents), len(new), len(changed)))
@@ -0,0 +1,82 @@
+import csv, itertools, json, sys
+from optparse import make_option
+
+from django.core.management import base
+
+from piplmesh import nodes
+
+FORMATS = ('csv', 'json')
+
+class Command(base.BaseCommand):
+    option_list = base.BaseCommand.option_list + (
+        make_option('--format', action='store', dest='format', type='choice', choices=FORMATS, default=None,
+            help='Input and output format, "csv" or "json" (one object per line). Defaults to file extension.'),
+        make_option('--batch', action='store', dest='batch', type='int', default=nodes.NEAREST_CHUNK_SIZE,
+            help='Number of locations resolved at once.'),
+    )
+    args = '<locations file>'
+    help = 'Resolves locations to closest nodes. Reads rows with latitude and longitude fields ' \
+        'from a CSV file (with a header) or a file with JSON object per line, and writes them ' \
+        'to the standard output in the same format, with full node id added in node field. ' \
+        'Use "-" to read from the standard input.'
+
+    def handle(self, *args, **options):
+        """
+        Streams rows in batches, so that files of any size can be resolved.
+        """
+
+        if len(args) != 1:
+            raise base.CommandError("A locations file has to be specified.")
+
+        path = args[0]
+        format = options.get('format') or path.rsplit('.', 1)[-1].lower()
+        if format not in FORMATS:
+            raise base.CommandError("Unknown format of '%s', use --format option." % path)
+
+        batch = options.get('batch')
+        if batch < 1:
+            raise base.CommandError("Batch size has to be positive.")
+
+        try:
+            input = sys.stdin if path == '-' else open(path, 'rb')
+        except IOError, e:
+            raise base.CommandError("Locations file '%s' couldn't be read: %s" % (path, e))
+
+        # Nodes are fetched only once for all batches
+        all_nodes = list(nodes.get_all_nodes())
+
+        try:
+            if format == 'csv':
+                reader = csv.DictReader(input)
+                if not reader.fieldnames or 'latitude' not in reader.fieldnames or 'longitude' not in reader.fieldnames:
+                    raise base.CommandError("CSV file has to have a header with latitude and longitude fields.")
+                writer = csv.DictWriter(self.stdout, reader.fieldnames + ['node'])
+                writer.writeheader()
+                rows = reader
+                write = writer.writerow
+            else:
+                rows = (json.loads(line) for line in input if line.strip())
+                write = lambda row: self.stdout.write(json.dumps(row) + '\n')
+
+            number = 0
+            while True:
+                chunk = list(itertools.islice(rows, batch))
+                if not chunk:
+                    break
+
+                try:
+                    latitudes = [float(row['latitude']) for row in chunk]
+                    longitudes = [float(row['longitude']) for row in chunk]
+                except (KeyError, TypeError, ValueError), e:
+                    raise base.CommandError("Invalid location in rows %d-%d: %s" % (number + 1, number + len(chunk), e))
+
+                for row, node in zip(chunk, nodes.resolve_locations(latitudes, longitudes, all_nodes)):
+                    row['node'] = node.get_full_node_id() if node is not None else None
+                    write(row)
+
+                number += len(chunk)
+        except (csv.Error, ValueError), e:
+            raise base.CommandError("Locations file '%s' couldn't be parsed: %s" % (path, e))
+        finally:
+            if input is not sys.stdin:
+                input.close()
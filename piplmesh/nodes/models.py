@@ -1,18 +1,53 @@
+import collections
+
+import mongoengine
+
 from piplmesh import nodes
 
 NODE_ID_SEPARATOR = '-'
 
+class NodeData(collections.namedtuple('NodeData', ('name', 'location', 'latitude', 'longitude', 'url'))):
+    """
+    Immutable data about a node, shared between all requests.
+    """
+
+    __slots__ = ()
+
 class Node(object):
-    def __init__(self, id, name, location, latitude, longitude, url):
+    """
+    Lightweight wrapper around :class:`NodeData` which carries node's id, its
+    backend and request-specific state.
+    """
+
+    __slots__ = ('id', 'data', 'backend', '_outside_request')
+
+    def __init__(self, id, data, backend=None):
         self.id = id
-        self.name = name
-        self.location = location
-        self.latitude = latitude
-        self.longitude = longitude
-        self.url = url
+        self.data = data
+        self.backend = backend
 
         self._outside_request = False
 
+    @property
+    def name(self):
+        return self.data.name
+
+    @property
+    def location(self):
+        return self.data.location
+
+    @property
+    def latitude(self):
+        return self.data.latitude
+
+    @property
+    def longitude(self):
+        return self.data.longitude
+
+    @property
+    def url(self):
+        return self.data.url
+
     def is_outside_request(self):
         return self._outside_request
 
@@ -25,3 +60,23 @@ class Node(object):
     @classmethod
     def parse_full_node_id(cls, full_node_id):
         return full_node_id.split(NODE_ID_SEPARATOR, 1)
+
+class StoredNode(mongoengine.Document):
+    """
+    Node stored in the database, used by :class:`piplmesh.nodes.backends.MongoNodesBackend`.
+    """
+
+    name = mongoengine.StringField(primary_key=True)
+    location = mongoengine.StringField()
+    # Stored as (longitude, latitude), as required for spherical queries
+    position = mongoengine.GeoPointField(required=True)
+    url = mongoengine.StringField()
+
+    meta = {
+        # Documents are upserted directly by the importnodes management command
+        'allow_inheritance': False,
+    }
+
+    def get_node_data(self):
+        longitude, latitude = self.position
+        return NodeData(self.name, self.location, latitude, longitude, self.url)
@@ -0,0 +1,121 @@
+import array, hashlib, math
+
+import numpy
+
+from piplmesh import nodes
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+GRID_FORMAT_VERSION = 2
+
+DEFAULT_CELL_SIZE = 0.02 # degrees
+DEFAULT_MARGIN = 0.5 # degrees
+
+def fingerprint(latitudes, longitudes):
+    """
+    Returns a fingerprint of node coordinates, used to detect a stale grid.
+    """
+
+    return hashlib.sha1(repr(zip(map(float, latitudes), map(float, longitudes)))).hexdigest()
+
+class NodeGrid(object):
+    """
+    Point-location structure for finding the closest node.
+
+    The area around nodes is divided into a grid of cells of ``cell_size``
+    degrees and for every cell all nodes whose Voronoi regions (on the sphere)
+    could intersect the cell are stored. Finding the closest node is then a
+    lookup of a cell and a scan of its few candidates.
+
+    Candidates for a cell are nodes at most ``d + 2r`` away from the cell
+    center, where ``d`` is the distance from the center to its closest node
+    and ``r`` bounds the distance from the center to any point in the cell.
+    Any point in the cell is at most ``d + r`` from that closest node, and
+    nodes further than ``d + 2r`` from the center are further than ``d + r``
+    from any point in the cell, so the answer is exact.
+    """
+
+    def __init__(self, latitudes, longitudes, cell_size=DEFAULT_CELL_SIZE, margin=DEFAULT_MARGIN):
+        latitudes = numpy.asarray(latitudes, dtype=float)
+        longitudes = numpy.asarray(longitudes, dtype=float)
+
+        self.fingerprint = fingerprint(latitudes, longitudes)
+        self.cell_size = cell_size
+        self.margin = margin
+        self.south = max(-90.0, float(latitudes.min()) - margin)
+        self.west = max(-180.0, float(longitudes.min()) - margin)
+        self.rows = int(math.ceil((min(90.0, float(latitudes.max()) + margin) - self.south) / cell_size))
+        self.cols = int(math.ceil((min(180.0, float(longitudes.max()) + margin) - self.west) / cell_size))
+
+        self.candidates = []
+        self.cells = array.array('I')
+
+        interned = {}
+        centers_longitude = self.west + (numpy.arange(self.cols) + 0.5) * cell_size
+        for row in range(self.rows):
+            center_latitude = self.south + (row + 0.5) * cell_size
+            # Bound on distance from cell center to any point in the cell: along
+            # the parallel through the center and then along the meridian
+            radius = math.radians(cell_size / 2) + math.radians(cell_size / 2) * math.cos(math.radians(center_latitude))
+
+            matrix = nodes.distances(center_latitude, centers_longitude[:, numpy.newaxis], latitudes, longitudes)
+            limits = matrix.min(axis=1) + 2 * radius + 1e-12
+            for col in range(self.cols):
+                cell_candidates = tuple(int(i) for i in numpy.nonzero(matrix[col] <= limits[col])[0])
+                if cell_candidates not in interned:
+                    interned[cell_candidates] = len(self.candidates)
+                    self.candidates.append(cell_candidates)
+                self.cells.append(interned[cell_candidates])
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['version'] = GRID_FORMAT_VERSION
+        return state
+
+    def __setstate__(self, state):
+        if state.pop('version', None) != GRID_FORMAT_VERSION:
+            raise ValueError("Unsupported nodes grid format.")
+        self.__dict__.update(state)
+
+    def is_current(self, latitudes, longitudes, cell_size=DEFAULT_CELL_SIZE, margin=DEFAULT_MARGIN):
+        """
+        Returns ``True`` if grid has been built for given nodes and with given parameters.
+        """
+
+        return self.cell_size == cell_size and self.margin == margin and self.fingerprint == fingerprint(latitudes, longitudes)
+
+    def get_candidates(self, latitude, longitude):
+        """
+        Returns indices of nodes which could be closest to given location, or
+        ``None`` if location is outside the grid.
+        """
+
+        row = int(math.floor((latitude - self.south) / self.cell_size))
+        col = int(math.floor((longitude - self.west) / self.cell_size))
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return None
+        return self.candidates[self.cells[row * self.cols + col]]
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            pickle.dump(self, f, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads a grid from given file.
+
+        Raises ``EnvironmentError`` or ``ValueError`` if it cannot be loaded.
+        """
+
+        with open(path, 'rb') as f:
+            try:
+                grid = pickle.load(f)
+            except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError), e:
+                raise ValueError("Invalid nodes grid file: %s" % e)
+        if not isinstance(grid, cls):
+            raise ValueError("Invalid nodes grid file.")
+        return grid
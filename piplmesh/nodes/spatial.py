@@ -0,0 +1,90 @@
+import heapq, math
+
+def to_cartesian(latitude, longitude):
+    """
+    Converts geographic coordinates (in degrees) to a point on the unit sphere.
+
+    Euclidean (chord) distance between such points grows monotonically with
+    great-circle distance, so the nearest point in space is also the nearest
+    point on the sphere.
+    """
+
+    latitude, longitude = math.radians(latitude), math.radians(longitude)
+    cos_latitude = math.cos(latitude)
+    return (cos_latitude * math.cos(longitude), cos_latitude * math.sin(longitude), math.sin(latitude))
+
+def chord_to_angle(chord):
+    """
+    Converts chord length on the unit sphere to central angle in radians.
+    """
+
+    return 2 * math.asin(min(1.0, chord / 2))
+
+class KDTree(object):
+    """
+    Static k-d tree over points on the unit sphere, built once for a list of
+    ``(latitude, longitude)`` pairs and queried for nearest neighbours.
+    """
+
+    def __init__(self, coordinates):
+        self.points = [to_cartesian(latitude, longitude) for latitude, longitude in coordinates]
+        self.root = self._build(range(len(self.points)), 0)
+
+    def __len__(self):
+        return len(self.points)
+
+    def _build(self, indices, depth):
+        if not indices:
+            return None
+
+        axis = depth % 3
+        indices = sorted(indices, key=lambda i: self.points[i][axis])
+        median = len(indices) // 2
+
+        # Node is a tuple (index, axis, left, right)
+        return (indices[median], axis, self._build(indices[:median], depth + 1), self._build(indices[median + 1:], depth + 1))
+
+    def _distance2(self, point, index):
+        other = self.points[index]
+        return (point[0] - other[0])**2 + (point[1] - other[1])**2 + (point[2] - other[2])**2
+
+    def nearest(self, latitude, longitude, k=1):
+        """
+        Returns a list of up to ``k`` ``(angle, index)`` pairs for points
+        closest to given location, ordered by increasing central angle (in
+        radians).
+        """
+
+        if k < 1:
+            return []
+
+        point = to_cartesian(latitude, longitude)
+        # Max-heap (by negated distance) of the best k candidates found so far
+        best = []
+        # Stack of (node, squared distance to the splitting plane of its parent)
+        stack = [(self.root, 0.0)]
+
+        while stack:
+            node, bound = stack.pop()
+            if node is None:
+                continue
+
+            # Subtree cannot contain anything closer than the current worst candidate
+            if len(best) == k and bound >= -best[0][0]:
+                continue
+
+            index, axis, left, right = node
+            distance2 = self._distance2(point, index)
+            if len(best) < k:
+                heapq.heappush(best, (-distance2, index))
+            elif distance2 < -best[0][0]:
+                heapq.heapreplace(best, (-distance2, index))
+
+            diff = point[axis] - self.points[index][axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+
+            # Near side is popped first
+            stack.append((far, diff**2))
+            stack.append((near, 0.0))
+
+        return sorted((chord_to_angle(math.sqrt(-distance2)), index) for distance2, index in best)
@@ -0,0 +1,195 @@
+import socket, struct
+
+IPV4_BITS = 32
+IPV6_BITS = 128
+
+IPV4_MAPPED_PREFIX = 0xffff << 32
+
+def parse_address(address):
+    """
+    Parses IPv4 or IPv6 address and returns a pair ``(bits, value)``, where
+    ``bits`` is the address length and ``value`` the address as an integer.
+    IPv4-mapped IPv6 addresses are returned as IPv4 addresses.
+
+    Raises ``ValueError`` if address is invalid.
+    """
+
+    address = address.strip()
+    try:
+        return IPV4_BITS, struct.unpack('!I', socket.inet_pton(socket.AF_INET, address))[0]
+    except (socket.error, UnicodeError):
+        pass
+
+    try:
+        high, low = struct.unpack('!QQ', socket.inet_pton(socket.AF_INET6, address))
+    except (socket.error, UnicodeError):
+        raise ValueError('Invalid IP address: %s' % address)
+
+    value = (high << 64) | low
+    if value >> 32 == IPV4_MAPPED_PREFIX >> 32:
+        return IPV4_BITS, value & 0xffffffff
+    return IPV6_BITS, value
+
+def parse_prefix(prefix):
+    """
+    Parses CIDR prefix (like ``10.14.0.0/16``) and returns a tuple
+    ``(bits, value, length)``. Address without length is a host prefix.
+    IPv4-mapped IPv6 prefixes (like ``::ffff:10.14.0.0/112``) are returned
+    as IPv4 prefixes.
+
+    Raises ``ValueError`` if prefix is invalid.
+    """
+
+    address, _, length = prefix.partition('/')
+    bits, value = parse_address(address)
+    if not length:
+        length = bits
+    elif bits == IPV4_BITS and ':' in address:
+        # IPv4-mapped prefix, with length given for the whole IPv6 address
+        length = int(length) - (IPV6_BITS - IPV4_BITS)
+        if length < 0:
+            raise ValueError('IPv4-mapped prefix shorter than %d bits: %s' % (IPV6_BITS - IPV4_BITS, prefix))
+    else:
+        length = int(length)
+    if not 0 <= length <= bits:
+        raise ValueError('Invalid prefix length: %s' % prefix)
+    if value & ((1 << (bits - length)) - 1):
+        raise ValueError('Host bits set in prefix: %s' % prefix)
+    return bits, value, length
+
+class RadixNode(object):
+    __slots__ = ('value', 'length', 'item', 'children')
+
+    def __init__(self, value, length, item=None):
+        # Address with only first length bits possibly set
+        self.value = value
+        self.length = length
+        self.item = item
+        self.children = [None, None]
+
+class RadixTrie(object):
+    """
+    Path-compressed binary trie (PATRICIA trie) for longest-prefix matching
+    of integer addresses of fixed length. Trie nodes exist only for stored
+    prefixes and for branching points, so lookup visits at most one trie node
+    per stored prefix along the path, and never more than address length.
+    """
+
+    def __init__(self, bits):
+        self.bits = bits
+        self.root = RadixNode(0, 0)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _bit(self, value, position):
+        return (value >> (self.bits - 1 - position)) & 1
+
+    def _common_length(self, value_a, value_b, length):
+        # Number of equal leading bits among first length bits
+        difference = (value_a ^ value_b) >> (self.bits - length)
+        return length - difference.bit_length()
+
+    def _mask(self, value, length):
+        return (value >> (self.bits - length)) << (self.bits - length)
+
+    def insert(self, value, length, item):
+        node = self.root
+        while True:
+            if node.length == length:
+                if node.item is None:
+                    self.size += 1
+                node.item = item
+                return
+
+            bit = self._bit(value, node.length)
+            child = node.children[bit]
+            if child is None:
+                node.children[bit] = RadixNode(value, length, item)
+                self.size += 1
+                return
+
+            common = self._common_length(value, child.value, min(length, child.length))
+            if common == child.length:
+                node = child
+                continue
+
+            # Child has to be split at the point where prefixes diverge
+            middle = RadixNode(self._mask(value, common), common)
+            middle.children[self._bit(child.value, common)] = child
+            node.children[bit] = middle
+
+            if common == length:
+                middle.item = item
+            else:
+                middle.children[self._bit(value, common)] = RadixNode(value, length, item)
+            self.size += 1
+            return
+
+    def lookup(self, value):
+        """
+        Returns item stored under the longest prefix matching given
+        address, or ``None``.
+        """
+
+        node = self.root
+        match = node.item
+        while node.length < self.bits:
+            node = node.children[self._bit(value, node.length)]
+            if node is None or (value ^ node.value) >> (self.bits - node.length):
+                break
+            if node.item is not None:
+                match = node.item
+        return match
+
+class PrefixTable(object):
+    """
+    Maps IPv4 and IPv6 prefixes to items.
+    """
+
+    def __init__(self):
+        self.tries = {
+            IPV4_BITS: RadixTrie(IPV4_BITS),
+            IPV6_BITS: RadixTrie(IPV6_BITS),
+        }
+
+    def __len__(self):
+        return sum(len(trie) for trie in self.tries.values())
+
+    def add(self, prefix, item):
+        bits, value, length = parse_prefix(prefix)
+        self.tries[bits].insert(value, length, item)
+
+    def lookup(self, address):
+        """
+        Returns item for the longest prefix matching given address, or
+        ``None`` if there is no such prefix or address is invalid.
+        """
+
+        try:
+            bits, value = parse_address(address)
+        except ValueError:
+            return None
+        return self.tries[bits].lookup(value)
+
+    @classmethod
+    def parse(cls, lines):
+        """
+        Builds a table from lines of the form ``<prefix> <item>``. Empty lines
+        and lines starting with ``#`` are ignored.
+
+        Raises ``ValueError`` on invalid lines.
+        """
+
+        table = cls()
+        for number, line in enumerate(lines, 1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            try:
+                prefix, item = line.split(None, 1)
+                table.add(prefix, item.strip())
+            except ValueError, e:
+                raise ValueError('Invalid line %d: %s' % (number, e))
+        return table
@@ -1,12 +1,34 @@
+import csv, json, os, StringIO, tempfile, time
+
+from django.core import management
 from django.test import client, utils
 
+from mongoengine.django import sessions
+
 from tastypie_mongoengine import test_runner
 
 from piplmesh import nodes
+from piplmesh.frontend import middleware
+from piplmesh.nodes import backends, data, models, pointlocation, subnets
+
+class NodesTestCase(test_runner.MongoEngineTestCase):
+    """
+    Recreates nodes backends around every test, so that overridden
+    ``NODES_BACKENDS`` setting is used and does not leak into other tests.
+    """
+
+    def setUp(self):
+        super(NodesTestCase, self).setUp()
+        nodes.reload_backends()
+
+    def tearDown(self):
+        nodes.reload_backends()
+        super(NodesTestCase, self).tearDown()
 
 @utils.override_settings(NODES_BACKENDS=('piplmesh.nodes.backends.RandomNodesBackend',))
-class BasicTest(test_runner.MongoEngineTestCase):
+class BasicTest(NodesTestCase):
     def setUp(self):
+        super(BasicTest, self).setUp()
         self.factory = client.RequestFactory()
 
     def test_get_node(self):
@@ -18,3 +40,396 @@ class BasicTest(test_runner.MongoEngineTestCase):
 
         node2 = nodes.get_node(request)
         self.assertEqual(node1.id, node2.id)
+
+    def test_update_session(self):
+        session = sessions.SessionStore()
+        request = self.factory.get('/')
+        request.session = session
+
+        nodes.update_session(request, {nodes.SESSION_KEY: 1, nodes.BACKEND_SESSION_KEY: 'piplmesh.nodes.backends.RandomNodesBackend'})
+        self.assertTrue(session.modified)
+
+        # Updating to the same values does not modify the session
+        session.modified = False
+        nodes.update_session(request, {nodes.SESSION_KEY: 1, nodes.BACKEND_SESSION_KEY: 'piplmesh.nodes.backends.RandomNodesBackend'})
+        self.assertFalse(session.modified)
+
+        nodes.update_session(request, {})
+        self.assertTrue(session.modified)
+        self.assertFalse(nodes.SESSION_KEY in session)
+
+    def test_backends_registry(self):
+        backend = nodes.get_backend('piplmesh.nodes.backends.RandomNodesBackend')
+        self.assertEqual(nodes.get_backends(), [backend])
+        self.assertIs(nodes.get_backends()[0], backend)
+        self.assertRaises(KeyError, nodes.get_backend, 'piplmesh.nodes.backends.NearestNodesBackend')
+
+        nodes.reload_backends()
+        self.assertIsNot(nodes.get_backend('piplmesh.nodes.backends.RandomNodesBackend'), backend)
+
+@utils.override_settings(NODES_BACKENDS=('piplmesh.nodes.backends.NearestNodesBackend',))
+class NearestTest(NodesTestCase):
+    def setUp(self):
+        super(NearestTest, self).setUp()
+        self.factory = client.RequestFactory()
+
+    def test_get_closest_node(self):
+        backend = backends.NearestNodesBackend()
+
+        for latitude, longitude in ((46.0445688554, 14.4893038273), (46.05, 14.5), (46.55, 15.64), (0.0, 0.0), (-46.0, -165.0)):
+            closest = min(backend.get_all_nodes(), key=lambda node: nodes.distance(latitude, longitude, node.latitude, node.longitude))
+            node = backend.get_closest_node(None, latitude, longitude)
+            self.assertAlmostEqual(nodes.distance(latitude, longitude, node.latitude, node.longitude), nodes.distance(latitude, longitude, closest.latitude, closest.longitude))
+
+    def test_get_node(self):
+        request = self.factory.get('/')
+        request.session = {
+            nodes.LATITUDE_SESSION_KEY: 46.0445688554,
+            nodes.LONGITUDE_SESSION_KEY: 14.4893038273,
+        }
+
+        node = nodes.get_node(request)
+        self.assertEqual(node.name, 'fri')
+        self.assertTrue(node.is_outside_request())
+
+    @utils.override_settings(NODES_LOCATION_TOLERANCE=50)
+    def test_location_tolerance(self):
+        request = self.factory.get('/')
+        request.session = {
+            nodes.LATITUDE_SESSION_KEY: 46.0445688554,
+            nodes.LONGITUDE_SESSION_KEY: 14.4893038273,
+        }
+
+        node = nodes.get_node(request)
+        self.assertEqual(node.name, 'fri')
+
+        # About 10 meters north, node is kept without searching again
+        request.session[nodes.LATITUDE_SESSION_KEY] = 46.0446588554
+        self.assertTrue(nodes.is_near(request.session[nodes.CLOSEST_LATITUDE_SESSION_KEY], request.session[nodes.CLOSEST_LONGITUDE_SESSION_KEY], request.session[nodes.LATITUDE_SESSION_KEY], request.session[nodes.LONGITUDE_SESSION_KEY]))
+        node = nodes.get_node(request)
+        self.assertEqual(node.name, 'fri')
+        self.assertEqual(request.session[nodes.CLOSEST_LATITUDE_SESSION_KEY], 46.0445688554)
+
+        # About 1 kilometer north, closest node is searched for again
+        request.session[nodes.LATITUDE_SESSION_KEY] = 46.0535688554
+        self.assertFalse(nodes.is_near(request.session[nodes.CLOSEST_LATITUDE_SESSION_KEY], request.session[nodes.CLOSEST_LONGITUDE_SESSION_KEY], request.session[nodes.LATITUDE_SESSION_KEY], request.session[nodes.LONGITUDE_SESSION_KEY]))
+        nodes.get_node(request)
+        self.assertEqual(request.session[nodes.CLOSEST_LATITUDE_SESSION_KEY], 46.0535688554)
+
+@utils.override_settings(NODES_BACKENDS=('piplmesh.nodes.backends.NearestNodesBackend',), NODES_CACHE_TIMEOUT=60, NODES_LOCATION_TOLERANCE=0)
+class MiddlewareTest(NodesTestCase):
+    def setUp(self):
+        super(MiddlewareTest, self).setUp()
+        self.factory = client.RequestFactory()
+        self.middleware = middleware.NodesMiddleware()
+
+        self.session = sessions.SessionStore()
+        self.session[nodes.LATITUDE_SESSION_KEY] = 46.0445688554
+        self.session[nodes.LONGITUDE_SESSION_KEY] = 14.4893038273
+        self.session.save()
+
+        self.resolved = []
+        get_node = nodes.get_node
+
+        def counting_get_node(request, *args, **kwargs):
+            self.resolved.append(request)
+            return get_node(request, *args, **kwargs)
+
+        nodes.get_node = counting_get_node
+        self.addCleanup(setattr, nodes, 'get_node', get_node)
+
+    def get_node(self, **kwargs):
+        request = self.factory.get('/', **kwargs)
+        request.session = self.session
+        return self.middleware.get_node(request)
+
+    def test_cached_node(self):
+        node = self.get_node()
+        self.assertEqual(node.name, 'fri')
+        self.assertTrue(node.is_outside_request())
+        self.assertEqual(len(self.resolved), 1)
+
+        # Session state is unchanged, so cached node is used
+        self.session.modified = False
+        node = self.get_node()
+        self.assertEqual(node.name, 'fri')
+        self.assertTrue(node.is_outside_request())
+        self.assertEqual(len(self.resolved), 1)
+        self.assertFalse(self.session.modified)
+
+        # Different client address is resolved separately
+        self.get_node(REMOTE_ADDR='10.0.0.1')
+        self.assertEqual(len(self.resolved), 2)
+
+    def test_changed_session(self):
+        self.get_node()
+        self.assertEqual(len(self.resolved), 1)
+
+        # Location changed, so node is resolved again
+        self.session[nodes.LATITUDE_SESSION_KEY] = 46.5507723961
+        self.session[nodes.LONGITUDE_SESSION_KEY] = 15.6441316009
+        node = self.get_node()
+        self.assertEqual(len(self.resolved), 2)
+        self.assertEqual(node.name, 'pekarna-1')
+        self.assertEqual(self.session[nodes.CLOSEST_LATITUDE_SESSION_KEY], 46.5507723961)
+
+        # And cached again
+        node = self.get_node()
+        self.assertEqual(len(self.resolved), 2)
+        self.assertEqual(node.name, 'pekarna-1')
+
+class GridTest(test_runner.MongoEngineTestCase):
+    def test_get_closest_node(self):
+        backend = backends.GridNodesBackend()
+
+        for latitude, longitude in ((46.0445688554, 14.4893038273), (46.05, 14.5), (46.55, 15.64), (46.3420, 16.0156), (0.0, 0.0)):
+            closest = min(backend.get_all_nodes(), key=lambda node: nodes.distance(latitude, longitude, node.latitude, node.longitude))
+            node = backend.get_closest_node(None, latitude, longitude)
+            self.assertAlmostEqual(nodes.distance(latitude, longitude, node.latitude, node.longitude), nodes.distance(latitude, longitude, closest.latitude, closest.longitude))
+
+    def test_save_load(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            grid = pointlocation.NodeGrid(data.latitudes, data.longitudes, 0.1)
+            grid.save(path)
+
+            loaded = pointlocation.NodeGrid.load(path)
+            self.assertTrue(loaded.is_current(data.latitudes, data.longitudes, 0.1))
+            self.assertFalse(loaded.is_current(data.latitudes, data.longitudes, 0.05))
+            self.assertFalse(loaded.is_current(data.latitudes[1:], data.longitudes[1:], 0.1))
+            self.assertEqual(loaded.get_candidates(46.05, 14.5), grid.get_candidates(46.05, 14.5))
+            self.assertEqual(loaded.get_candidates(0.0, 0.0), None)
+        finally:
+            os.remove(path)
+
+    def test_stale_file(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            pointlocation.NodeGrid(data.latitudes, data.longitudes, 0.1).save(path)
+
+            for cell_size in (0.1, 0.05):
+                with utils.override_settings(NODES_GRID_FILE=path, NODES_GRID_CELL_SIZE=cell_size):
+                    backends.GridNodesBackend._grid = None
+                    try:
+                        # Grid built with a different cell size is built again
+                        self.assertEqual(backends.GridNodesBackend.get_grid().cell_size, cell_size)
+                    finally:
+                        backends.GridNodesBackend._grid = None
+        finally:
+            os.remove(path)
+
+class SlowNodesBackend(backends.NearestNodesBackend):
+    def get_closest_node(self, request, latitude, longitude):
+        time.sleep(1)
+        return super(SlowNodesBackend, self).get_closest_node(request, latitude, longitude)
+
+@utils.override_settings(NODES_BACKENDS=('piplmesh.nodes.backends.NearestNodesBackend', 'piplmesh.nodes.tests.SlowNodesBackend'), NODES_BACKEND_TIMEOUT=0.1)
+class TimeoutTest(NodesTestCase):
+    def test_get_closest_nodes(self):
+        start = time.time()
+        candidates, complete = nodes.get_closest_nodes(None, 46.0445688554, 14.4893038273)
+        self.assertLess(time.time() - start, 1)
+
+        self.assertFalse(complete)
+        self.assertEqual(len(candidates), 1)
+        backend_name, node = candidates[0]
+        self.assertEqual(backend_name, 'piplmesh.nodes.backends.NearestNodesBackend')
+        self.assertEqual(node.name, 'fri')
+
+    @utils.override_settings(NODES_BACKEND_THREADS=1)
+    def test_busy_backend(self):
+        start = time.time()
+        for i in range(5):
+            # Slow backend keeps its only thread busy, but other backend still answers
+            candidates, complete = nodes.get_closest_nodes(None, 46.0445688554, 14.4893038273)
+            self.assertFalse(complete)
+            self.assertEqual([backend_name for backend_name, node in candidates], ['piplmesh.nodes.backends.NearestNodesBackend'])
+        self.assertLess(time.time() - start, 1)
+
+    def test_get_node(self):
+        factory = client.RequestFactory()
+        request = factory.get('/')
+        request.session = {
+            nodes.LATITUDE_SESSION_KEY: 46.0445688554,
+            nodes.LONGITUDE_SESSION_KEY: 14.4893038273,
+        }
+
+        # Node is returned, but not stored, as slow backend has not answered
+        node = nodes.get_node(request)
+        self.assertEqual(node.name, 'fri')
+        self.assertTrue(node.is_outside_request())
+        self.assertFalse(nodes.SESSION_KEY in request.session)
+        self.assertFalse(nodes.CLOSEST_LATITUDE_SESSION_KEY in request.session)
+
+        # Nor cached by the middleware
+        session = sessions.SessionStore()
+        session.update(request.session)
+        session.save()
+        nodes_middleware = middleware.NodesMiddleware()
+        for i in range(2):
+            request = factory.get('/')
+            request.session = session
+            self.assertEqual(nodes_middleware.get_node(request).name, 'fri')
+        self.assertEqual(len(nodes_middleware.nodes_cache), 0)
+
+class DistanceTest(test_runner.MongoEngineTestCase):
+    def test_distances(self):
+        latitudes = [46.0445688554, 46.5507723961, -33.0, 0.0]
+        longitudes = [14.4893038273, 15.6441316009, 151.0, 0.0]
+
+        result = nodes.distances(46.05, 14.5, latitudes, longitudes)
+        for latitude, longitude, angle in zip(latitudes, longitudes, result):
+            self.assertAlmostEqual(angle, nodes.distance(46.05, 14.5, latitude, longitude))
+
+    def test_nearest(self):
+        latitudes = [node.latitude for node in data.nodes]
+        longitudes = [node.longitude for node in data.nodes]
+        queries = [(46.05, 14.5), (46.55, 15.64), (0.0, 0.0)]
+
+        indices, angles = nodes.nearest([latitude for latitude, _ in queries], [longitude for _, longitude in queries], latitudes, longitudes, k=3, chunk_size=2)
+        self.assertEqual(indices.shape, (3, 3))
+
+        for (latitude, longitude), query_indices, query_angles in zip(queries, indices, angles):
+            expected = sorted(nodes.distance(latitude, longitude, lat, lon) for lat, lon in zip(latitudes, longitudes))[:3]
+            for index, angle, expected_angle in zip(query_indices, query_angles, expected):
+                self.assertAlmostEqual(angle, expected_angle)
+                self.assertAlmostEqual(nodes.distance(latitude, longitude, latitudes[index], longitudes[index]), expected_angle)
+
+        # Only the closest location is searched for without sorting
+        closest_indices, closest_angles = nodes.nearest([latitude for latitude, _ in queries], [longitude for _, longitude in queries], latitudes, longitudes, chunk_size=2)
+        self.assertEqual(closest_indices.shape, (3, 1))
+        self.assertEqual(list(closest_indices[:, 0]), list(indices[:, 0]))
+        for angle, expected_angle in zip(closest_angles[:, 0], angles[:, 0]):
+            self.assertAlmostEqual(angle, expected_angle)
+
+@utils.override_settings(NODES_BACKENDS=('piplmesh.nodes.backends.NearestNodesBackend',))
+class ResolveTest(NodesTestCase):
+    def test_resolve_locations(self):
+        resolved = nodes.resolve_locations([46.0445688554, 46.5507723961], [14.4893038273, 15.6441316009])
+        self.assertEqual([node.name for node in resolved], ['fri', 'pekarna-1'])
+
+    def test_command(self):
+        fd, path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(fd, 'w') as f:
+            f.write('id,latitude,longitude\n1,46.0445688554,14.4893038273\n2,46.5507723961,15.6441316009\n3,46.0445,14.4893\n')
+
+        try:
+            output = StringIO.StringIO()
+            management.call_command('resolvenodes', path, batch=2, stdout=output)
+        finally:
+            os.remove(path)
+
+        rows = list(csv.DictReader(StringIO.StringIO(output.getvalue())))
+        self.assertEqual([row['id'] for row in rows], ['1', '2', '3'])
+        self.assertEqual([row['node'] for row in rows], ['piplmesh.nodes.backends.NearestNodesBackend-12', 'piplmesh.nodes.backends.NearestNodesBackend-0', 'piplmesh.nodes.backends.NearestNodesBackend-12'])
+
+class SubnetTest(test_runner.MongoEngineTestCase):
+    def setUp(self):
+        self.factory = client.RequestFactory()
+
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, 'w') as f:
+            f.write('# Subnets\n10.0.0.0/8 pekarna-1\n10.14.0.0/16 fri\n2001:db8::/32 fri\n')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_get_source_node(self):
+        with utils.override_settings(NODES_SUBNETS_FILE=self.path):
+            backend = backends.SubnetNodesBackend()
+
+        for address, name in (('10.14.1.2', 'fri'), ('10.15.1.2', 'pekarna-1'), ('2001:db8::1', 'fri'), ('192.168.1.1', None)):
+            node = backend.get_source_node(self.factory.get('/', REMOTE_ADDR=address))
+            self.assertEqual(node and node.name, name)
+
+        # X-Forwarded-For is not trusted by default
+        node = backend.get_source_node(self.factory.get('/', REMOTE_ADDR='192.168.1.1', HTTP_X_FORWARDED_FOR='10.14.1.2'))
+        self.assertEqual(node, None)
+
+    def test_trusted_proxies(self):
+        with utils.override_settings(NODES_SUBNETS_FILE=self.path, NODES_SUBNETS_TRUSTED_PROXIES=1):
+            backend = backends.SubnetNodesBackend()
+
+        # Address appended by the proxy is used
+        node = backend.get_source_node(self.factory.get('/', REMOTE_ADDR='127.0.0.1', HTTP_X_FORWARDED_FOR='10.14.1.2'))
+        self.assertEqual(node.name, 'fri')
+
+        # Addresses added by the client are ignored
+        node = backend.get_source_node(self.factory.get('/', REMOTE_ADDR='127.0.0.1', HTTP_X_FORWARDED_FOR='10.14.1.2, 192.168.1.1'))
+        self.assertEqual(node, None)
+
+    def test_mapped_prefix(self):
+        self.assertEqual(subnets.parse_prefix('::ffff:10.0.0.0/104'), subnets.parse_prefix('10.0.0.0/8'))
+        self.assertEqual(subnets.parse_prefix('::ffff:10.1.2.3'), subnets.parse_prefix('10.1.2.3/32'))
+        self.assertRaises(ValueError, subnets.parse_prefix, '::ffff:10.0.0.0/8')
+        self.assertRaises(ValueError, subnets.parse_prefix, '::ffff:10.0.0.0/129')
+
+        table = subnets.PrefixTable.parse(['::ffff:10.0.0.0/104 pekarna-1', '10.14.0.0/16 fri'])
+        self.assertEqual(table.lookup('10.1.2.3'), 'pekarna-1')
+        self.assertEqual(table.lookup('::ffff:10.14.1.2'), 'fri')
+        self.assertEqual(table.lookup('11.0.0.1'), None)
+
+    def test_reload(self):
+        with utils.override_settings(NODES_SUBNETS_FILE=self.path, NODES_SUBNETS_RELOAD_INTERVAL=0):
+            backend = backends.SubnetNodesBackend()
+
+        with open(self.path, 'w') as f:
+            f.write('192.168.0.0/16 fri\n')
+        # Make sure modification is detected even on filesystems with coarse timestamps
+        os.utime(self.path, (0, 0))
+
+        node = backend.get_source_node(self.factory.get('/', REMOTE_ADDR='192.168.1.1'))
+        self.assertEqual(node.name, 'fri')
+
+@utils.override_settings(NODES_BACKENDS=('piplmesh.nodes.backends.MongoNodesBackend',))
+class MongoTest(NodesTestCase):
+    def setUp(self):
+        super(MongoTest, self).setUp()
+        management.call_command('importnodes', os.path.join(os.path.dirname(__file__), 'fixtures', 'nodes.json'), verbosity=0)
+
+    def test_import(self):
+        backend = backends.MongoNodesBackend()
+
+        self.assertEqual(models.StoredNode.objects.count(), len(data.nodes))
+        node = backend.get_node('fri')
+        self.assertEqual(node.location, data.nodes[12].location)
+        self.assertAlmostEqual(node.latitude, data.nodes[12].latitude)
+        self.assertAlmostEqual(node.longitude, data.nodes[12].longitude)
+
+        # Import is idempotent
+        output = StringIO.StringIO()
+        management.call_command('importnodes', os.path.join(os.path.dirname(__file__), 'fixtures', 'nodes.json'), stdout=output)
+        self.assertEqual(models.StoredNode.objects.count(), len(data.nodes))
+        self.assertEqual(output.getvalue(), "Imported %d nodes (0 new, 0 changed).\n" % len(data.nodes))
+
+    def test_import_changes(self):
+        fd, path = tempfile.mkstemp()
+        with os.fdopen(fd, 'w') as f:
+            json.dump([
+                {'name': 'fri', 'location': 'Moved', 'latitude': 46.05, 'longitude': 14.5, 'url': None},
+                {'name': 'new', 'location': 'New', 'latitude': 46.1, 'longitude': 14.6, 'url': 'http://example.com/'},
+            ], f)
+
+        try:
+            output = StringIO.StringIO()
+            management.call_command('importnodes', path, delete=True, stdout=output)
+        finally:
+            os.remove(path)
+
+        self.assertEqual(output.getvalue(), "Imported 2 nodes (1 new, 1 changed).\n")
+        self.assertEqual(sorted(node.name for node in models.StoredNode.objects.all()), ['fri', 'new'])
+
+        node = models.StoredNode.objects.get(pk='fri')
+        self.assertEqual(node.location, 'Moved')
+        self.assertAlmostEqual(node.get_node_data().latitude, 46.05)
+        self.assertAlmostEqual(node.get_node_data().longitude, 14.5)
+        self.assertEqual(models.StoredNode.objects.get(pk='new').url, 'http://example.com/')
+
+    def test_get_closest_node(self):
+        backend = backends.MongoNodesBackend()
+
+        node = backend.get_closest_node(None, 46.0445688554, 14.4893038273)
+        self.assertEqual(node.name, 'fri')
+        self.assertEqual(node.get_full_node_id(), 'piplmesh.nodes.backends.MongoNodesBackend-fri')
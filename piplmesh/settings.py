@@ -115,6 +115,21 @@ DEFAULT_REQUEST = {
 
 DEFAULT_FILE_STORAGE = 'piplmesh.utils.storage.GridFSStorage'
 
+# Store uploaded files with the same content only once
+GRIDFS_DEDUPLICATION = True
+
+# Maximum size of a file uploaded through upload view, in bytes
+GRIDFS_UPLOAD_MAX_SIZE = 10 * 1024 * 1024
+
+# Local directory to mirror served GridFS files into, None to disable
+GRIDFS_DISK_CACHE_DIR = None
+# Maximum size of all mirrored files, in bytes
+GRIDFS_DISK_CACHE_MAX_SIZE = 1024 * 1024 * 1024
+# Header to pass mirrored files to the web server with (X-Sendfile, X-Accel-Redirect), None to send them through Django
+GRIDFS_DISK_CACHE_SENDFILE_HEADER = None
+# Location prefix under which the web server serves mirrored files (for X-Accel-Redirect), None to use full path
+GRIDFS_DISK_CACHE_SENDFILE_PREFIX = None
+
 # URL prefix for internationalization URLs
 I18N_URL = '/i18n/'
 
@@ -304,6 +319,27 @@ NODES_MIDDLEWARE_EXCEPTIONS = (
     PUSH_SERVER_URL,
 )
 
+# Closest node is kept until reported location moves further than this
+NODES_LOCATION_TOLERANCE = 50 # meters
+
+# Backends are queried for closest node concurrently, each with its own threads, and with a timeout
+NODES_BACKEND_TIMEOUT = 2 # seconds
+NODES_BACKEND_THREADS = 4
+
+# Per-process cache of resolved nodes in NodesMiddleware
+NODES_CACHE_TIMEOUT = 60 # seconds
+NODES_CACHE_MAX_ENTRIES = 10000
+
+# Used by piplmesh.nodes.backends.GridNodesBackend, build with buildnodesgrid management command
+NODES_GRID_FILE = None
+NODES_GRID_CELL_SIZE = 0.02 # degrees
+
+# Used by piplmesh.nodes.backends.SubnetNodesBackend
+NODES_SUBNETS_FILE = None
+NODES_SUBNETS_RELOAD_INTERVAL = 10 # seconds
+# Number of trusted reverse proxies appending to X-Forwarded-For header
+NODES_SUBNETS_TRUSTED_PROXIES = 0
+
 # Facebook settings
 # Site URL for Facebook app is set to http://127.0.0.1:8000/
 # so run your development server on port 8000
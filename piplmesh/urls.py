@@ -1,6 +1,6 @@
 from django.conf import settings
 from django.conf.urls import patterns, include, url
-from django.contrib.staticfiles.urls import static, staticfiles_urlpatterns
+from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 
 from tastypie import api
 
@@ -32,6 +32,7 @@ js_info_dict = {
 }
 
 I18N_URL = settings.I18N_URL.lstrip('/')
+MEDIA_URL = settings.MEDIA_URL.lstrip('/')
 PUSH_SERVER_URL = settings.PUSH_SERVER_URL.lstrip('/')
 
 urlpatterns = patterns('',
@@ -90,6 +91,9 @@ urlpatterns = patterns('',
     # Internals
     url(r'^' + PUSH_SERVER_URL, include('pushserver.urls')),
 
+    # Uploaded files
+    url(r'^' + MEDIA_URL + r'(?P<path>.*)$', 'piplmesh.utils.storage.serve'),
+
     # Panels
     url(r'^panels/collapse/$', frontend_views.panels_collapse, name='panels_collapse'),
     url(r'^panels/order/$', frontend_views.panels_order, name='panels_order'),
@@ -111,7 +115,6 @@ if getattr(settings, 'DEBUG', False):
         url(r'^500/$', handler500),
     )
 
-# For development, serve static and media files through Django
+# For development, serve static files through Django
 if getattr(settings, 'DEBUG', False):
     urlpatterns += staticfiles_urlpatterns()
-    urlpatterns += static(settings.MEDIA_URL, 'piplmesh.utils.storage.serve')
@@ -1,104 +1,705 @@
-import datetime
+import collections, copy, datetime, threading, time, zlib
 
 try:
     import cPickle as pickle
 except ImportError:
     import pickle
 
+from django.core import exceptions
 from django.core.cache.backends import base
-from django.utils import timezone
+from django.utils import importlib, timezone
 
 import bson
 import mongoengine
+import pymongo
 
-# TODO: Implement get_many, set_many, and delete_many
+DEFAULT_LOCAL_TIMEOUT = 5 # seconds
+DEFAULT_VALUE_CODEC = 'piplmesh.utils.cache.CompactValueCodec'
+DEFAULT_COMPRESS_THRESHOLD = 1024 # bytes
+DEFAULT_GRACE = 60 # seconds
+
+# BSON integers are read back as long if they do not fit into 32 bits
+BSON_INT_MIN = -2**31
+BSON_INT_MAX = 2**31 - 1
+
+class ValueCodecError(ValueError):
+    pass
+
+class PickleValueCodec(object):
+    """
+    Stores integers natively (so that they can be incremented) and pickles
+    everything else. This is how values were stored before codecs were
+    introduced, so documents without a codec tag are decoded this way.
+    """
+
+    def __init__(self, options):
+        self.options = options
+
+    def encode(self, value):
+        """
+        Returns a tuple of a codec tag and a value to be stored into the document.
+        """
+
+        if isinstance(value, int):
+            return 'int', value
+
+        try:
+            return 'pickle', bson.Binary(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        except pickle.PickleError, e:
+            raise ValueCodecError(e)
+
+    def decode(self, codec, value):
+        if codec is None:
+            codec = 'int' if isinstance(value, (int, long)) else 'pickle'
+
+        try:
+            if codec == 'int':
+                # Booleans are stored as integers as well
+                return value if isinstance(value, int) else int(value)
+            elif codec == 'pickle':
+                return pickle.loads(value)
+        except pickle.PickleError, e:
+            raise ValueCodecError(e)
+
+        raise ValueCodecError("Unsupported codec '%s'." % codec)
+
+class CompactValueCodec(PickleValueCodec):
+    """
+    Stores unicode strings, and dicts and lists of values which survive
+    a round trip through BSON unchanged, natively. Byte strings are stored
+    as binary data without pickling. Binary data and text over
+    ``COMPRESS_THRESHOLD`` bytes is compressed.
+    """
+
+    def __init__(self, options):
+        super(CompactValueCodec, self).__init__(options)
+
+        self.compress_threshold = int(options.get('COMPRESS_THRESHOLD', DEFAULT_COMPRESS_THRESHOLD))
+
+    def is_native(self, value):
+        if isinstance(value, (unicode, float, bool)) or value is None:
+            return True
+        elif isinstance(value, int):
+            return BSON_INT_MIN <= value <= BSON_INT_MAX
+        elif type(value) is list:
+            return all(self.is_native(v) for v in value)
+        elif type(value) is dict:
+            for k, v in value.iteritems():
+                # MongoEngine treats "_cls" and "_types" keys specially
+                if not isinstance(k, unicode) or not k or '.' in k or k.startswith('$') or k in ('_cls', '_types'):
+                    return False
+                if not self.is_native(v):
+                    return False
+            return True
+        else:
+            return False
+
+    def compress(self, codec, data):
+        if len(data) > self.compress_threshold:
+            compressed = zlib.compress(data)
+            if len(compressed) < len(data):
+                return '%s+zlib' % codec, bson.Binary(compressed)
+
+        return codec, bson.Binary(data)
+
+    def encode(self, value):
+        if isinstance(value, int):
+            return 'int', value
+        elif isinstance(value, str):
+            return self.compress('bytes', value)
+        elif isinstance(value, unicode):
+            if len(value) > self.compress_threshold:
+                return self.compress('text', value.encode('utf-8'))
+            return 'bson', value
+        elif value is not None and self.is_native(value):
+            return 'bson', value
+
+        try:
+            return self.compress('pickle', pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        except pickle.PickleError, e:
+            raise ValueCodecError(e)
+
+    def decode(self, codec, value):
+        if codec == 'bson':
+            # Stored values can be shared through the local cache
+            return copy.deepcopy(value)
+
+        if codec is not None and codec.endswith('+zlib'):
+            codec = codec[:-len('+zlib')]
+            try:
+                value = zlib.decompress(value)
+            except zlib.error, e:
+                raise ValueCodecError(e)
+
+        if codec == 'bytes':
+            return str(value)
+        elif codec == 'text':
+            try:
+                return value.decode('utf-8')
+            except UnicodeDecodeError, e:
+                raise ValueCodecError(e)
+
+        return super(CompactValueCodec, self).decode(codec, value)
+
+def load_value_codec(path, options):
+    i = path.rfind('.')
+    module, attr = path[:i], path[i+1:]
+    try:
+        mod = importlib.import_module(module)
+    except ImportError, e:
+        raise exceptions.ImproperlyConfigured('Error importing cache value codec %s: "%s"' % (path, e))
+    try:
+        cls = getattr(mod, attr)
+    except AttributeError:
+        raise exceptions.ImproperlyConfigured('Module "%s" does not define a "%s" cache value codec' % (module, attr))
+
+    return cls(options)
+
+class LocalCache(object):
+    """
+    A bounded in-process LRU cache of values in the form they are stored in
+    MongoDB, so that every hit is decoded into a fresh object.
+
+    Entries are kept until their stored expiration time, but at most ``timeout``
+    seconds, because writes from other processes cannot invalidate them.
+    """
+
+    def __init__(self, max_entries, timeout=DEFAULT_LOCAL_TIMEOUT):
+        self.max_entries = max_entries
+        self.timeout = timeout
+
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Returns stored value or ``None`` if there is no valid entry for the key.
+        """
+
+        with self._lock:
+            try:
+                value, expire, tags = self._entries.pop(key)
+            except KeyError:
+                self.misses += 1
+                return None
+
+            if expire < timezone.now():
+                self.misses += 1
+                return None
+
+            # We reinsert the entry so that it becomes the most recently used
+            self._entries[key] = (value, expire, tags)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, expire, tags=()):
+        expire = min(expire, timezone.now() + datetime.timedelta(seconds=self.timeout))
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, expire, frozenset(tags))
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_tagged(self, tag):
+        with self._lock:
+            for key in [key for key, (value, expire, tags) in self._entries.iteritems() if tag in tags]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
 
 class MongoEngineCache(base.BaseCache):
+    """
+    A cache backend storing values in a MongoDB collection.
+
+    Expired values are removed by MongoDB in the background through a TTL index.
+    The collection is not limited in size unless ``MAX_ENTRIES`` is explicitly
+    set in ``OPTIONS``, in which case it is culled on writes like Django's
+    database cache backend, respecting ``CULL_FREQUENCY``.
+
+    Optionally, an in-process LRU cache can be put in front of the collection
+    by setting ``LOCAL_MAX_ENTRIES`` in ``OPTIONS``. ``LOCAL_TIMEOUT`` limits
+    for how long (in seconds) values are served from it and ``LOCAL_KEY_PREFIXES``
+    limits it only to keys starting with any of given prefixes.
+
+    Values are encoded by a codec configured with ``VALUE_CODEC`` in ``OPTIONS``
+    (by default :class:`CompactValueCodec`), which tags every document with
+    the codec used.
+
+    Values can be stored with tags, so that all values with a given tag can be
+    removed at once with ``invalidate_tag``.
+    """
+
     def __init__(self, location, params):
         super(MongoEngineCache, self).__init__(params)
 
+        options = params.get('OPTIONS', {})
+
+        self._codec = load_value_codec(options.get('VALUE_CODEC', DEFAULT_VALUE_CODEC), options)
+
+        # BaseCache always sets a default for maximum number of entries,
+        # but we want culling only when it is explicitly configured
+        self._cull_enabled = 'MAX_ENTRIES' in options or 'max_entries' in params
+
+        local_max_entries = int(options.get('LOCAL_MAX_ENTRIES', 0))
+        if local_max_entries > 0:
+            self._local_cache = LocalCache(local_max_entries, int(options.get('LOCAL_TIMEOUT', DEFAULT_LOCAL_TIMEOUT)))
+        else:
+            self._local_cache = None
+
+        local_key_prefixes = options.get('LOCAL_KEY_PREFIXES', None)
+        self._local_key_prefixes = tuple(local_key_prefixes) if local_key_prefixes is not None else None
+
         class Cache(mongoengine.Document):
             key = mongoengine.StringField(required=True, unique=True)
             expire = mongoengine.DateTimeField(required=True)
             value = mongoengine.DynamicField(required=True)
+            codec = mongoengine.StringField()
+            tags = mongoengine.ListField(mongoengine.StringField())
 
             meta = {
                 'collection': location or 'cache',
+                # Documents are also upserted directly, without mongoengine
+                'allow_inheritance': False,
             }
 
         self._cache_class = Cache
 
+        self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        collection = self._cache_class._get_collection()
+        collection.ensure_index('key', unique=True)
+        # MongoDB removes expired documents in the background (once a minute)
+        collection.ensure_index('expire', expireAfterSeconds=0)
+        collection.ensure_index('tags', sparse=True)
+
+    def _cull(self):
+        if not self._cull_enabled:
+            return
+
+        if self._cache_class.objects.count() < self._max_entries:
+            return
+
+        self._cache_class.objects(expire__lt=timezone.now()).delete(safe=True)
+
+        count = self._cache_class.objects.count()
+        if count < self._max_entries:
+            return
+
+        if self._cull_frequency == 0 or count // self._cull_frequency >= count:
+            self._cull_all()
+            return
+
+        # We remove entries which would expire first
+        try:
+            cutoff = self._cache_class.objects.order_by('expire').only('expire')[count // self._cull_frequency]
+        except IndexError:
+            # Other processes have removed entries in the meantime
+            self._cull_all()
+            return
+        self._cache_class.objects(expire__lte=cutoff.expire).delete(safe=True)
+
+    def _cull_all(self):
+        self._cache_class.objects.delete(safe=True)
+        if self._local_cache is not None:
+            self._local_cache.clear()
+
+    def _make_tag(self, tag):
+        # Tags are namespaced like keys, but not versioned
+        return self.make_key(tag, version=1)
+
+    def _is_local(self, key):
+        if self._local_cache is None:
+            return False
+
+        return self._local_key_prefixes is None or key.startswith(self._local_key_prefixes)
+
+    def get_stats(self):
+        """
+        Returns a dict with statistics about the cache.
+
+        Counts of entries and collection size are queried from the database,
+        while statistics of the local cache are for the current process only.
+        """
+
+        collection = self._cache_class._get_collection()
+        try:
+            collection_stats = collection.database.command('collstats', collection.name)
+        except pymongo.errors.OperationFailure:
+            # Collection does not exist (yet)
+            collection_stats = {}
+
+        return {
+            'entries': self._cache_class.objects.count(),
+            'expired': self._cache_class.objects(expire__lt=timezone.now()).count(),
+            'size': collection_stats.get('size', 0),
+            'storage_size': collection_stats.get('storageSize', 0),
+            'local_entries': len(self._local_cache) if self._local_cache is not None else 0,
+            'local_hits': self._local_cache.hits if self._local_cache is not None else 0,
+            'local_misses': self._local_cache.misses if self._local_cache is not None else 0,
+        }
+
     def get(self, key, default=None, version=None):
+        is_local = self._is_local(key)
+
         key = self.make_key(key, version=version)
         self.validate_key(key)
 
-        try:
-            obj = self._cache_class.objects(key=key, expire__gte=timezone.now()).get()
+        stored = self._local_cache.get(key) if is_local else None
 
-            if isinstance(obj.value, int):
-                return obj.value
-            else:
-                try:
-                    return pickle.loads(obj.value)
-                except pickle.PickleError:
-                    return default
+        if stored is None:
+            try:
+                obj = self._cache_class.objects(key=key, expire__gte=timezone.now()).only('value', 'codec', 'expire', 'tags').get()
+            except self._cache_class.DoesNotExist:
+                return default
 
-        except self._cache_class.DoesNotExist:
+            stored = (obj.codec, obj.value)
+            if is_local:
+                self._local_cache.set(key, stored, obj.expire, obj.tags)
+
+        try:
+            return self._codec.decode(*stored)
+        except ValueCodecError:
             return default
 
-    def _set(self, key, value, timeout, version, fun):
+    def get_many(self, keys, version=None):
+        """
+        Fetches all given keys with one query.
+        """
+
+        keys_map = {}
+        local_keys = set()
+        stored = {}
+        for key in keys:
+            cache_key = self.make_key(key, version=version)
+            self.validate_key(cache_key)
+
+            if self._is_local(key):
+                local_keys.add(cache_key)
+                value = self._local_cache.get(cache_key)
+                if value is not None:
+                    stored[key] = value
+                    continue
+
+            keys_map[cache_key] = key
+
+        if keys_map:
+            for obj in self._cache_class.objects(key__in=keys_map.keys(), expire__gte=timezone.now()).only('key', 'value', 'codec', 'expire', 'tags'):
+                stored[keys_map[obj.key]] = (obj.codec, obj.value)
+                if obj.key in local_keys:
+                    self._local_cache.set(obj.key, (obj.codec, obj.value), obj.expire, obj.tags)
+
+        values = {}
+        for key, value in stored.items():
+            try:
+                values[key] = self._codec.decode(*value)
+            except ValueCodecError:
+                continue
+
+        return values
+
+    def _get_expire(self, timeout):
         if timeout is None:
             timeout = self.default_timeout
 
+        return timezone.now() + datetime.timedelta(seconds=timeout)
+
+    def _set(self, key, value, timeout, version, tags, fun):
+        is_local = self._is_local(key)
+
         key = self.make_key(key, version=version)
         self.validate_key(key)
 
-        if isinstance(value, int):
-            fun(key, value, timezone.now() + datetime.timedelta(seconds=timeout))
+        try:
+            codec, value = self._codec.encode(value)
+        except ValueCodecError:
             return
 
-        try:
-            pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
-            fun(key, bson.Binary(pickled), timezone.now() + datetime.timedelta(seconds=timeout))
-        except pickle.PickleError:
-            pass
+        self._cull()
+
+        expire = self._get_expire(timeout)
+        tags = [self._make_tag(tag) for tag in tags or ()]
+        fun(key, value, codec, expire, tags)
+
+        if is_local:
+            self._set_local(key, codec, value, expire, tags)
 
-    def _insert(self, key, value, expire):
-        self._cache_class.objects.create(key=key, value=value, expire=expire, safe=True, force_insert=True)
+    def _set_local(self, key, codec, value, expire, tags):
+        # Values stored natively are the caller's own objects, which could be changed after they are set
+        if isinstance(value, (list, dict)):
+            value = copy.deepcopy(value)
 
-    def _upsert(self, key, value, expire):
-        self._cache_class.objects(key=key).update(set__value=value, set__expire=expire, upsert=True, safe_update=True)
+        self._local_cache.set(key, (codec, value), expire, tags)
 
-    def add(self, key, value, timeout=None, version=None):
+    def _insert(self, key, value, codec, expire, tags):
         try:
-            self._set(key, value, timeout, version, self._insert)
+            self._cache_class.objects.create(key=key, value=value, codec=codec, expire=expire, tags=tags, safe=True, force_insert=True)
+        except mongoengine.OperationError:
+            # Document with the same key might have expired but not yet been removed
+            # by MongoDB, in which case we replace it (atomically, as in incr)
+            if not self._cache_class.objects(key=key, expire__lt=timezone.now()).update(set__value=value, set__codec=codec, set__expire=expire, set__tags=tags, safe_update=True):
+                raise
+
+    def _upsert(self, key, value, codec, expire, tags):
+        self._cache_class.objects(key=key).update(set__value=value, set__codec=codec, set__expire=expire, set__tags=tags, upsert=True, safe_update=True)
+
+    def add(self, key, value, timeout=None, version=None, tags=None):
+        try:
+            self._set(key, value, timeout, version, tags, self._insert)
             return True
         except mongoengine.OperationError:
             return False
 
-    def set(self, key, value, timeout=None, version=None):
-        self._set(key, value, timeout, version, self._upsert)
+    def set(self, key, value, timeout=None, version=None, tags=None):
+        self._set(key, value, timeout, version, tags, self._upsert)
+
+    def set_many(self, data, timeout=None, version=None, tags=None):
+        """
+        Stores all given values with one remove and one batch insert.
+        """
+
+        expire = self._get_expire(timeout)
+        tags = [self._make_tag(tag) for tag in tags or ()]
+
+        documents = []
+        local_values = {}
+        for key, value in data.items():
+            is_local = self._is_local(key)
+
+            key = self.make_key(key, version=version)
+            self.validate_key(key)
+
+            try:
+                codec, value = self._codec.encode(value)
+            except ValueCodecError:
+                # Left untouched, both in the database and locally, as with a failed set
+                continue
+
+            if is_local:
+                self._local_cache.delete(key)
+                # Encoded value as given, not as wrapped by the document
+                local_values[key] = (codec, value)
+
+            documents.append(self._cache_class(key=key, value=value, codec=codec, expire=expire, tags=tags))
+
+        if not documents:
+            return
+
+        self._cull()
+
+        self._cache_class.objects(key__in=[document.key for document in documents]).delete(safe=True)
+
+        try:
+            self._cache_class.objects.insert(documents, load_bulk=False, safe=True)
+        except mongoengine.OperationError:
+            # Some keys were concurrently inserted by somebody else
+            # after we removed them, so we upsert values one by one
+            for document in documents:
+                self._upsert(document.key, document.value, document.codec, document.expire, document.tags)
+
+        for key, (codec, value) in local_values.items():
+            self._set_local(key, codec, value, expire, tags)
+
+    def _find_and_increment(self, key, delta):
+        try:
+            return self._cache_class._get_collection().find_and_modify(
+                {'key': key, 'expire': {'$gte': timezone.now()}},
+                {'$inc': {'value': delta}},
+                fields={'value': True, 'codec': True},
+                new=True,
+            )
+        except pymongo.errors.OperationFailure:
+            raise ValueError("Value for key '%s' is not an integer." % key)
+
+    def incr(self, key, delta=1, version=None, initial=None, timeout=None):
+        """
+        Atomically increments value for the key and returns the new value,
+        in one round trip to the database.
+
+        If the key does not exist, ``ValueError`` is raised, unless ``initial``
+        is given, in which case a counter with value ``initial + delta`` is
+        created, expiring after ``timeout`` seconds.
+        """
+
+        is_local = self._is_local(key)
 
-    def incr(self, key, delta=1, version=None):
         key = self.make_key(key, version=version)
         self.validate_key(key)
 
-        if self._cache_class.objects(key=key, expire__gte=timezone.now()).update(inc__value=delta, safe_update=True) == 0:
-            raise ValueError
+        if is_local:
+            self._local_cache.delete(key)
+
+        obj = self._find_and_increment(key, delta)
+
+        if obj is None and initial is not None:
+            self._cull()
+
+            try:
+                # We replace the expired document with the same key, if there is one
+                obj = self._cache_class._get_collection().find_and_modify(
+                    {'key': key, 'expire': {'$lt': timezone.now()}},
+                    {'$set': {'value': initial + delta, 'codec': 'int', 'expire': self._get_expire(timeout), 'tags': []}},
+                    fields={'value': True, 'codec': True},
+                    upsert=True,
+                    new=True,
+                )
+            except pymongo.errors.OperationFailure:
+                # Somebody else created the counter in the meantime
+                obj = self._find_and_increment(key, delta)
+
+        if obj is None:
+            raise ValueError("Key '%s' not found." % key)
 
-        return self.get(key, version=version)
+        return self._codec.decode(obj.get('codec'), obj['value'])
+
+    def decr(self, key, delta=1, version=None, initial=None, timeout=None):
+        return self.incr(key, -delta, version=version, initial=initial, timeout=timeout)
 
     def has_key(self, key, version=None):
+        is_local = self._is_local(key)
+
         key = self.make_key(key, version=version)
         self.validate_key(key)
 
+        if is_local and self._local_cache.get(key) is not None:
+            return True
+
         return self._cache_class.objects(key=key, expire__gte=timezone.now()).count() > 0
 
     def delete(self, key, version=None):
+        is_local = self._is_local(key)
+
         key = self.make_key(key, version=version)
         self.validate_key(key)
 
+        if is_local:
+            self._local_cache.delete(key)
+
         self._cache_class.objects(key=key).delete(safe=True)
 
+    def delete_many(self, keys, version=None):
+        """
+        Removes all given keys with one query.
+        """
+
+        cache_keys = []
+        for key in keys:
+            is_local = self._is_local(key)
+
+            key = self.make_key(key, version=version)
+            self.validate_key(key)
+            cache_keys.append(key)
+
+            if is_local:
+                self._local_cache.delete(key)
+
+        if cache_keys:
+            self._cache_class.objects(key__in=cache_keys).delete(safe=True)
+
+    def invalidate_tag(self, tag):
+        """
+        Removes all values stored with the given tag with one query.
+
+        Local caches of other processes are not invalidated, so they can
+        still serve such values until their local timeout.
+        """
+
+        tag = self._make_tag(tag)
+
+        if self._local_cache is not None:
+            self._local_cache.delete_tagged(tag)
+
+        self._cache_class.objects(tags=tag).delete(safe=True)
+
     def clear(self):
+        if self._local_cache is not None:
+            self._local_cache.clear()
+
         self._cache_class.drop_collection()
+        self._ensure_indexes()
+
+_get_or_set_stats = {
+    'recomputations': 0,
+    'saved_recomputations': 0,
+}
+_get_or_set_stats_lock = threading.Lock()
+
+def _increment_get_or_set_stat(name):
+    with _get_or_set_stats_lock:
+        _get_or_set_stats[name] += 1
+
+def get_or_set_stats():
+    """
+    Returns a dict with counts of values (re)computed by ``get_or_set`` and of
+    recomputations saved by serving stale values, for the current process.
+    """
+
+    with _get_or_set_stats_lock:
+        return dict(_get_or_set_stats)
+
+def get_or_set(key, callable, timeout=None, grace=DEFAULT_GRACE, version=None, cache=None, tags=None):
+    """
+    Returns value for the key from the cache, computing it with ``callable`` and
+    storing it if it is missing.
+
+    The value is fresh for ``timeout`` seconds, but it is kept in the cache for
+    additional ``grace`` seconds. During that time only one caller, the one which
+    acquires a lock through cache's atomic ``add``, recomputes the value, while
+    others are served the stale value.
+
+    Values are stored together with their freshness time, so they should be
+    read only through this function. ``tags`` are passed to the cache backend
+    only if given, as only some backends support them.
+    """
+
+    if cache is None:
+        from django.core import cache as django_cache
+        cache = django_cache.cache
+
+    if timeout is None:
+        timeout = cache.default_timeout
+
+    stored = cache.get(key, version=version)
+
+    if stored is not None:
+        value, fresh_until = stored
+
+        if time.time() < fresh_until:
+            return value
+
+        lock_key = '%s-recompute-lock' % key
+
+        # The lock expires at the latest together with the stale value
+        if not cache.add(lock_key, True, max(grace, 1), version=version):
+            _increment_get_or_set_stat('saved_recomputations')
+            return value
+
+        try:
+            return _compute_and_set(key, callable, timeout, grace, version, cache, tags)
+        finally:
+            cache.delete(lock_key, version=version)
+
+    return _compute_and_set(key, callable, timeout, grace, version, cache, tags)
+
+def _compute_and_set(key, callable, timeout, grace, version, cache, tags):
+    value = callable()
+    _increment_get_or_set_stat('recomputations')
+    if tags:
+        cache.set(key, (value, time.time() + timeout), timeout + grace, version=version, tags=tags)
+    else:
+        cache.set(key, (value, time.time() + timeout), timeout + grace, version=version)
+    return value
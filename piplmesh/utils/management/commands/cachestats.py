@@ -0,0 +1,25 @@
+from django.core import cache
+from django.core.cache.backends import base as cache_base
+from django.core.management import base
+
+class Command(base.BaseCommand):
+    args = '<cache alias ...>'
+    help = 'Reports statistics of given caches, by default of the default cache.'
+
+    def handle(self, *args, **options):
+        """
+        Reports cache statistics, like collection size and number of expired entries.
+        """
+
+        for alias in args or (cache.DEFAULT_CACHE_ALIAS,):
+            try:
+                backend = cache.get_cache(alias)
+            except cache_base.InvalidCacheBackendError, e:
+                raise base.CommandError("Invalid cache '%s': %s" % (alias, e))
+
+            if not hasattr(backend, 'get_stats'):
+                raise base.CommandError("Cache '%s' does not provide statistics." % alias)
+
+            self.stdout.write("Cache '%s':\n" % alias)
+            for name, value in sorted(backend.get_stats().items()):
+                self.stdout.write("    %s: %s\n" % (name, value))
@@ -0,0 +1 @@
+# Empty models module, so that Django treats utils as an app and finds its tests
@@ -1,35 +1,299 @@
-import posixpath, time, urllib, uuid
+import calendar, collections, hashlib, os, posixpath, re, tempfile, threading, urllib, uuid
 
 from django import http
-from django.core import exceptions
-from django.core.files import storage, uploadedfile
 from django.conf import settings
+from django.core.files import storage, uploadedfile
 from django.utils import http as http_utils
 from django.views import static
 
+import gridfs
+import pymongo
+from mongoengine import connection
 from mongoengine.django import storage as mongoengine_storage
 
+STAT_CACHE_MAX_ENTRIES = 1000
+DISK_CACHE_TEMP_PREFIX = '.tmp-'
+DISK_CACHE_READ_SIZE = 64 * 1024 # bytes
+DEFAULT_DISK_CACHE_MAX_SIZE = 1024 * 1024 * 1024 # bytes
+
+FileStat = collections.namedtuple('FileStat', ('name', 'grid_id', 'size', 'content_type', 'created_time', 'md5', 'chunk_size'))
+
+class GridFSUpload(object):
+    """
+    A new file being written into GridFS chunk by chunk, computing
+    its size and hash on the fly.
+    """
+
+    def __init__(self, storage, name, content_type):
+        self.storage = storage
+        self.name = name
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+
+        self.doc = storage.document()
+        self.field = getattr(self.doc, storage.field)
+        self.field.new_file(filename=name, content_type=content_type)
+
+    def write(self, data):
+        self.sha256.update(data)
+        self.size += len(data)
+        self.field.write(data)
+
+    def abort(self):
+        """
+        Removes chunks written so far.
+        """
+
+        self.field.delete()
+
+    def close(self):
+        """
+        Finishes the file and returns the name under which it is stored.
+        """
+
+        self.field.close()
+        return self.storage._finish_upload(self)
+
+class DiskCache(object):
+    """
+    A size-bounded LRU cache of GridFS files in a local directory, which can be
+    shared between processes. As GridFS files are immutable, cached copies never
+    have to be invalidated, only removed together with files.
+
+    Files are stored under their GridFS IDs and their modification times are
+    used to track when they were last used.
+
+    Total size of the cache is tracked as files are added and removed, so the
+    directory is scanned only when the cache grows over its maximum size. As
+    other processes change the directory, too, the tracked size is only an
+    estimate, corrected with every scan.
+    """
+
+    def __init__(self, directory, max_size):
+        self.directory = directory
+        self.max_size = max_size
+        self._size = None
+        self._lock = threading.Lock()
+
+        try:
+            os.makedirs(directory)
+        except OSError:
+            # Directory already exists
+            pass
+
+    def _get_path(self, grid_id):
+        return os.path.join(self.directory, str(grid_id))
+
+    def get(self, grid_id):
+        """
+        Returns path to the cached copy of the file or ``None`` if it is not cached.
+        """
+
+        path = self._get_path(grid_id)
+        try:
+            os.utime(path, None)
+        except OSError:
+            return None
+        return path
+
+    def add(self, grid_id, gridout):
+        """
+        Copies the file into the cache, one chunk at a time, and returns path to
+        the copy. Returns ``None`` if the file is too large to be cached.
+        """
+
+        if gridout.length > self.max_size:
+            return None
+
+        path = self._get_path(grid_id)
+
+        # We write into a temporary file first so that other processes never see partial copies
+        fd, temp_path = tempfile.mkstemp(prefix=DISK_CACHE_TEMP_PREFIX, dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for data in iterate_gridout(gridout, 0, gridout.length - 1):
+                    f.write(data)
+            os.rename(temp_path, path)
+        except:
+            os.remove(temp_path)
+            raise
+
+        with self._lock:
+            if self._size is None:
+                self._cull()
+            else:
+                self._size += gridout.length
+                if self._size > self.max_size:
+                    self._cull()
+
+        return path
+
+    def delete(self, grid_id):
+        path = self._get_path(grid_id)
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+
+        with self._lock:
+            if self._size is not None:
+                self._size = max(0, self._size - size)
+
+    def cull(self):
+        """
+        Removes least recently used files until the cache fits into its maximum size.
+        """
+
+        with self._lock:
+            self._cull()
+
+    def _cull(self):
+        entries = []
+        total_size = 0
+        for filename in os.listdir(self.directory):
+            if filename.startswith(DISK_CACHE_TEMP_PREFIX):
+                continue
+            path = os.path.join(self.directory, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+        for mtime, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total_size -= size
+
+        self._size = total_size
+
+class GridFSUploadedFile(uploadedfile.UploadedFile):
+    """
+    A file which has been already stored into GridFS while it was being uploaded.
+    Its content is read back from GridFS only if needed.
+    """
+
+    def __init__(self, storage, stored_name, name, content_type, size, charset):
+        self.storage = storage
+        self.stored_name = stored_name
+        self._file = None
+
+        super(GridFSUploadedFile, self).__init__(None, name, content_type, size, charset)
+
+    def _get_file(self):
+        if self._file is None:
+            self._file = self.storage.open_gridout(self.stored_name)
+        return self._file
+
+    def _set_file(self, file):
+        self._file = file
+
+    file = property(_get_file, _set_file)
+
+    @property
+    def closed(self):
+        return self._file is None
+
+    def open(self, mode=None):
+        self.seek(0)
+
+    def close(self):
+        self._file = None
+
 class GridFSStorage(mongoengine_storage.GridFSStorage):
     """
     A storage backend to store files in GridFS, with additional
     support for UploadedFile, UUID filenames, and mimetype.
+
+    We assume GridFS files are immutable, so their metadata is
+    cached in the process.
+
+    If ``GRIDFS_DEDUPLICATION`` setting is enabled, uploaded files with
+    the same content as an existing file are not stored again, but the
+    name of the existing file is returned, and its reference count is
+    increased. Such file is deleted only when all its references are.
+
+    If ``GRIDFS_DISK_CACHE_DIR`` setting is set, files are mirrored into that
+    local directory when read through ``local_path``, keeping at most
+    ``GRIDFS_DISK_CACHE_MAX_SIZE`` bytes of least recently used files.
     """
 
+    def __init__(self, *args, **kwargs):
+        super(GridFSStorage, self).__init__(*args, **kwargs)
+
+        self.deduplication = getattr(settings, 'GRIDFS_DEDUPLICATION', False)
+
+        disk_cache_dir = getattr(settings, 'GRIDFS_DISK_CACHE_DIR', None)
+        if disk_cache_dir:
+            self.disk_cache = DiskCache(disk_cache_dir, getattr(settings, 'GRIDFS_DISK_CACHE_MAX_SIZE', DEFAULT_DISK_CACHE_MAX_SIZE))
+        else:
+            self.disk_cache = None
+
+        self._stat_cache = {}
+        self._stat_cache_lock = threading.Lock()
+
     def _save(self, name, content):
-        if not isinstance(uploadedfile.UploadedFile, content):
-            return super(GridFSStorage, self)._save(name, content)
+        if isinstance(content, GridFSUploadedFile):
+            # Already stored while it was being uploaded
+            return content.stored_name
 
-        doc = self.document()
-        field = getattr(doc, self.field)
+        if not isinstance(content, uploadedfile.UploadedFile):
+            return super(GridFSStorage, self)._save(name, content)
 
-        field.new_file(filename=name, content_type=content.content_type)
+        upload = self.new_upload(name, content.content_type)
         for chunk in content.chunks():
-            field.write(chunk)
-        field.close()
+            upload.write(chunk)
+        return upload.close()
 
-        doc.save()
+    def new_upload(self, name, content_type):
+        """
+        Returns :class:`GridFSUpload` for writing a new file chunk by chunk.
+        """
 
-        return name
+        return GridFSUpload(self, name, content_type)
+
+    def _finish_upload(self, upload):
+        if self.deduplication:
+            existing_name = self._deduplicate(upload.field.grid_id, upload.sha256.hexdigest(), upload.size)
+            if existing_name is not None:
+                upload.field.delete()
+                return existing_name
+
+        upload.doc.save()
+
+        return upload.name
+
+    def _deduplicate(self, grid_id, sha256, length):
+        """
+        Adds a reference to an existing file with the same content and returns
+        its name. Otherwise, marks the new file as referenced once and
+        returns ``None``.
+        """
+
+        db, collection_name = self._get_gridfs_database()
+        files = db[collection_name].files
+        files.ensure_index('sha256', sparse=True)
+
+        # Files with zero references are being deleted
+        existing = files.find_and_modify(
+            {'sha256': sha256, 'length': length, 'references': {'$gte': 1}},
+            {'$inc': {'references': 1}},
+            fields={'filename': True},
+        )
+        if existing is not None:
+            return existing['filename']
+
+        # We set the hash only now, so that concurrent uploads of the
+        # same content cannot reference each other and both be removed
+        files.update({'_id': grid_id}, {'$set': {'sha256': sha256, 'references': 1}}, safe=True)
+
+        return None
 
     def get_available_name(self, name):
         # We ignore given name
@@ -40,28 +304,210 @@ class GridFSStorage(mongoengine_storage.GridFSStorage):
 
         return name
 
-    def created_time(self, name):
-        doc = self._get_doc_with_name(name)
-        if doc:
-            return getattr(doc, self.field).upload_date
-        else:
+    def _get_gridfs_database(self):
+        field = self.document._fields[self.field]
+        return connection.get_db(field.db_alias), field.collection_name
+
+    def stat(self, name):
+        """
+        Returns :class:`FileStat` with all metadata of the file, fetched with
+        one query, or from the cache.
+        """
+
+        with self._stat_cache_lock:
+            try:
+                return self._stat_cache[name]
+            except KeyError:
+                pass
+
+        db, collection_name = self._get_gridfs_database()
+        files = db[collection_name].files
+        files.ensure_index([('filename', pymongo.ASCENDING), ('uploadDate', pymongo.DESCENDING)])
+
+        # The last version of the file, like GridFS.get_last_version
+        f = files.find_one({'filename': name}, sort=[('uploadDate', pymongo.DESCENDING)])
+        if f is None:
             raise ValueError("No such file or directory: '%s'" % name)
 
+        stat = FileStat(
+            name=name,
+            grid_id=f['_id'],
+            size=f['length'],
+            content_type=f.get('contentType'),
+            created_time=f['uploadDate'],
+            md5=f.get('md5'),
+            chunk_size=f['chunkSize'],
+        )
+
+        with self._stat_cache_lock:
+            if len(self._stat_cache) >= STAT_CACHE_MAX_ENTRIES:
+                self._stat_cache.clear()
+            self._stat_cache[name] = stat
+
+        return stat
+
+    def delete(self, name):
+        try:
+            stat = self.stat(name)
+        except ValueError:
+            return
+
+        db, collection_name = self._get_gridfs_database()
+
+        # Deduplicated files are deleted only when their last reference is
+        f = db[collection_name].files.find_and_modify(
+            {'_id': stat.grid_id, 'references': {'$gte': 1}},
+            {'$inc': {'references': -1}},
+            fields={'references': True},
+            new=True,
+        )
+        if f is not None and f['references'] > 0:
+            return
+
+        gridfs.GridFS(db, collection_name).delete(stat.grid_id)
+        self.document.objects(__raw__={self.document._fields[self.field].db_field: stat.grid_id}).delete(safe=True)
+
+        with self._stat_cache_lock:
+            self._stat_cache.pop(name, None)
+
+        if self.disk_cache is not None:
+            self.disk_cache.delete(stat.grid_id)
+
+    def exists(self, name):
+        try:
+            self.stat(name)
+            return True
+        except ValueError:
+            return False
+
+    def size(self, name):
+        return self.stat(name).size
+
+    def created_time(self, name):
+        return self.stat(name).created_time
+
     def modified_time(self, name):
         # We assume GridFS files are immutable
         # (new version is done for changes)
         return self.created_time(name)
 
     def mimetype(self, name):
-        doc = self._get_doc_with_name(name)
-        if doc:
-            return getattr(doc, self.field).content_type
-        else:
+        return self.stat(name).content_type
+
+    def open_gridout(self, name):
+        """
+        Returns GridFS file object for the file, which reads
+        the file from the database one chunk at a time.
+        """
+
+        db, collection_name = self._get_gridfs_database()
+        try:
+            return gridfs.GridFS(db, collection_name).get(self.stat(name).grid_id)
+        except gridfs.errors.NoFile:
             raise ValueError("No such file or directory: '%s'" % name)
 
+    def local_path(self, name):
+        """
+        Returns path to a local copy of the file, mirroring it into the disk
+        cache if needed, or ``None`` if there is no disk cache or the file is
+        too large for it.
+        """
+
+        if self.disk_cache is None:
+            return None
+
+        stat = self.stat(name)
+
+        path = self.disk_cache.get(stat.grid_id)
+        if path is None:
+            path = self.disk_cache.add(stat.grid_id, self.open_gridout(name))
+
+        return path
+
+RANGE_REGEX = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+def parse_range(range_header, size):
+    """
+    Parses a single byte range from a HTTP ``Range`` header.
+
+    Returns a tuple of the first and last byte position, or ``None`` if the
+    header should be ignored (also for multiple ranges, which we do not support).
+    Raises ``ValueError`` if the range is not satisfiable.
+    """
+
+    match = RANGE_REGEX.match(range_header.strip())
+    if not match:
+        return None
+
+    first, last = match.groups()
+
+    if first:
+        first = int(first)
+        if last and int(last) < first:
+            return None
+        if first >= size:
+            raise ValueError("Range not satisfiable.")
+        last = min(int(last), size - 1) if last else size - 1
+    elif last:
+        # Suffix range, last N bytes
+        if int(last) == 0 or size == 0:
+            raise ValueError("Range not satisfiable.")
+        first = max(size - int(last), 0)
+        last = size - 1
+    else:
+        return None
+
+    return first, last
+
+def iterate_gridout(gridout, first, last):
+    """
+    Yields content of the GridFS file between given byte positions (inclusive),
+    reading at most one chunk from the database at a time.
+    """
+
+    gridout.seek(first)
+
+    remaining = last - first + 1
+    # We align reads with chunk boundaries
+    size = gridout.chunk_size - first % gridout.chunk_size
+    while remaining > 0:
+        data = gridout.read(min(size, remaining))
+        if not data:
+            break
+        remaining -= len(data)
+        size = gridout.chunk_size
+        yield data
+
+def iterate_local_file(f, first, last):
+    """
+    Yields content of the opened local file between given byte positions
+    (inclusive) and closes it at the end.
+    """
+
+    with f:
+        f.seek(first)
+
+        remaining = last - first + 1
+        while remaining > 0:
+            data = f.read(min(DISK_CACHE_READ_SIZE, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            yield data
+
 def serve(request, path):
     """
-    Serve files from default storage.
+    Serves files from default storage, which has to be :class:`GridFSStorage`.
+
+    Files are streamed one GridFS chunk at a time. Single byte ranges, and
+    conditional requests based on ETags (derived from files' MD5 sums) and
+    modification times are supported.
+
+    If storage mirrors files into a local disk cache, files are served from it.
+    If ``GRIDFS_DISK_CACHE_SENDFILE_HEADER`` setting is set (for example, to
+    ``X-Sendfile`` or ``X-Accel-Redirect``), sending them is left to the web
+    server, by setting the header to their path, relative to
+    ``GRIDFS_DISK_CACHE_SENDFILE_PREFIX`` setting if it is set.
 
     To use, put a URL pattern such as::
 
@@ -70,39 +516,89 @@ def serve(request, path):
     in your URLconf.
     """
 
-    if not settings.DEBUG:
-        raise exceptions.ImproperlyConfigured("The view can only be used in debug mode.")
     normalized_path = posixpath.normpath(urllib.unquote(path)).lstrip('/')
 
-    if not storage.default_storage.exists(normalized_path):
+    try:
+        stat = storage.default_storage.stat(normalized_path)
+    except ValueError:
         if path.endswith('/') or path == '':
             raise http.Http404("Directory indexes are not allowed here.")
         raise http.Http404("'%s' could not be found" % path)
 
-    try:
-        mimetype = storage.default_storage.mimetype(normalized_path) or 'application/octet-stream'
-    except (NotImplementedError, AttributeError):
-        mimetype = 'application/octet-stream'
+    mimetype = stat.content_type or 'application/octet-stream'
+    modified_time = calendar.timegm(stat.created_time.utctimetuple())
+    size = stat.size
+    etag = '"%s"' % stat.md5
+
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match is not None:
+        if if_none_match.strip() == '*' or etag in [e.strip() for e in if_none_match.split(',')]:
+            response = http.HttpResponseNotModified(mimetype=mimetype)
+            response['ETag'] = etag
+            return response
+    elif not static.was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'), modified_time, size):
+        return http.HttpResponseNotModified(mimetype=mimetype)
 
     try:
-        modified_time = time.mktime(storage.default_storage.modified_time(normalized_path).timetuple())
-    except (NotImplementedError, AttributeError):
-        modified_time = None
+        local_path = storage.default_storage.local_path(normalized_path)
+    except ValueError:
+        # File was deleted in the meantime
+        raise http.Http404("'%s' could not be found" % path)
 
-    size = storage.default_storage.size(normalized_path)
+    sendfile_header = getattr(settings, 'GRIDFS_DISK_CACHE_SENDFILE_HEADER', None)
+    if local_path is not None and sendfile_header:
+        # Web server takes care of byte ranges as well
+        response = http.HttpResponse(mimetype=mimetype)
+        sendfile_prefix = getattr(settings, 'GRIDFS_DISK_CACHE_SENDFILE_PREFIX', None)
+        if sendfile_prefix:
+            response[sendfile_header] = posixpath.join(sendfile_prefix, os.path.basename(local_path))
+        else:
+            response[sendfile_header] = local_path
+        response['ETag'] = etag
+        response['Last-Modified'] = http_utils.http_date(modified_time)
+        return response
 
-    if modified_time is not None and not static.was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'), modified_time, size):
-        return http.HttpResponseNotModified(mimetype=mimetype)
+    byte_range = None
+    range_header = request.META.get('HTTP_RANGE')
+    if_range = request.META.get('HTTP_IF_RANGE')
+    # If-Range with a date is not supported, so in that case we serve whole file
+    if range_header and (if_range is None or if_range.strip() == etag):
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            response = http.HttpResponse(status=416, mimetype=mimetype)
+            response['Content-Range'] = 'bytes */%s' % size
+            return response
 
-    f = storage.default_storage.open(normalized_path, 'rb')
-    try:
-        response = http.HttpResponse(f.read(), mimetype=mimetype)
-    finally:
-        f.close()
+    if byte_range is None:
+        first, last = 0, size - 1
+    else:
+        first, last = byte_range
 
-    response['Content-Length'] = size
+    content = None
+    if local_path is not None:
+        try:
+            content = iterate_local_file(open(local_path, 'rb'), first, last)
+        except IOError:
+            # File was removed from the disk cache in the meantime
+            pass
 
-    if modified_time is not None:
-        response['Last-Modified'] = http_utils.http_date(modified_time)
+    if content is None:
+        try:
+            content = iterate_gridout(storage.default_storage.open_gridout(normalized_path), first, last)
+        except ValueError:
+            # File was deleted in the meantime
+            raise http.Http404("'%s' could not be found" % path)
+
+    if byte_range is None:
+        response = http.HttpResponse(content, mimetype=mimetype)
+    else:
+        response = http.HttpResponse(content, status=206, mimetype=mimetype)
+        response['Content-Range'] = 'bytes %s-%s/%s' % (first, last, size)
+
+    response['Content-Length'] = last - first + 1
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Last-Modified'] = http_utils.http_date(modified_time)
 
     return response
@@ -0,0 +1,796 @@
+import datetime, os, shutil, StringIO, tempfile, time
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from django.core import management
+from django.core.files import storage as django_storage, uploadedfile, uploadhandler as django_uploadhandler
+from django.test import client, utils
+from django.utils import functional, timezone
+
+import bson
+from mongoengine import queryset
+
+from tastypie_mongoengine import test_runner
+
+from piplmesh.utils import cache, storage, uploadhandler
+
+class CacheTest(test_runner.MongoEngineTestCase):
+    def setUp(self):
+        self.cache = cache.MongoEngineCache('test_cache', {})
+
+    def test_incr_initial(self):
+        self.assertRaises(ValueError, self.cache.incr, 'counter')
+
+        self.assertEqual(self.cache.incr('counter', initial=0), 1)
+        self.assertEqual(self.cache.incr('counter', 2, initial=0), 3)
+
+        # Counter created by incr is a regular value
+        self.assertEqual(self.cache.get('counter'), 3)
+        self.assertEqual(self.cache.get_many(['counter']), {'counter': 3})
+        self.assertTrue(self.cache.has_key('counter'))
+        self.assertFalse(self.cache.add('counter', 10))
+
+        self.cache.delete('counter')
+        self.assertEqual(self.cache.get('counter'), None)
+
+    def test_incr_expired(self):
+        self.cache.set('counter', 5, timeout=-10, tags=['tag'])
+        self.assertEqual(self.cache.get('counter'), None)
+
+        # Expired document is replaced, without its tags
+        self.assertEqual(self.cache.incr('counter', initial=10), 11)
+        self.cache.invalidate_tag('tag')
+        self.assertEqual(self.cache.get('counter'), 11)
+
+    def test_incr_race(self):
+        find_and_increment = self.cache._find_and_increment
+        calls = []
+
+        def concurrent_find_and_increment(key, delta):
+            calls.append(key)
+            if len(calls) == 1:
+                # Somebody else creates the counter after our lookup
+                self.cache.set('counter', 5)
+                return None
+            return find_and_increment(key, delta)
+
+        self.cache._find_and_increment = concurrent_find_and_increment
+
+        self.assertEqual(self.cache.incr('counter', initial=0), 6)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(self.cache.get('counter'), 6)
+
+    def test_decr(self):
+        self.cache.set('counter', 10)
+        self.assertEqual(self.cache.decr('counter', 3), 7)
+        self.assertEqual(self.cache.get('counter'), 7)
+
+        self.assertRaises(ValueError, self.cache.decr, 'missing')
+        self.assertEqual(self.cache.decr('missing', 2, initial=10), 8)
+
+    def test_add(self):
+        self.assertTrue(self.cache.add('key', u'value'))
+        self.assertFalse(self.cache.add('key', u'other'))
+        self.assertEqual(self.cache.get('key'), u'value')
+
+    def test_add_expired(self):
+        # Expired document which has not yet been removed by MongoDB is replaced
+        self.cache.set('key', u'value', timeout=-10, tags=['tag'])
+        self.assertTrue(self.cache.add('key', u'other'))
+        self.assertEqual(self.cache.get('key'), u'other')
+        self.assertEqual(self.cache._cache_class.objects.count(), 1)
+
+        self.cache.invalidate_tag('tag')
+        self.assertEqual(self.cache.get('key'), u'other')
+
+    def test_get_many(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', u'b')
+        self.cache.set('expired', 3, timeout=-10)
+
+        self.assertEqual(self.cache.get_many(['a', 'b', 'expired', 'missing']), {'a': 1, 'b': u'b'})
+        self.assertEqual(self.cache.get_many([]), {})
+
+    def test_set_many(self):
+        self.cache.set('a', 0)
+        self.cache.set('c', u'old')
+
+        # Value which cannot be encoded is skipped, leaving the old value
+        self.cache.set_many({'a': 1, 'b': [1, 2], 'c': lambda: None})
+        self.assertEqual(self.cache.get_many(['a', 'b', 'c']), {'a': 1, 'b': [1, 2], 'c': u'old'})
+
+        self.cache.set_many({'a': 2}, timeout=-10)
+        self.assertEqual(self.cache.get('a'), None)
+
+    def test_set_many_race(self):
+        insert = queryset.QuerySet.insert
+
+        def concurrent_insert(queryset, documents, *args, **kwargs):
+            # Somebody else stores a key after it has been removed
+            self.cache._cache_class._get_collection().insert({
+                'key': self.cache.make_key('b'),
+                'value': u'other',
+                'codec': 'bson',
+                'expire': timezone.now() + datetime.timedelta(seconds=60),
+            }, safe=True)
+            return insert(queryset, documents, *args, **kwargs)
+
+        queryset.QuerySet.insert = concurrent_insert
+        try:
+            self.cache.set_many({'a': 1, 'b': 2, 'c': 3})
+        finally:
+            queryset.QuerySet.insert = insert
+
+        # Values are upserted one by one instead
+        self.assertEqual(self.cache.get_many(['a', 'b', 'c']), {'a': 1, 'b': 2, 'c': 3})
+        self.assertEqual(self.cache._cache_class.objects.count(), 3)
+
+    def test_delete_many(self):
+        self.cache.set_many({'a': 1, 'b': 2, 'c': 3})
+
+        self.cache.delete_many(['a', 'b', 'missing'])
+        self.assertEqual(self.cache.get_many(['a', 'b', 'c']), {'c': 3})
+
+        self.cache.delete_many([])
+        self.assertEqual(self.cache.get('c'), 3)
+
+    def test_invalidate_tag(self):
+        self.cache.set('set', 1, tags=['tag', 'other'])
+        self.cache.add('add', 2, tags=['tag'])
+        self.cache.set_many({'many1': 3, 'many2': 4}, tags=['tag'])
+        self.cache.set('other', 5, tags=['other'])
+        self.cache.set('untagged', 6)
+
+        self.cache.invalidate_tag('tag')
+        self.assertEqual(self.cache.get_many(['set', 'add', 'many1', 'many2', 'other', 'untagged']), {'other': 5, 'untagged': 6})
+
+        # Tags are namespaced like keys
+        prefixed_cache = cache.MongoEngineCache('test_cache', {'KEY_PREFIX': 'prefix'})
+        prefixed_cache.set('other', 7, tags=['other'])
+        prefixed_cache.invalidate_tag('other')
+        self.assertEqual(self.cache.get('other'), 5)
+        self.assertEqual(prefixed_cache.get('other'), None)
+
+class LocalCacheTest(test_runner.MongoEngineTestCase):
+    def setUp(self):
+        self.cache = cache.MongoEngineCache('test_cache', {'OPTIONS': {'LOCAL_MAX_ENTRIES': 10, 'LOCAL_TIMEOUT': 60}})
+
+    def set_stored(self, key, value):
+        # Changes the value behind the local cache, as another process would
+        self.cache._cache_class.objects(key=self.cache.make_key(key)).update(set__value=value, set__codec='bson', safe_update=True)
+
+    def test_hits(self):
+        self.cache.set('key', u'value')
+        self.set_stored('key', u'other')
+
+        self.assertEqual(self.cache.get('key'), u'value')
+        self.assertEqual(self.cache.get_many(['key']), {'key': u'value'})
+        self.assertEqual(self.cache.get('missing'), None)
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats['local_entries'], 1)
+        self.assertEqual(stats['local_hits'], 2)
+        self.assertEqual(stats['local_misses'], 1)
+
+    def test_fetched(self):
+        self.cache.set('key', u'value')
+        self.cache._local_cache.clear()
+
+        # Value fetched from the database is stored locally
+        self.assertEqual(self.cache.get('key'), u'value')
+        self.set_stored('key', u'other')
+        self.assertEqual(self.cache.get('key'), u'value')
+
+    def test_key_prefixes(self):
+        prefixed_cache = cache.MongoEngineCache('test_cache', {'OPTIONS': {'LOCAL_MAX_ENTRIES': 10, 'LOCAL_KEY_PREFIXES': ['local-']}})
+
+        prefixed_cache.set('local-key', u'value')
+        prefixed_cache.set('key', u'value')
+        self.set_stored('local-key', u'other')
+        self.set_stored('key', u'other')
+
+        self.assertEqual(prefixed_cache.get('local-key'), u'value')
+        self.assertEqual(prefixed_cache.get('key'), u'other')
+        self.assertEqual(prefixed_cache.get_stats()['local_entries'], 1)
+
+    def test_timeout(self):
+        local_cache = cache.LocalCache(10, 5)
+
+        # Local entries are kept at most for the local timeout
+        local_cache.set('key', 'value', timezone.now() + datetime.timedelta(hours=1))
+        value, expire, tags = local_cache._entries['key']
+        self.assertLessEqual(expire, timezone.now() + datetime.timedelta(seconds=5))
+
+        # And not after the stored value expires
+        local_cache.set('key', 'value', timezone.now() - datetime.timedelta(seconds=1))
+        self.assertEqual(local_cache.get('key'), None)
+
+    def test_max_entries(self):
+        local_cache = cache.LocalCache(2, 60)
+        expire = timezone.now() + datetime.timedelta(seconds=60)
+
+        local_cache.set('a', 1, expire)
+        local_cache.set('b', 2, expire)
+        local_cache.get('a')
+        local_cache.set('c', 3, expire)
+
+        # Least recently used entry is removed
+        self.assertEqual(local_cache.get('b'), None)
+        self.assertEqual(local_cache.get('a'), 1)
+        self.assertEqual(local_cache.get('c'), 3)
+
+    def test_invalidation(self):
+        self.cache.set('key', u'value')
+        self.cache.set('key', u'new value')
+        self.assertEqual(self.cache.get('key'), u'new value')
+
+        self.cache.delete('key')
+        self.assertEqual(self.cache.get('key'), None)
+
+        self.cache.set('counter', 1)
+        self.assertEqual(self.cache.get('counter'), 1)
+        self.cache.incr('counter')
+        self.assertEqual(self.cache.get('counter'), 2)
+
+        self.cache.set_many({'a': u'a', 'b': u'b'})
+        self.cache.delete_many(['a', 'b'])
+        self.assertEqual(self.cache.get_many(['a', 'b']), {})
+
+    def test_invalidate_tag(self):
+        self.cache.set('set', 1, tags=['tag'])
+        self.cache.add('add', 2, tags=['tag'])
+        self.cache.set_many({'many': 3}, tags=['tag'])
+        self.cache.set('other', 4, tags=['other'])
+
+        self.cache.invalidate_tag('tag')
+
+        # Tagged values are removed from the local cache as well
+        self.assertEqual(self.cache.get_stats()['local_entries'], 1)
+        self.assertEqual(self.cache.get_many(['set', 'add', 'many', 'other']), {'other': 4})
+
+    def test_mutable_values(self):
+        value = {u'list': [1, 2]}
+        self.cache.set('key', value)
+        self.cache.set_many({'many': value})
+
+        # Neither changes to the stored value nor to a returned value are seen
+        value[u'list'].append(3)
+        self.cache.get('key')[u'list'].append(4)
+        self.assertEqual(self.cache.get('key'), {u'list': [1, 2]})
+        self.assertEqual(self.cache.get('many'), {u'list': [1, 2]})
+
+class CullTest(test_runner.MongoEngineTestCase):
+    def make_cache(self, cull_frequency, expired=0):
+        cache_backend = cache.MongoEngineCache('test_cache', {'OPTIONS': {'MAX_ENTRIES': 10, 'CULL_FREQUENCY': cull_frequency}})
+        for i in range(10):
+            cache_backend.set('key%d' % i, i, (i + 1) * 60 if i >= expired else -10)
+        return cache_backend
+
+    def get_keys(self, cache_backend):
+        return sorted(cache_backend.get_many(['key%d' % i for i in range(11)]).keys())
+
+    def test_cull(self):
+        cache_backend = self.make_cache(2)
+
+        # Entries which would expire first are removed
+        cache_backend.set('key10', 10, 3600)
+        self.assertEqual(self.get_keys(cache_backend), ['key10', 'key6', 'key7', 'key8', 'key9'])
+
+    def test_cull_expired(self):
+        cache_backend = self.make_cache(2, expired=2)
+
+        # Only expired entries are removed, as then there is space
+        cache_backend.set('key10', 10, 3600)
+        self.assertEqual(cache_backend._cache_class.objects.count(), 9)
+
+    def test_cull_all(self):
+        for cull_frequency in (0, 1):
+            cache_backend = self.make_cache(cull_frequency)
+            cache_backend.set('key10', 10, 3600)
+            self.assertEqual(self.get_keys(cache_backend), ['key10'])
+            cache_backend.clear()
+
+    def test_cull_race(self):
+        cache_backend = self.make_cache(2)
+        count = queryset.QuerySet.count
+
+        def stale_count(queryset, *args, **kwargs):
+            # Other processes remove entries after they are counted
+            return count(queryset, *args, **kwargs) * 2
+
+        queryset.QuerySet.count = stale_count
+        try:
+            cache_backend.set('key10', 10, 3600)
+        finally:
+            queryset.QuerySet.count = count
+
+        self.assertEqual(self.get_keys(cache_backend), ['key10'])
+
+    def test_not_culled(self):
+        # Without MAX_ENTRIES the collection is not limited
+        cache_backend = cache.MongoEngineCache('test_cache', {})
+        for i in range(400):
+            cache_backend.set('key%d' % i, i)
+        self.assertEqual(cache_backend._cache_class.objects.count(), 400)
+
+class StatsTest(test_runner.MongoEngineTestCase):
+    def test_get_stats(self):
+        cache_backend = cache.MongoEngineCache('test_cache', {'OPTIONS': {'LOCAL_MAX_ENTRIES': 10}})
+
+        stats = cache_backend.get_stats()
+        self.assertEqual(stats['entries'], 0)
+        self.assertEqual(stats['size'], 0)
+
+        cache_backend.set('a', 1)
+        cache_backend.set('b', 2)
+        cache_backend.set('c', 3, timeout=-10)
+        cache_backend.get('a')
+        cache_backend.get('c')
+
+        stats = cache_backend.get_stats()
+        self.assertEqual(stats['entries'], 3)
+        self.assertEqual(stats['expired'], 1)
+        self.assertGreater(stats['size'], 0)
+        self.assertGreater(stats['storage_size'], 0)
+        self.assertEqual(stats['local_entries'], 2)
+        self.assertEqual(stats['local_hits'], 1)
+        self.assertEqual(stats['local_misses'], 1)
+
+    def test_command(self):
+        output = StringIO.StringIO()
+        management.call_command('cachestats', stdout=output)
+
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0], "Cache 'default':")
+        self.assertEqual(sorted(line.split(':')[0].strip() for line in lines[1:]), ['entries', 'expired', 'local_entries', 'local_hits', 'local_misses', 'size', 'storage_size'])
+
+class GetOrSetTest(test_runner.MongoEngineTestCase):
+    def setUp(self):
+        self.cache = cache.MongoEngineCache('test_cache', {})
+        self.computed = 0
+
+    def compute(self):
+        self.computed += 1
+        return self.computed
+
+    def get_or_set(self):
+        return cache.get_or_set('key', self.compute, timeout=60, grace=60, cache=self.cache)
+
+    def set_stale(self):
+        # Value is not fresh anymore, but it is still in its grace time
+        self.cache.set('key', (u'stale', time.time() - 1), 60)
+
+    def test_fresh(self):
+        stats = cache.get_or_set_stats()
+
+        self.assertEqual(self.get_or_set(), 1)
+        self.assertEqual(self.get_or_set(), 1)
+        self.assertEqual(self.computed, 1)
+        self.assertEqual(cache.get_or_set_stats()['recomputations'], stats['recomputations'] + 1)
+
+    def test_stale(self):
+        self.set_stale()
+
+        self.assertEqual(self.get_or_set(), 1)
+        self.assertEqual(self.get_or_set(), 1)
+        self.assertEqual(self.computed, 1)
+
+        # Lock is released after recomputation
+        self.assertEqual(self.cache.get('key-recompute-lock'), None)
+
+    def test_stale_locked(self):
+        self.set_stale()
+        self.assertTrue(self.cache.add('key-recompute-lock', True, 60))
+        stats = cache.get_or_set_stats()
+
+        # Somebody else is recomputing the value, so stale value is returned
+        self.assertEqual(self.get_or_set(), u'stale')
+        self.assertEqual(self.computed, 0)
+        self.assertEqual(cache.get_or_set_stats()['saved_recomputations'], stats['saved_recomputations'] + 1)
+
+    def test_expired_lock(self):
+        self.set_stale()
+        # Lock left by a crashed caller, expired but not yet removed by MongoDB
+        self.cache.set('key-recompute-lock', True, -10)
+
+        self.assertEqual(self.get_or_set(), 1)
+        self.assertEqual(self.computed, 1)
+
+class CodecTest(test_runner.MongoEngineTestCase):
+    def setUp(self):
+        self.codec = cache.CompactValueCodec({})
+
+    def round_trip(self, value, expected_codec):
+        codec, encoded = self.codec.encode(value)
+        self.assertEqual(codec, expected_codec)
+
+        # Value is read back as it would be from the database
+        stored = bson.BSON.encode({'value': encoded}).decode()['value']
+        decoded = self.codec.decode(codec, stored)
+        self.assertEqual(decoded, value)
+        self.assertEqual(type(decoded), type(value))
+        return decoded
+
+    def test_strings(self):
+        self.round_trip(u'\u010d\u0161\u017e', 'bson')
+        self.round_trip('\x00\xff bytes', 'bytes')
+        self.round_trip('', 'bytes')
+
+    def test_numbers(self):
+        self.round_trip(0, 'int')
+        self.round_trip(cache.BSON_INT_MAX, 'int')
+        self.round_trip(cache.BSON_INT_MIN, 'int')
+        # Read back as long, but converted back
+        self.round_trip(cache.BSON_INT_MAX + 1, 'int')
+        self.round_trip(cache.BSON_INT_MIN - 1, 'int')
+        self.round_trip(2**70, 'pickle')
+        self.round_trip(1.5, 'bson')
+        self.round_trip(True, 'int')
+        self.round_trip(False, 'int')
+        self.round_trip(None, 'pickle')
+
+    def test_containers(self):
+        self.round_trip({u'a': [1, 1.5, u'b', None, True], u'c': {u'd': u'e'}}, 'bson')
+        self.round_trip([1, [u'a', {u'b': False}]], 'bson')
+
+        # Values which would not survive BSON unchanged are pickled
+        self.assertEqual(self.round_trip({'a': 1}, 'pickle').keys()[0].__class__, str)
+        self.round_trip({u'_cls': u'a'}, 'pickle')
+        self.round_trip({u'_types': [u'a']}, 'pickle')
+        self.round_trip({u'a.b': 1}, 'pickle')
+        self.round_trip({u'$a': 1}, 'pickle')
+        self.round_trip([cache.BSON_INT_MAX + 1], 'pickle')
+        self.round_trip([u'a', 'b'], 'pickle')
+        self.round_trip((1, 2), 'pickle')
+
+    def test_compression(self):
+        self.round_trip(u'\u010d' * 2000, 'text+zlib')
+        self.round_trip('x' * 2000, 'bytes+zlib')
+        self.round_trip({'a': 'x' * 2000}, 'pickle+zlib')
+
+        # Data which does not get smaller is not compressed
+        self.round_trip(os.urandom(2000), 'bytes')
+
+    def test_untagged(self):
+        # Documents stored before codecs were introduced
+        self.assertEqual(self.codec.decode(None, 5), 5)
+        self.assertEqual(type(self.codec.decode(None, long(5))), int)
+        self.assertEqual(self.codec.decode(None, bson.Binary(pickle.dumps({'a': [1, 2]}, pickle.HIGHEST_PROTOCOL))), {'a': [1, 2]})
+
+    def test_invalid(self):
+        self.assertRaises(cache.ValueCodecError, self.codec.decode, 'unknown', 1)
+        self.assertRaises(cache.ValueCodecError, self.codec.decode, 'bytes+zlib', bson.Binary('not compressed'))
+        self.assertRaises(cache.ValueCodecError, self.codec.decode, 'text', bson.Binary('\xff'))
+        self.assertRaises(cache.ValueCodecError, self.codec.encode, lambda: None)
+
+    def test_cache(self):
+        cache_backend = cache.MongoEngineCache('test_cache', {})
+
+        # Old documents without a codec tag can still be read
+        cache_backend._cache_class._get_collection().insert({
+            'key': cache_backend.make_key('legacy'),
+            'value': bson.Binary(pickle.dumps([1, 2], pickle.HIGHEST_PROTOCOL)),
+            'expire': timezone.now() + datetime.timedelta(seconds=60),
+        }, safe=True)
+        self.assertEqual(cache_backend.get('legacy'), [1, 2])
+
+        for value in ({u'a': 1}, {'a': 1}, [1, u'a']):
+            cache_backend.set('key', value)
+            self.assertEqual(cache_backend.get('key'), value)
+
+        for value in (u'text', 'bytes', u'x' * 2000, cache.BSON_INT_MAX + 1, True):
+            cache_backend.set('key', value)
+            self.assertEqual(cache_backend.get('key'), value)
+            self.assertEqual(type(cache_backend.get('key')), type(value))
+
+class RangeTest(test_runner.MongoEngineTestCase):
+    def test_parse_range(self):
+        self.assertEqual(storage.parse_range('bytes=0-9', 100), (0, 9))
+        self.assertEqual(storage.parse_range('bytes=90-', 100), (90, 99))
+        self.assertEqual(storage.parse_range('bytes=90-200', 100), (90, 99))
+        self.assertEqual(storage.parse_range('bytes=99-99', 100), (99, 99))
+
+    def test_parse_suffix_range(self):
+        self.assertEqual(storage.parse_range('bytes=-10', 100), (90, 99))
+        self.assertEqual(storage.parse_range('bytes=-200', 100), (0, 99))
+
+    def test_unsatisfiable_range(self):
+        self.assertRaises(ValueError, storage.parse_range, 'bytes=100-', 100)
+        self.assertRaises(ValueError, storage.parse_range, 'bytes=100-200', 100)
+        self.assertRaises(ValueError, storage.parse_range, 'bytes=-0', 100)
+        self.assertRaises(ValueError, storage.parse_range, 'bytes=-5', 0)
+        self.assertRaises(ValueError, storage.parse_range, 'bytes=0-', 0)
+
+    def test_ignored_range(self):
+        # Last position before the first one makes range invalid, so header is ignored
+        self.assertEqual(storage.parse_range('bytes=10-5', 100), None)
+        # Multiple ranges are not supported
+        self.assertEqual(storage.parse_range('bytes=0-1,5-6', 100), None)
+        self.assertEqual(storage.parse_range('items=0-1', 100), None)
+        self.assertEqual(storage.parse_range('bytes=-', 100), None)
+
+class ServeTest(test_runner.MongoEngineTestCase):
+    def setUp(self):
+        self.factory = client.RequestFactory()
+        self.name = django_storage.default_storage.save('', uploadedfile.SimpleUploadedFile('test.txt', '0123456789', 'text/plain'))
+
+    def test_serve(self):
+        response = storage.serve(self.factory.get('/'), self.name)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/plain')
+        self.assertEqual(response['Content-Length'], '10')
+        self.assertEqual(''.join(response), '0123456789')
+
+    def test_partial_content(self):
+        response = storage.serve(self.factory.get('/', HTTP_RANGE='bytes=2-4'), self.name)
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 2-4/10')
+        self.assertEqual(response['Content-Length'], '3')
+        self.assertEqual(''.join(response), '234')
+
+        response = storage.serve(self.factory.get('/', HTTP_RANGE='bytes=-3'), self.name)
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(''.join(response), '789')
+
+        response = storage.serve(self.factory.get('/', HTTP_RANGE='bytes=10-'), self.name)
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], 'bytes */10')
+
+    def test_if_range(self):
+        etag = storage.serve(self.factory.get('/'), self.name)['ETag']
+
+        response = storage.serve(self.factory.get('/', HTTP_RANGE='bytes=2-4', HTTP_IF_RANGE=etag), self.name)
+        self.assertEqual(response.status_code, 206)
+
+        # Whole file is served if it has changed
+        response = storage.serve(self.factory.get('/', HTTP_RANGE='bytes=2-4', HTTP_IF_RANGE='"other"'), self.name)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(''.join(response), '0123456789')
+
+    def test_not_modified(self):
+        response = storage.serve(self.factory.get('/'), self.name)
+        etag = response['ETag']
+        last_modified = response['Last-Modified']
+
+        response = storage.serve(self.factory.get('/', HTTP_IF_NONE_MATCH=etag), self.name)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+        response = storage.serve(self.factory.get('/', HTTP_IF_NONE_MATCH='"other"'), self.name)
+        self.assertEqual(response.status_code, 200)
+
+        response = storage.serve(self.factory.get('/', HTTP_IF_MODIFIED_SINCE=last_modified), self.name)
+        self.assertEqual(response.status_code, 304)
+
+class DiskCacheTest(test_runner.MongoEngineTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        self.disk_cache = storage.DiskCache(self.directory, 25)
+
+    def add(self, content):
+        name = django_storage.default_storage.save('', uploadedfile.SimpleUploadedFile('test.txt', content, 'text/plain'))
+        grid_id = django_storage.default_storage.stat(name).grid_id
+        return grid_id, self.disk_cache.add(grid_id, django_storage.default_storage.open_gridout(name))
+
+    def test_add(self):
+        grid_id, path = self.add('0123456789')
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), '0123456789')
+        self.assertEqual(self.disk_cache.get(grid_id), path)
+        self.assertEqual(self.disk_cache.get('missing'), None)
+
+        # Temporary files are gone
+        self.assertEqual(os.listdir(self.directory), [os.path.basename(path)])
+
+    def test_too_large(self):
+        grid_id, path = self.add('x' * 26)
+        self.assertEqual(path, None)
+        self.assertEqual(self.disk_cache.get(grid_id), None)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_cull(self):
+        grid_id_a, path_a = self.add('a' * 10)
+        grid_id_b, path_b = self.add('b' * 10)
+        os.utime(path_a, (1000, 1000))
+        os.utime(path_b, (2000, 2000))
+
+        # File used last is kept
+        self.disk_cache.get(grid_id_a)
+        grid_id_c, path_c = self.add('c' * 10)
+
+        self.assertEqual(self.disk_cache.get(grid_id_b), None)
+        self.assertEqual(self.disk_cache.get(grid_id_a), path_a)
+        self.assertEqual(self.disk_cache.get(grid_id_c), path_c)
+        self.assertEqual(self.disk_cache._size, 20)
+
+    def test_size(self):
+        grid_id_a, path_a = self.add('a' * 10)
+        grid_id_b, path_b = self.add('b' * 10)
+        self.assertEqual(self.disk_cache._size, 20)
+
+        self.disk_cache.delete(grid_id_b)
+        self.assertFalse(os.path.exists(path_b))
+        self.assertEqual(self.disk_cache._size, 10)
+        self.disk_cache.delete(grid_id_b)
+        self.assertEqual(self.disk_cache._size, 10)
+
+        # Another process removes a file, so tracked size is too large until the next scan
+        grid_id_b, path_b = self.add('b' * 10)
+        os.remove(path_a)
+        grid_id_c, path_c = self.add('c' * 10)
+
+        self.assertEqual(self.disk_cache._size, 20)
+        self.assertTrue(os.path.exists(path_b))
+        self.assertTrue(os.path.exists(path_c))
+
+    def test_existing_files(self):
+        with open(os.path.join(self.directory, 'existing'), 'wb') as f:
+            f.write('x' * 20)
+        os.utime(os.path.join(self.directory, 'existing'), (1000, 1000))
+        with open(os.path.join(self.directory, storage.DISK_CACHE_TEMP_PREFIX + 'partial'), 'wb') as f:
+            f.write('x' * 20)
+
+        # Directory is scanned on the first add, ignoring temporary files
+        self.add('a' * 10)
+        self.assertEqual(self.disk_cache._size, 10)
+        self.assertEqual(sorted(os.listdir(self.directory))[0], storage.DISK_CACHE_TEMP_PREFIX + 'partial')
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'existing')))
+
+    def test_storage_delete(self):
+        with utils.override_settings(GRIDFS_DISK_CACHE_DIR=self.directory):
+            gridfs_storage = storage.GridFSStorage()
+
+        name = gridfs_storage.save('', uploadedfile.SimpleUploadedFile('test.txt', 'content', 'text/plain'))
+        path = gridfs_storage.local_path(name)
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(gridfs_storage.local_path(name), path)
+
+        gridfs_storage.delete(name)
+        self.assertFalse(os.path.exists(path))
+
+class DiskCacheServeTest(test_runner.MongoEngineTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        self.factory = client.RequestFactory()
+        self.name = django_storage.default_storage.save('', uploadedfile.SimpleUploadedFile('test.txt', '0123456789', 'text/plain'))
+
+    def serve(self, request, **kwargs):
+        with utils.override_settings(GRIDFS_DISK_CACHE_DIR=self.directory, **kwargs):
+            # Default storage is recreated with the disk cache
+            django_storage.default_storage._wrapped = functional.empty
+            try:
+                return storage.serve(request, self.name)
+            finally:
+                django_storage.default_storage._wrapped = functional.empty
+
+    def test_serve(self):
+        response = self.serve(self.factory.get('/'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(''.join(response), '0123456789')
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+        response = self.serve(self.factory.get('/', HTTP_RANGE='bytes=2-4'))
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(''.join(response), '234')
+
+    def test_sendfile(self):
+        response = self.serve(self.factory.get('/'), GRIDFS_DISK_CACHE_SENDFILE_HEADER='X-Sendfile')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, '')
+        path = response['X-Sendfile']
+        self.assertEqual(os.path.dirname(path), self.directory)
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), '0123456789')
+        self.assertTrue(response.has_header('ETag'))
+        self.assertTrue(response.has_header('Last-Modified'))
+
+        response = self.serve(self.factory.get('/'), GRIDFS_DISK_CACHE_SENDFILE_HEADER='X-Accel-Redirect', GRIDFS_DISK_CACHE_SENDFILE_PREFIX='/protected/')
+        self.assertEqual(response['X-Accel-Redirect'], '/protected/%s' % os.path.basename(path))
+
+    @utils.override_settings(GRIDFS_DISK_CACHE_MAX_SIZE=5)
+    def test_too_large(self):
+        # File is served from GridFS and not by the web server
+        response = self.serve(self.factory.get('/'), GRIDFS_DISK_CACHE_SENDFILE_HEADER='X-Sendfile')
+        self.assertFalse(response.has_header('X-Sendfile'))
+        self.assertEqual(''.join(response), '0123456789')
+        self.assertEqual(os.listdir(self.directory), [])
+
+@utils.override_settings(GRIDFS_DEDUPLICATION=True, GRIDFS_DISK_CACHE_DIR=None)
+class DeduplicationTest(test_runner.MongoEngineTestCase):
+    def setUp(self):
+        self.storage = storage.GridFSStorage()
+
+    def test_delete(self):
+        name1 = self.storage.save('', uploadedfile.SimpleUploadedFile('test1.txt', 'content', 'text/plain'))
+        name2 = self.storage.save('', uploadedfile.SimpleUploadedFile('test2.txt', 'content', 'text/plain'))
+        other = self.storage.save('', uploadedfile.SimpleUploadedFile('test3.txt', 'other content', 'text/plain'))
+
+        self.assertEqual(name1, name2)
+        self.assertNotEqual(name1, other)
+
+        # File is kept while it is still referenced
+        self.storage.delete(name1)
+        self.assertTrue(self.storage.exists(name1))
+        self.assertEqual(self.storage.open_gridout(name1).read(), 'content')
+
+        self.storage.delete(name2)
+        self.assertFalse(self.storage.exists(name1))
+        self.assertTrue(self.storage.exists(other))
+
+        # File is stored anew after it has been deleted
+        name3 = self.storage.save('', uploadedfile.SimpleUploadedFile('test4.txt', 'content', 'text/plain'))
+        self.assertNotEqual(name3, name1)
+        self.assertEqual(self.storage.open_gridout(name3).read(), 'content')
+
+class UploadHandlerTest(test_runner.MongoEngineTestCase):
+    def count_files(self):
+        db, collection_name = django_storage.default_storage._get_gridfs_database()
+        return db[collection_name].files.count(), db[collection_name].chunks.count()
+
+    def new_file(self, handler, file_name):
+        # Other handlers are not given the file
+        self.assertRaises(django_uploadhandler.StopFutureHandlers, handler.new_file, 'file', file_name, 'text/plain', None)
+
+    def test_upload(self):
+        handler = uploadhandler.GridFSUploadHandler()
+
+        self.new_file(handler, 'test.txt')
+        self.assertEqual(handler.receive_data_chunk('01234', 0), None)
+        self.assertEqual(handler.receive_data_chunk('56789', 5), None)
+        uploaded_file = handler.file_complete(10)
+        handler.upload_complete()
+
+        self.assertTrue(isinstance(uploaded_file, storage.GridFSUploadedFile))
+        self.assertEqual(uploaded_file.name, 'test.txt')
+        self.assertEqual(uploaded_file.size, 10)
+        self.assertEqual(handler.stored_names, [uploaded_file.stored_name])
+        self.assertEqual(django_storage.default_storage.open_gridout(uploaded_file.stored_name).read(), '0123456789')
+
+        # File is not stored again
+        files = self.count_files()
+        self.assertEqual(django_storage.default_storage.save('', uploaded_file), uploaded_file.stored_name)
+        self.assertEqual(self.count_files(), files)
+
+    @utils.override_settings(GRIDFS_UPLOAD_MAX_SIZE=8)
+    def test_size_exceeded(self):
+        files = self.count_files()
+        handler = uploadhandler.GridFSUploadHandler()
+
+        self.new_file(handler, 'test.txt')
+        handler.receive_data_chunk('01234', 0)
+        self.assertRaises(django_uploadhandler.StopUpload, handler.receive_data_chunk, '56789', 5)
+        handler.upload_complete()
+
+        self.assertTrue(handler.size_exceeded)
+        self.assertEqual(handler.stored_names, [])
+        self.assertEqual(self.count_files(), files)
+
+    def test_delete_unpersisted(self):
+        files = self.count_files()
+        handler = uploadhandler.GridFSUploadHandler()
+
+        self.new_file(handler, 'test1.txt')
+        handler.receive_data_chunk('content', 0)
+        persisted = handler.file_complete(7).stored_name
+
+        self.new_file(handler, 'test2.txt')
+        handler.receive_data_chunk('content', 0)
+        handler.file_complete(7)
+
+        # Parsing fails in the middle of the third file, without upload_complete being called
+        self.new_file(handler, 'test3.txt')
+        handler.receive_data_chunk('x' * (512 * 1024), 0)
+
+        handler.mark_persisted([persisted])
+        handler.delete_unpersisted()
+
+        self.assertEqual(handler.upload, None)
+        self.assertTrue(django_storage.default_storage.exists(persisted))
+        self.assertEqual(self.count_files(), (files[0] + 1, files[1] + 1))
@@ -0,0 +1,90 @@
+from django.conf import settings
+from django.core.files import storage, uploadhandler
+
+from piplmesh.utils import storage as gridfs_storage
+
+class GridFSUploadHandler(uploadhandler.FileUploadHandler):
+    """
+    Upload handler which streams uploaded files directly into GridFS of the
+    default storage (which has to be :class:`piplmesh.utils.storage.GridFSStorage`)
+    while the request body is being read, without buffering them first.
+
+    Upload is stopped as soon as a file exceeds ``GRIDFS_UPLOAD_MAX_SIZE`` bytes,
+    which is then signaled through ``size_exceeded``.
+
+    Completed files are stored permanently, so the handler should be installed
+    only by views which store uploads, and they should mark files they keep with
+    :meth:`mark_persisted` and remove others with :meth:`delete_unpersisted`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(GridFSUploadHandler, self).__init__(*args, **kwargs)
+
+        self.max_size = getattr(settings, 'GRIDFS_UPLOAD_MAX_SIZE', None)
+        self.upload = None
+        self.size_exceeded = False
+        self.stored_names = []
+        self.persisted_names = set()
+
+    def _abort_upload(self):
+        if self.upload is not None:
+            self.upload.abort()
+            self.upload = None
+
+    def _stop_upload(self):
+        self._abort_upload()
+        self.size_exceeded = True
+
+        raise uploadhandler.StopUpload(connection_reset=True)
+
+    def new_file(self, field_name, file_name, content_type, content_length, charset=None):
+        super(GridFSUploadHandler, self).new_file(field_name, file_name, content_type, content_length, charset)
+
+        if self.max_size is not None and content_length is not None and content_length > self.max_size:
+            self._stop_upload()
+
+        # We let storage decide a name
+        self.upload = storage.default_storage.new_upload(storage.default_storage.get_available_name(''), content_type)
+
+        # Other handlers would not receive any data, so they should not prepare for it
+        raise uploadhandler.StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data, start):
+        if self.max_size is not None and self.upload.size + len(raw_data) > self.max_size:
+            self._stop_upload()
+
+        self.upload.write(raw_data)
+
+        # Data is not passed to other handlers
+        return None
+
+    def file_complete(self, file_size):
+        stored_name = self.upload.close()
+        self.upload = None
+        self.stored_names.append(stored_name)
+
+        return gridfs_storage.GridFSUploadedFile(storage.default_storage, stored_name, self.file_name, self.content_type, file_size, self.charset)
+
+    def upload_complete(self):
+        # Removes a partially written file if parsing was interrupted
+        self._abort_upload()
+
+    def mark_persisted(self, names):
+        """
+        Marks stored files as used, so that they are not deleted by :meth:`delete_unpersisted`.
+        """
+
+        self.persisted_names.update(names)
+
+    def delete_unpersisted(self):
+        """
+        Deletes stored files which have not been marked as persisted, and
+        a partially written file if parsing failed without completing the upload.
+        """
+
+        self._abort_upload()
+
+        for name in self.stored_names:
+            if name not in self.persisted_names:
+                storage.default_storage.delete(name)
+        self.stored_names = []